@@ -22,6 +22,7 @@
 
 import sgtk
 import nuke
+from sgtk.platform.qt import QtCore
 
 
 class TkNukeReadStatus(sgtk.platform.Application):
@@ -34,7 +35,11 @@ class TkNukeReadStatus(sgtk.platform.Application):
         Initialize the app.
         """
         tk_nuke_readstatus = self.import_module("tk_nuke_readstatus")
-        self.handler = tk_nuke_readstatus.ReadStatus(self)
+
+        # Without a GUI, e.g. in nuke -t or on the farm, nothing is checked
+        # automatically and validate() is the way to get the statuses
+        self._ui = bool(nuke.GUI)
+        self.handler = tk_nuke_readstatus.ReadStatus(self, ui=self._ui)
 
         self.engine.register_command(
             "Check all nodes",
@@ -45,6 +50,15 @@ class TkNukeReadStatus(sgtk.platform.Application):
                 "context": self.context,
             },
         )
+        self.engine.register_command(
+            "Force check all nodes",
+            lambda: self.check_script(force=True),
+            {
+                "short_name": "force_check_script",
+                "icon": "Refresh.png",
+                "context": self.context,
+            },
+        )
         self.engine.register_command(
             "Version up",
             lambda: self.version_up_node(),
@@ -83,27 +97,98 @@ class TkNukeReadStatus(sgtk.platform.Application):
             },
         )
 
-        self._script_is_loading = True
-        self._register_nuke_callbacks()
+        self.engine.register_command(
+            "Switch script from work to published",
+            lambda: self.script_to_publish(),
+            {"short_name": "script_to_pub", "icon": "LoadParent.png"},
+        )
+
+        self._panel_id = self.engine.register_panel(self.show_panel)
+        self.engine.register_command(
+            "Read Status panel",
+            lambda: self.show_panel(),
+            {"short_name": "readstatus_panel", "icon": "Info.png"},
+        )
+        self.engine.register_command(
+            "Read Status diagnostics",
+            lambda: self.show_diagnostics(),
+            {"short_name": "readstatus_diagnostics", "icon": "Info.png"},
+        )
+
+        self._created_nodes = tk_nuke_readstatus.CoalescingScheduler(
+            self.check_nodes, self.get_setting("node_created_delay", 250)
+        )
+        self._edited_nodes = tk_nuke_readstatus.CoalescingScheduler(
+            self.check_nodes,
+            self.get_setting("knob_changed_delay", 500),
+            debounce=True,
+        )
+
+        # Check a script which was open before the app started, e.g. after a
+        # context switch, once control returns to the event loop
+        self._startup_check = QtCore.QTimer()
+        self._startup_check.setSingleShot(True)
+        self._startup_check.timeout.connect(
+            lambda: self.check_script(revalidate=False)
+        )
+
+        self._script_is_loading = not nuke.allNodes()
+        if self._ui:
+            if not self._script_is_loading:
+                self._startup_check.start(0)
+            self._register_nuke_callbacks()
 
     def destroy_app(self):
-        nuke.removeOnCreate(self._on_node_created)
-        nuke.removeOnScriptLoad(self._on_script_load)
-        nuke.removeOnScriptClose(self._on_script_close)
+        self._startup_check.stop()
+        self._created_nodes.cancel()
+        self._edited_nodes.cancel()
+        self.handler.destroy()
+        if self._ui:
+            nuke.removeOnCreate(self._on_node_created)
+            nuke.removeKnobChanged(self._on_knob_changed)
+            nuke.removeOnScriptLoad(self._on_script_load)
+            nuke.removeOnScriptClose(self._on_script_close)
 
     def check_this_node(self):
         self.check_node(nuke.thisNode())
 
-    def check_script(self):
-        """Check the read nodes in the currently open script"""
-        self.handler.update_breakdown()
-        self.handler.check_script()
+    def check_script(self, revalidate=True, force=False):
+        """
+        Check the read nodes in the currently open script, only the ones whose
+        file path changed unless forced
+        """
+        self.handler.refresh(revalidate, force)
+
+    def validate(self, nodes=None, check_disk=None, problems_only=False):
+        """
+        Get the status of the file nodes in the script, e.g. from a submission
+        hook. See ReadStatus.validate for the arguments and records.
+        """
+        return self.handler.validate(nodes, check_disk, problems_only)
+
+    def invalidate_latest_cache(self):
+        """Forget the cached latest versions, e.g. from a post publish hook"""
+        self.handler.invalidate_latest()
 
     def check_node(self, node):
         """Update a node's icon in the script"""
-        if self.handler.is_read_node(node):
-            self.handler.update_breakdown()
-            self.handler.check_node(node)
+        self.check_nodes([node])
+
+    def check_nodes(self, nodes):
+        """Update the icons of a batch of nodes in the script"""
+        read_nodes = []
+        for node in nodes:
+            try:
+                if self.handler.is_read_node(node):
+                    read_nodes.append(node)
+            except ValueError:
+                # The node was deleted before it could be checked
+                continue
+
+        if read_nodes:
+            self.handler.forget_nodes(read_nodes)
+            self.handler.update_breakdown(read_nodes)
+            self.handler.check_nodes(read_nodes)
 
     def version_up_node(self):
         """Version up the currently selected read node"""
@@ -125,24 +210,59 @@ class TkNukeReadStatus(sgtk.platform.Application):
         """Version up the currently selected read node"""
         self.handler.node_to_work()
 
+    def script_to_publish(self):
+        """Switch all work paths in the script to publish, after confirming"""
+        self.handler.confirm_script_to_publish()
+
+    def show_panel(self):
+        """Show the panel listing the status of every file node"""
+        return self.handler.show_panel(self._panel_id)
+
+    def show_diagnostics(self):
+        """Show where the time went since the app started"""
+        summary = self.handler.diagnostics()
+        self.logger.info(summary)
+        nuke.message(summary)
+
     def _register_nuke_callbacks(self):
         """Register callbacks used by the app."""
         nuke.addOnCreate(self._on_node_created)
+        nuke.addKnobChanged(self._on_knob_changed)
         nuke.addOnScriptLoad(self._on_script_load)
         nuke.addOnScriptClose(self._on_script_close)
 
     def _on_node_created(self):
-        """Handle node creation after the script has finished loading."""
+        """Queue created nodes after the script has finished loading."""
         if self._script_is_loading:
             return
 
-        self.check_this_node()
+        node = nuke.thisNode()
+        self.handler.forget_nodes([node])
+        self._created_nodes.add(node)
+
+    def _on_knob_changed(self):
+        """Queue nodes whose file knob was edited, once the edits settle."""
+        if self._script_is_loading:
+            return
+
+        knob = nuke.thisKnob()
+        if knob is None:
+            return
+        node = nuke.thisNode()
+        if node is not None and self.handler.is_file_knob(node, knob):
+            self.handler.forget_nodes([node])
+            self._edited_nodes.add(node)
 
     def _on_script_load(self):
         """Mark the end of script loading and refresh the read nodes."""
         self._script_is_loading = False
-        self.check_script()
+        self._startup_check.stop()
+        self.check_script(revalidate=False)
 
     def _on_script_close(self):
         """Mark the script as loading before a new file is opened."""
         self._script_is_loading = True
+        self._startup_check.stop()
+        self._created_nodes.cancel()
+        self._edited_nodes.cancel()
+        self.handler.reset()
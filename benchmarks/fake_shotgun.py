@@ -0,0 +1,198 @@
+# MIT License
+
+# Copyright (c) 2025 MaximumFX
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""In-memory stand-in for a shotgun_api3 connection which counts its queries"""
+
+from __future__ import annotations
+
+import copy
+import threading
+import time
+from typing import Callable
+from xmlrpc.client import ProtocolError
+
+
+def _key(value):
+    """Get a hashable value, entities compare by type and id"""
+    if isinstance(value, dict):
+        return value.get("type"), value.get("id")
+    if isinstance(value, list):
+        return tuple(_key(item) for item in value)
+    return value
+
+
+def _is_filters(filter_) -> list | None:
+    """Get the fields and values of a group of only "is" filters"""
+    if not isinstance(filter_, dict) or filter_.get("filter_operator") in (
+        "any",
+        "or",
+    ):
+        return None
+    if not all(
+        isinstance(sub, list) and sub[1] == "is" for sub in filter_["filters"]
+    ):
+        return None
+    return sorted((sub[0], _key(sub[2])) for sub in filter_["filters"])
+
+
+def _compile(filter_) -> Callable[[dict], bool]:
+    """Turn a filter into a predicate on records"""
+    if isinstance(filter_, dict):
+        filters = filter_["filters"]
+        if filter_.get("filter_operator") not in ("any", "or"):
+            predicates = [_compile(sub) for sub in filters]
+            return lambda record: all(predicate(record) for predicate in predicates)
+
+        # Any of several groups of "is" filters on the same fields is a lookup
+        groups = [_is_filters(sub) for sub in filters]
+        if groups and all(groups):
+            fields = [field for field, _ in groups[0]]
+            if all([field for field, _ in group] == fields for group in groups):
+                keys = {tuple(value for _, value in group) for group in groups}
+                return lambda record: (
+                    tuple(_key(record.get(field)) for field in fields) in keys
+                )
+
+        predicates = [_compile(sub) for sub in filters]
+        return lambda record: any(predicate(record) for predicate in predicates)
+
+    field, operator, *values = filter_
+    if operator == "is":
+        key = _key(values[0])
+        return lambda record: _key(record.get(field)) == key
+    if operator == "is_not":
+        key = _key(values[0])
+        return lambda record: _key(record.get(field)) != key
+    if operator == "in":
+        candidates = values[0] if len(values) == 1 else values
+        keys = {_key(candidate) for candidate in candidates}
+        return lambda record: _key(record.get(field)) in keys
+    if operator == "greater_than":
+        return lambda record: (
+            record.get(field) is not None and record.get(field) > values[0]
+        )
+    if operator == "less_than":
+        return lambda record: (
+            record.get(field) is not None and record.get(field) < values[0]
+        )
+    raise NotImplementedError(f"Unsupported filter operator {operator}")
+
+
+def _select(record: dict, fields: list | None) -> dict:
+    """Keep the requested fields, like ShotGrid does"""
+    if fields is None:
+        return record
+    return {
+        field: record.get(field) for field in ["type", "id"] + list(fields)
+    }
+
+
+class FakeShotgun:
+    """Answer find calls from a list of records and count them"""
+
+    def __init__(
+        self, records: dict[str, list[dict]] | None = None, latency: float = 0.0
+    ):
+        """
+        Args:
+            records (dict): Records per entity type
+            latency (float): Seconds every query takes on top of the lookup
+        """
+        self.records = records or {}
+        self.latency = latency
+        self.find_count = 0
+        self.throttled_count = 0
+        self.elapsed = 0.0
+        self.queries = []
+        self._throttle = 0
+        self._retry_after = None
+        self._lock = threading.Lock()
+
+    def reset_counts(self):
+        self.find_count = 0
+        self.throttled_count = 0
+        self.elapsed = 0.0
+        self.queries = []
+
+    def throttle(self, count: int, retry_after: float | None = None):
+        """
+        Answer the next finds with HTTP 429, like a site over its rate limit
+
+        Args:
+            count (int): Number of finds to reject
+            retry_after (float | None): Seconds sent in the Retry-After header
+        """
+        with self._lock:
+            self._throttle = count
+            self._retry_after = retry_after
+
+    def add(self, entity_type: str, record: dict):
+        self.records.setdefault(entity_type, []).append(record)
+
+    def find(
+        self,
+        entity_type,
+        filters,
+        fields=None,
+        order=None,
+        filter_operator=None,
+        limit=0,
+        **kwargs,
+    ):
+        start = time.perf_counter()
+        with self._lock:
+            self.find_count += 1
+            self.queries.append((entity_type, filters))
+            throttled = self._throttle > 0
+            if throttled:
+                self._throttle -= 1
+                self.throttled_count += 1
+        if self.latency:
+            time.sleep(self.latency)
+        if throttled:
+            headers = {}
+            if self._retry_after is not None:
+                headers["Retry-After"] = str(self._retry_after)
+            with self._lock:
+                self.elapsed += time.perf_counter() - start
+            raise ProtocolError("fake-shotgun", 429, "Too Many Requests", headers)
+
+        matches = _compile(
+            {"filter_operator": filter_operator or "all", "filters": filters}
+        )
+        results = [
+            copy.deepcopy(_select(record, fields))
+            for record in self.records.get(entity_type, [])
+            if matches(record)
+        ]
+        for sort in reversed(order or []):
+            results.sort(
+                key=lambda record: record.get(sort["field_name"]) or 0,
+                reverse=sort.get("direction") == "desc",
+            )
+        with self._lock:
+            self.elapsed += time.perf_counter() - start
+        return results[:limit] if limit else results
+
+    def find_one(self, entity_type, filters, fields=None, order=None, **kwargs):
+        results = self.find(entity_type, filters, fields, order, limit=1, **kwargs)
+        return results[0] if results else None
@@ -0,0 +1,412 @@
+# MIT License
+
+# Copyright (c) 2025 MaximumFX
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Benchmark the app against synthetic scripts, with stand-in nuke and sgtk modules
+
+Usage:
+    python benchmarks/run.py --nodes 1000 10000 50000 --latency 0.05
+
+For every script size this measures the app starting up, the script loading,
+reopening it, "Check all nodes" on the unchanged script, "Force check all
+nodes", the same in slices, polling for new publishes, pasting nodes, editing
+file knobs by hand, versioning up every file node, switching the script from
+work to publish, validating the script without a GUI with and without the cached
+latest versions, checking all nodes and scanning the whole scene while ShotGrid
+throttles and restarting the app in the open script. It reports the wall time,
+the time until the first icon, the time until the background work settled, the
+longest slice, ShotGrid queries, time spent in ShotGrid, setCustomIcon calls,
+peak memory and the size of the breakdown index of each. Tracing memory slows
+everything down, use --no-memory for the plain wall time.
+
+Starting the app without a script must stay under the startup target without
+scanning the scene or querying ShotGrid, otherwise the run exits with 1.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+
+BENCHMARKS = os.path.dirname(os.path.abspath(__file__))
+REPOSITORY = os.path.dirname(BENCHMARKS)
+sys.path[:0] = [
+    os.path.join(BENCHMARKS, "stubs"),
+    BENCHMARKS,
+    os.path.join(REPOSITORY, "python"),
+    REPOSITORY,
+]
+
+import nuke  # noqa: E402
+from sgtk.platform import qt  # noqa: E402
+from sgtk.platform.qt import QtCore  # noqa: E402
+
+import app as app_module  # noqa: E402
+import tk_nuke_readstatus  # noqa: E402, F401  Imported once, not part of startup
+from scene import SETTINGS, World  # noqa: E402
+
+# Seconds the app may take to start without a script
+STARTUP_TARGET = 0.05
+
+# Name, width and format of the printed columns
+COLUMNS = (
+    ("nodes", 7, ""),
+    ("scenario", 14, ""),
+    ("wall_s", 9, ".3f"),
+    ("first_s", 8, ".3f"),
+    ("settled_s", 9, ".3f"),
+    ("block_s", 8, ".3f"),
+    ("sg_queries", 10, ""),
+    ("sg_s", 8, ".3f"),
+    ("scans", 5, ""),
+    ("set_icon", 8, ""),
+    ("clear_icon", 10, ""),
+    ("peak_mb", 8, ".1f"),
+    ("index_mb", 8, ".2f"),
+)
+
+
+def settle(app=None):
+    """
+    Run the work deferred to timers, wait for the app's worker threads and run
+    the calls they handed to the main thread
+
+    Args:
+        app (TkNukeReadStatus | None): App whose background refresh to wait for
+    """
+    while True:
+        qt.fire_single_shot_timers()
+        workers = [
+            thread
+            for thread in threading.enumerate()
+            if thread.name.startswith("tk-nuke-readstatus-")
+        ]
+        for thread in workers:
+            thread.join()
+        if app is not None:
+            app.handler.background_refresh.wait()
+        if not nuke.run_main_thread_calls() and not workers:
+            return
+
+
+def measure(world: World, call, memory: bool, state: dict) -> dict:
+    """
+    Run a scenario, the wall time stops when control returns to Nuke and the
+    settled time when the work deferred to timers and worker threads is done,
+    the counts include both
+
+    Args:
+        world (World): Synthetic script
+        call (Callable): Scenario
+        memory (bool): Trace the peak memory
+        state (dict): Holds the app once it started
+
+    Returns:
+        dict: Measurements
+    """
+    nuke.reset_calls()
+    world.shotgun.reset_counts()
+    scans = world.manager.scans
+    gc.collect()
+
+    if memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    call()
+    QtCore.QCoreApplication.processEvents()
+    wall = time.perf_counter() - start
+    first_icon = None
+    if nuke.first_icon is not None:
+        first_icon = nuke.first_icon - start
+    settle(state.get("app"))
+    settled = time.perf_counter() - start
+    peak = None
+    if memory:
+        peak = tracemalloc.get_traced_memory()[1] / 1024**2
+        tracemalloc.stop()
+
+    return {
+        "wall_s": wall,
+        "first_s": first_icon,
+        "settled_s": settled,
+        "sg_queries": world.shotgun.find_count,
+        "sg_s": world.shotgun.elapsed,
+        "scans": world.manager.scans - scans,
+        "set_icon": nuke.calls["setCustomIcon"],
+        "clear_icon": nuke.calls["clearCustomIcon"],
+        "peak_mb": peak,
+    }
+
+
+def run(
+    node_count: int,
+    latency: float,
+    memory: bool,
+    settings: dict,
+    paste_count: int,
+    edit_count: int,
+    throttle_count: int,
+    seed: int,
+) -> list[dict]:
+    """
+    Run all scenarios on a synthetic script
+
+    Returns:
+        list[dict]: Measurements per scenario
+    """
+    world = World(node_count, latency, seed)
+    nuke.close_script()
+    cache_location = tempfile.TemporaryDirectory()
+    state = {}
+
+    def startup():
+        state["app"] = app_module.TkNukeReadStatus(
+            world.engine, settings, cache_location.name
+        )
+
+    def poll():
+        world.publish(max(1, len(world.shots)))
+        state["app"].handler.poller.poll_now()
+
+    def restart():
+        state["app"].destroy_app()
+        startup()
+
+    def paste():
+        nuke.paste(world.new_nodes(paste_count))
+
+    def edit():
+        nodes = [
+            node
+            for node in nuke.allNodes(recurseGroups=True)
+            if node.knob("file") is not None
+        ]
+        for node, other in zip(nodes[:edit_count], reversed(nodes)):
+            # Typed in two goes, only the settled path is checked
+            file_path = other["file"].value()
+            nuke.edit_knob(node, "file", file_path[: len(file_path) // 2])
+            nuke.edit_knob(node, "file", file_path)
+
+    def version_up():
+        nuke.select(
+            [
+                node
+                for node in nuke.allNodes(recurseGroups=True)
+                if node.knob("file") is not None
+            ]
+        )
+        world.engine.commands["Version up"]()
+
+    def validate(cache: bool):
+        # A fresh app in terminal Nuke, with or without the latest versions the
+        # GUI session cached on this machine. It registers its commands on the
+        # same engine, the GUI app keeps its own
+        commands = dict(world.engine.commands)
+        nuke.GUI = False
+        try:
+            terminal_app = app_module.TkNukeReadStatus(
+                world.engine, settings, cache_location.name if cache else ""
+            )
+            terminal_app.validate()
+            terminal_app.destroy_app()
+        finally:
+            nuke.GUI = True
+            world.engine.commands = commands
+
+    def switch_all():
+        world.engine.commands["Switch script from work to published"]()
+
+    def sliced():
+        # Forced check in slices, the wall time covers all of them
+        sliced_setting = settings.get("sliced_refresh")
+        settings["sliced_refresh"] = True
+        try:
+            handler = state["app"].handler
+            world.engine.commands["Force check all nodes"]()
+            longest = 0.0
+            while True:
+                # The first turn checks the rest after the nodes in view
+                start = time.perf_counter()
+                QtCore.QCoreApplication.processEvents()
+                longest = max(longest, time.perf_counter() - start)
+                if not handler.sliced_refresh.active:
+                    break
+            state["block_s"] = longest
+        finally:
+            settings["sliced_refresh"] = sliced_setting
+
+    def throttled():
+        # ShotGrid rejects the first queries, they're retried after Retry-After
+        world.shotgun.throttle(throttle_count, retry_after=0.01)
+        world.engine.commands["Check all nodes"]()
+
+    def throttled_scan():
+        # The same while the whole scene is scanned, without the nodes in view
+        previous = dict(settings)
+        settings["prioritize_viewer"] = False
+        try:
+            world.shotgun.throttle(throttle_count, retry_after=0.01)
+            world.engine.commands["Force check all nodes"]()
+        finally:
+            settings.clear()
+            settings.update(previous)
+
+    scenarios = [
+        ("startup", startup),
+        ("load", lambda: nuke.load_script(world.nodes)),
+        ("reopen", lambda: nuke.load_script(world.nodes)),
+        ("check_all", lambda: world.engine.commands["Check all nodes"]()),
+        ("force_all", lambda: world.engine.commands["Force check all nodes"]()),
+        ("sliced", sliced),
+        ("poll", poll),
+        ("paste", paste),
+        ("edit", edit),
+        ("version_up", version_up),
+        ("switch_all", switch_all),
+        ("validate", lambda: validate(cache=True)),
+        ("validate_cold", lambda: validate(cache=False)),
+        ("throttled", throttled),
+        ("throttled_scan", throttled_scan),
+        ("restart", restart),
+    ]
+
+    results = []
+    for name, call in scenarios:
+        result = {"nodes": node_count, "scenario": name}
+        result.update(measure(world, call, memory, state))
+        result["index_mb"] = state["app"].handler.index_memory() / 1024**2
+        result["block_s"] = state.pop("block_s", None)
+        results.append(result)
+
+    state["app"].destroy_app()
+    nuke.close_script()
+    cache_location.cleanup()
+    return results
+
+
+def print_row(result: dict):
+    cells = []
+    for column, width, spec in COLUMNS:
+        value = result.get(column)
+        if value is None or isinstance(value, str):
+            value, spec = value or "-", ""
+        align = "<" if column == "scenario" else ">"
+        cells.append(f"{value:{align}{width}{spec}}")
+    print("  ".join(cells), flush=True)
+
+
+def parse_setting(text: str) -> tuple[str, object]:
+    key, _, value = text.partition("=")
+    try:
+        return key, json.loads(value)
+    except ValueError:
+        return key, value
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--nodes", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.0,
+        help="Seconds every ShotGrid query and breakdown scan takes",
+    )
+    parser.add_argument("--paste", type=int, default=100, help="Nodes to paste")
+    parser.add_argument(
+        "--edit", type=int, default=100, help="File knobs to edit by hand"
+    )
+    parser.add_argument(
+        "--throttle",
+        type=int,
+        default=3,
+        help="ShotGrid queries rejected as throttled in the throttled scenario",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--setting",
+        action="append",
+        default=[],
+        metavar="KEY=VALUE",
+        help="Override an app setting, the value is parsed as JSON if possible",
+    )
+    parser.add_argument(
+        "--startup-target",
+        type=float,
+        default=STARTUP_TARGET,
+        help="Seconds the app may take to start without a script",
+    )
+    parser.add_argument("--no-memory", action="store_true")
+    parser.add_argument("--json", help="Also write the results to this file")
+    args = parser.parse_args(argv)
+
+    settings = dict(SETTINGS)
+    settings.update(parse_setting(setting) for setting in args.setting)
+
+    print_row({column: column for column, _, _ in COLUMNS})
+    results = []
+    for node_count in args.nodes:
+        for result in run(
+            node_count,
+            args.latency,
+            not args.no_memory,
+            settings,
+            args.paste,
+            args.edit,
+            args.throttle,
+            args.seed,
+        ):
+            print_row(result)
+            results.append(result)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as json_file:
+            json.dump(results, json_file, indent=2)
+
+    missed = [
+        result
+        for result in results
+        if result["scenario"] == "startup"
+        and (
+            result["wall_s"] > args.startup_target
+            or result["scans"]
+            or result["sg_queries"]
+        )
+    ]
+    for result in missed:
+        print(
+            f"Startup with {result['nodes']} nodes missed the target of "
+            f"{args.startup_target:.3f}s without scans or queries",
+            file=sys.stderr,
+        )
+    return 1 if missed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,316 @@
+# MIT License
+
+# Copyright (c) 2025 MaximumFX
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Synthetic scripts and the ShotGrid data behind them"""
+
+from __future__ import annotations
+
+import copy
+import datetime
+import random
+import time
+
+import nuke
+import sgtk
+
+from fake_shotgun import FakeShotgun
+
+ROOT_PATH = "/proj"
+TEMPLATES = {
+    "nuke_shot_render_pub": "shots/{Shot}/publish/{name}/v{version}/{name}.%04d.exr",
+    "nuke_shot_render": "shots/{Shot}/work/{name}/v{version}/{name}.%04d.exr",
+    "shot_plate": "shots/{Shot}/plates/v{version}/plate.%04d.exr",
+    "shot_camera": "shots/{Shot}/publish/camera/v{version}/camera.abc",
+}
+RENDER_NAMES = ("comp", "bg", "fg", "fx", "matte")
+VERSIONS = 5
+
+SETTINGS = {
+    "question_on_missing": True,
+    "missing_icon": {"name": "out_of_pipe", "scale": 0.5, "offsetX": 84},
+    "icon_base_path": "/icons",
+    "statuses": [
+        {
+            "icon": {"name": "shot_publish_latest"},
+            "latest": True,
+            "template_match": ["nuke_shot_render_pub", "shot_camera"],
+        },
+        {
+            "icon": {"name": "shot_publish_outdated"},
+            "template_match": ["nuke_shot_render_pub", "shot_camera"],
+        },
+        {"icon": {"name": "shot_plate"}, "str_include": ["/plates/"]},
+        {"icon": {"name": "shot_work"}, "template_match": ["nuke_shot_render"]},
+    ],
+    "versionable": ["nuke_shot_render_pub", "nuke_shot_render", "shot_plate"],
+    "work_publish_mappings": [
+        {"work": "nuke_shot_render", "publish": "nuke_shot_render_pub"}
+    ],
+}
+
+# Share of the nodes per kind, the rest are nodes without a file
+DISTRIBUTION = (
+    ("published", 0.18),
+    ("plate", 0.05),
+    ("work", 0.04),
+    ("camera", 0.01),
+    ("out_of_pipe", 0.02),
+)
+OTHER_CLASSES = ("Merge2", "Grade", "Transform", "Blur", "Roto", "Dot", "NoOp")
+# Nodes per node tree, the Viewer looks at one of them
+TREE_SIZE = 50
+
+
+class BreakdownItem:
+    def __init__(self, path: str, sg_data: dict):
+        self.path = path
+        self.sg_data = sg_data
+        self.node_name = None
+        self.node_type = None
+        self.extra_data = None
+
+
+class BreakdownManager:
+    """Scan the open script for published files, like tk-multi-breakdown2"""
+
+    def __init__(self, tk: sgtk.Sgtk, latency: float = 0.0):
+        self.tk = tk
+        self.latency = latency
+        self.scans = 0
+
+    def scan_scene(self, extra_fields=None) -> list[BreakdownItem]:
+        self.scans += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+        paths = set()
+        for node in nuke.allNodes(recurseGroups=True):
+            for knob_name in ("file", "file_link"):
+                knob = node.knob(knob_name)
+                if knob is not None and knob.value():
+                    paths.add(knob.value())
+
+        publishes = sgtk.util.find_publish(
+            self.tk, sorted(paths), fields=extra_fields
+        )
+        return [BreakdownItem(path, publish) for path, publish in publishes.items()]
+
+    def get_latest_published_file(self, item, data_retriever=None) -> dict:
+        publishes = self.tk.shotgun.find(
+            "PublishedFile",
+            [
+                [field, "is", item.sg_data.get(field)]
+                for field in ("project", "entity", "task", "name")
+            ],
+            order=[{"field_name": "version_number", "direction": "desc"}],
+            limit=1,
+        )
+        return publishes[0] if publishes else {}
+
+
+class BreakdownApp:
+    def __init__(self, manager: BreakdownManager):
+        self.manager = manager
+
+    def create_breakdown_manager(self) -> BreakdownManager:
+        return self.manager
+
+
+class World:
+    """ShotGrid data, Toolkit instance and nodes of a synthetic script"""
+
+    def __init__(self, node_count: int, latency: float = 0.0, seed: int = 0):
+        """
+        Args:
+            node_count (int): Number of nodes in the script
+            latency (float): Seconds every ShotGrid query and scan takes
+            seed (int): Random seed, the same seed gives the same script
+        """
+        self.rng = random.Random(seed)
+        shot_count = max(1, node_count // 500)
+        self.shots = [f"sh{index * 10:04d}" for index in range(shot_count)]
+        self.templates = {
+            name: sgtk.TemplatePath(name, definition, ROOT_PATH)
+            for name, definition in TEMPLATES.items()
+        }
+        self.shotgun = FakeShotgun(latency=latency)
+        self.tk = sgtk.Sgtk(self.templates, self.shotgun)
+        self.__add_publishes()
+
+        self.manager = BreakdownManager(self.tk, latency)
+        self.engine = sgtk.platform.Engine(
+            self.tk, {"tk-multi-breakdown2": BreakdownApp(self.manager)}
+        )
+        self.count = 0
+        self.nodes = self.new_nodes(node_count)
+        self.nodes.append(self.__wire(self.nodes))
+
+    def __add_publishes(self):
+        yesterday = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(
+            days=1
+        )
+        publish_id = 0
+        for shot_index, shot in enumerate(self.shots):
+            entity = {"type": "Shot", "id": shot_index + 1}
+            elements = [(name, "nuke_shot_render_pub") for name in RENDER_NAMES]
+            elements += [("plate", "shot_plate"), ("camera", "shot_camera")]
+            for name, template_name in elements:
+                for version in range(1, VERSIONS + 1):
+                    publish_id += 1
+                    path = self.templates[template_name].apply_fields(
+                        {"Shot": shot, "name": name, "version": version}
+                    )
+                    self.shotgun.add(
+                        "PublishedFile",
+                        {
+                            "type": "PublishedFile",
+                            "id": publish_id,
+                            "code": path.rpartition("/")[2],
+                            "name": name,
+                            "path": {"local_path": path},
+                            "path_cache": path,
+                            "version_number": version,
+                            "created_at": yesterday,
+                            "project": {"type": "Project", "id": 1},
+                            "entity": entity,
+                            "task": {"type": "Task", "id": shot_index + 1},
+                            "published_file_type": {
+                                "type": "PublishedFileType",
+                                "id": 2 if template_name == "shot_plate" else 1,
+                            },
+                        },
+                    )
+
+    def publish(self, count: int) -> list[dict]:
+        """
+        Publish a new version of random published files
+
+        Args:
+            count (int): Number of new publishes
+
+        Returns:
+            list[dict]: New published files
+        """
+        records = self.shotgun.records["PublishedFile"]
+        latest = {}
+        for record in records:
+            key = (record["entity"]["id"], record["name"])
+            if record["version_number"] > latest.get(key, {}).get("version_number", 0):
+                latest[key] = record
+
+        publishes = []
+        for record in self.rng.sample(list(latest.values()), min(count, len(latest))):
+            publish = copy.deepcopy(record)
+            publish["id"] = len(records) + 1
+            publish["version_number"] += 1
+            publish["created_at"] = datetime.datetime.now(datetime.timezone.utc)
+            self.shotgun.add("PublishedFile", publish)
+            publishes.append(publish)
+        return publishes
+
+    def new_nodes(self, count: int) -> list:
+        """
+        Create nodes following the distribution of a comp script
+
+        Args:
+            count (int): Number of nodes
+
+        Returns:
+            list[nuke.Node]: Nodes with unique names
+        """
+        nodes = []
+        for _ in range(count):
+            nodes.append(self.__make_node(self.count))
+            self.count += 1
+        return nodes
+
+    def __wire(self, nodes: list):
+        """
+        Connect the top level nodes into trees and view one of them
+
+        Args:
+            nodes (list[nuke.Node]): Nodes
+
+        Returns:
+            nuke.Node: Viewer
+        """
+        top_level = [node for node in nodes if "." not in node.fullName()]
+        trees = [
+            top_level[start : start + TREE_SIZE]
+            for start in range(0, len(top_level), TREE_SIZE)
+        ]
+        for tree in trees:
+            for index, node in enumerate(tree[1:], 1):
+                if node.Class() in OTHER_CLASSES:
+                    node.setInput(0, tree[index - 1])
+                    node.setInput(1, tree[self.rng.randrange(index)])
+
+        viewer = nuke.Node("Viewer", "Viewer1")
+        if trees:
+            tree = self.rng.choice(trees)
+            outputs = [node for node in tree if node.Class() in OTHER_CLASSES]
+            viewer.setInput(0, (outputs or tree)[-1])
+        return viewer
+
+    def __make_node(self, index: int):
+        shot = self.rng.choice(self.shots)
+        version = self.rng.randint(1, VERSIONS)
+        render_name = self.rng.choice(RENDER_NAMES)
+        frames = {"first": 1001, "last": 1001 + self.rng.randint(0, 200)}
+
+        # Some nodes live in groups
+        name = f"Node{index}"
+        if self.rng.random() < 0.05:
+            name = f"Group{index % 50}.{name}"
+
+        kind = None
+        draw = self.rng.random()
+        for candidate, share in DISTRIBUTION:
+            if draw < share:
+                kind = candidate
+                break
+            draw -= share
+
+        if kind == "published":
+            file_path = self.templates["nuke_shot_render_pub"].apply_fields(
+                {"Shot": shot, "name": render_name, "version": version}
+            )
+            return nuke.Node("Read", name, dict(frames, file=file_path))
+        if kind == "plate":
+            file_path = self.templates["shot_plate"].apply_fields(
+                {"Shot": shot, "version": version}
+            )
+            return nuke.Node("Read", name, dict(frames, file=file_path))
+        if kind == "work":
+            file_path = self.templates["nuke_shot_render"].apply_fields(
+                {"Shot": shot, "name": render_name, "version": version}
+            )
+            return nuke.Node("Read", name, dict(frames, file=file_path))
+        if kind == "camera":
+            file_path = self.templates["shot_camera"].apply_fields(
+                {"Shot": shot, "version": version}
+            )
+            return nuke.Node("Camera2", name, {"file_link": file_path})
+        if kind == "out_of_pipe":
+            file_path = f"/mnt/downloads/reference_{self.rng.randint(0, 99)}.mov"
+            return nuke.Node("Read", name, dict(frames, file=file_path))
+        return nuke.Node(self.rng.choice(OTHER_CLASSES), name, {"mix": 1.0})
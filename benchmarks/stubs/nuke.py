@@ -0,0 +1,332 @@
+# MIT License
+
+# Copyright (c) 2025 MaximumFX
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Stand-in for the nuke module, holding the open script in memory"""
+
+from __future__ import annotations
+
+import queue
+import threading
+import time
+
+GUI = True
+INPUTS = 2
+HIDDEN_INPUTS = 4
+
+# Calls made to the node API, per method name
+calls = {"setCustomIcon": 0, "clearCustomIcon": 0}
+# perf_counter of the first setCustomIcon call since reset_calls
+first_icon = None
+messages = []
+
+_script_name = ""
+_nodes = {}
+_selected = []
+_this_node = None
+_this_knob = None
+_callbacks = {"create": [], "load": [], "close": [], "knob": []}
+_main_thread_calls = queue.Queue()
+
+
+class Knob:
+    def __init__(self, name: str, value=""):
+        self._name = name
+        self._value = value
+
+    def name(self) -> str:
+        return self._name
+
+    def value(self):
+        return self._value
+
+    def getValue(self):
+        return self._value
+
+    def setValue(self, value):
+        self._value = value
+
+
+class Node:
+    def __init__(self, node_class: str, name: str, knobs: dict | None = None):
+        self._class = node_class
+        self._name = name
+        self._knobs = {
+            knob_name: Knob(knob_name, value)
+            for knob_name, value in (knobs or {}).items()
+        }
+        self._inputs = []
+        self.icon = None
+
+    def Class(self) -> str:
+        return self._class
+
+    def name(self) -> str:
+        return self._name.rpartition(".")[2]
+
+    def fullName(self) -> str:
+        return self._name
+
+    def knob(self, name: str) -> Knob | None:
+        return self._knobs.get(name)
+
+    def knobs(self) -> dict:
+        return dict(self._knobs)
+
+    def __getitem__(self, name: str) -> Knob:
+        return self._knobs[name]
+
+    def setInput(self, index: int, node: Node | None):
+        self._inputs.extend([None] * (index + 1 - len(self._inputs)))
+        self._inputs[index] = node
+
+    def input(self, index: int) -> Node | None:
+        if index < len(self._inputs):
+            return self._inputs[index]
+        return None
+
+    def inputs(self) -> int:
+        return len(self._inputs)
+
+    def dependencies(self, what: int = INPUTS | HIDDEN_INPUTS) -> list[Node]:
+        return list({id(node): node for node in self._inputs if node}.values())
+
+    def setCustomIcon(self, path, scale=1.0, offset_x=0, offset_y=0):
+        global first_icon
+        calls["setCustomIcon"] += 1
+        if first_icon is None:
+            first_icon = time.perf_counter()
+        self.icon = path
+
+    def clearCustomIcon(self):
+        calls["clearCustomIcon"] += 1
+        self.icon = None
+
+
+class Undo:
+    def begin(self, name: str = ""):
+        pass
+
+    def end(self):
+        pass
+
+    def cancel(self):
+        pass
+
+
+class ProgressTask:
+    def __init__(self, name: str):
+        self.name = name
+
+    def setMessage(self, message: str):
+        pass
+
+    def setProgress(self, progress: int):
+        pass
+
+    def isCancelled(self) -> bool:
+        return False
+
+
+class ViewerWindow:
+    def __init__(self, node: Node):
+        self._node = node
+
+    def node(self) -> Node:
+        return self._node
+
+    def activeInput(self) -> int | None:
+        return 0 if self._node.input(0) else None
+
+
+def reset_calls():
+    global first_icon
+    first_icon = None
+    for name in calls:
+        calls[name] = 0
+    messages.clear()
+
+
+def _run(event: str):
+    for callback in list(_callbacks[event]):
+        callback()
+
+
+def _create(nodes: list[Node]):
+    global _this_node
+    for node in nodes:
+        _nodes[node.fullName()] = node
+        _this_node = node
+        _run("create")
+    _this_node = None
+
+
+def load_script(nodes: list[Node], name: str = "/proj/benchmark.nk"):
+    """Open a script, firing the callbacks in the order Nuke does"""
+    global _script_name
+    close_script()
+    _script_name = name
+    _create(nodes)
+    _run("load")
+
+
+def close_script():
+    global _script_name
+    _run("close")
+    _script_name = ""
+    _nodes.clear()
+    _selected.clear()
+
+
+def paste(nodes: list[Node]):
+    """Add nodes to the open script, e.g. pasted or created by the user"""
+    _create(nodes)
+
+
+def edit_knob(node: Node, name: str, value):
+    """Change a knob as the user would, firing the knobChanged callbacks"""
+    global _this_node, _this_knob
+    node[name].setValue(value)
+    _this_node, _this_knob = node, node[name]
+    _run("knob")
+    _this_node = _this_knob = None
+
+
+def select(nodes: list[Node]):
+    _selected[:] = nodes
+
+
+def allNodes(filter=None, group=None, recurseGroups=False) -> list[Node]:
+    nodes = list(_nodes.values())
+    if not recurseGroups:
+        nodes = [node for node in nodes if "." not in node.fullName()]
+    if filter:
+        nodes = [node for node in nodes if node.Class() == filter]
+    return nodes
+
+
+def scriptName() -> str:
+    if not _script_name:
+        raise RuntimeError("No script name")
+    return _script_name
+
+
+def toNode(name: str) -> Node | None:
+    return _nodes.get(name)
+
+
+def selectedNode() -> Node:
+    if not _selected:
+        raise ValueError("No node selected")
+    return _selected[-1]
+
+
+def selectedNodes(filter=None) -> list[Node]:
+    return list(_selected)
+
+
+def thisNode() -> Node | None:
+    return _this_node
+
+
+def thisKnob():
+    return _this_knob
+
+
+def activeViewer() -> ViewerWindow | None:
+    """Get the first Viewer of the script"""
+    for node in _nodes.values():
+        if node.Class() == "Viewer":
+            return ViewerWindow(node)
+    return None
+
+
+def ask(text: str) -> bool:
+    messages.append(text)
+    return True
+
+
+def message(text: str):
+    messages.append(text)
+
+
+def executeInMainThread(call, args=(), kwargs=None):
+    if threading.current_thread() is threading.main_thread():
+        call(*args, **(kwargs or {}))
+    else:
+        _main_thread_calls.put((call, args, kwargs or {}))
+
+
+def run_main_thread_calls(timeout: float = 0.0) -> int:
+    """
+    Run the calls other threads handed to the main thread
+
+    Args:
+        timeout (float): Seconds to wait for the first call
+
+    Returns:
+        int: Number of calls run
+    """
+    count = 0
+    while True:
+        try:
+            call, args, kwargs = _main_thread_calls.get(timeout=timeout)
+        except queue.Empty:
+            return count
+        call(*args, **kwargs)
+        count += 1
+        timeout = 0.0
+
+
+def executeInMainThreadWithResult(call, args=(), kwargs=None):
+    return call(*args, **(kwargs or {}))
+
+
+def addOnCreate(call, *args, **kwargs):
+    _callbacks["create"].append(call)
+
+
+def removeOnCreate(call, *args, **kwargs):
+    _callbacks["create"].remove(call)
+
+
+def addOnScriptLoad(call, *args, **kwargs):
+    _callbacks["load"].append(call)
+
+
+def removeOnScriptLoad(call, *args, **kwargs):
+    _callbacks["load"].remove(call)
+
+
+def addOnScriptClose(call, *args, **kwargs):
+    _callbacks["close"].append(call)
+
+
+def removeOnScriptClose(call, *args, **kwargs):
+    _callbacks["close"].remove(call)
+
+
+def addKnobChanged(call, *args, **kwargs):
+    _callbacks["knob"].append(call)
+
+
+def removeKnobChanged(call, *args, **kwargs):
+    _callbacks["knob"].remove(call)
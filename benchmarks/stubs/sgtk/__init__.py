@@ -0,0 +1,94 @@
+# MIT License
+
+# Copyright (c) 2025 MaximumFX
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Stand-in for the parts of the Toolkit API the app uses"""
+
+from __future__ import annotations
+
+import re
+
+from . import platform, util
+
+_KEY = re.compile(r"\{(\w+)\}")
+
+
+class TemplatePath:
+    """Template with string keys and a three digit version key"""
+
+    def __init__(self, name: str, definition: str, root_path: str):
+        self.name = name
+        self.definition = definition
+        self.root_path = root_path
+
+        pattern = ""
+        position = 0
+        seen = set()
+        for match in _KEY.finditer(definition):
+            key = match.group(1)
+            pattern += re.escape(definition[position : match.start()])
+            if key in seen:
+                pattern += f"(?P={key})"
+            elif key == "version":
+                pattern += rf"(?P<{key}>\d{{3,}})"
+            else:
+                pattern += rf"(?P<{key}>[^/]+)"
+            seen.add(key)
+            position = match.end()
+        pattern += re.escape(definition[position:])
+
+        self.keys = dict.fromkeys(seen)
+        self._pattern = re.compile(re.escape(root_path + "/") + pattern)
+
+    def validate(self, path: str, fields=None, skip_keys=None) -> bool:
+        return self._pattern.fullmatch(path.replace("\\", "/")) is not None
+
+    def get_fields(self, path: str, skip_keys=None) -> dict:
+        fields = self.validate_and_get_fields(path)
+        if fields is None:
+            raise ValueError(f"{path} doesn't match {self.name}")
+        return fields
+
+    def validate_and_get_fields(
+        self, path: str, required_fields=None, skip_keys=None
+    ) -> dict | None:
+        match = self._pattern.fullmatch(path.replace("\\", "/"))
+        if match is None:
+            return None
+        fields = match.groupdict()
+        if "version" in fields:
+            fields["version"] = int(fields["version"])
+        return fields
+
+    def apply_fields(self, fields: dict, platform=None) -> str:
+        def value(match):
+            key = match.group(1)
+            if key == "version":
+                return f"{fields[key]:03d}"
+            return str(fields[key])
+
+        return self.root_path + "/" + _KEY.sub(value, self.definition)
+
+
+class Sgtk:
+    def __init__(self, templates: dict, shotgun):
+        self.templates = templates
+        self.shotgun = shotgun
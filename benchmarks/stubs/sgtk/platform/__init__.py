@@ -0,0 +1,74 @@
+# MIT License
+
+# Copyright (c) 2025 MaximumFX
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from __future__ import annotations
+
+import importlib
+import logging
+
+
+class Application:
+    """Base class of Toolkit apps, settings come from a dict"""
+
+    def __init__(self, engine, settings: dict, cache_location: str = ""):
+        self.engine = engine
+        self.tank = engine.sgtk
+        self.sgtk = engine.sgtk
+        self.context = engine.context
+        self.logger = logging.getLogger("tk-nuke-readstatus")
+        self.cache_location = cache_location
+        self._settings = settings
+        self.init_app()
+
+    def get_setting(self, key: str, default=None):
+        return self._settings.get(key, default)
+
+    def import_module(self, name: str):
+        return importlib.import_module(name)
+
+    def destroy_app(self):
+        pass
+
+
+class Engine:
+    """Engine holding the registered commands and the other apps"""
+
+    def __init__(self, tk, apps: dict | None = None):
+        self.sgtk = tk
+        self.shotgun = tk.shotgun
+        self.context = None
+        self.apps = apps or {}
+        self.commands = {}
+        self.has_ui = True
+
+    def register_command(self, name: str, callback, properties=None):
+        self.commands[name] = callback
+
+    def register_panel(self, callback, *args, **kwargs):
+        return callback.__name__
+
+    def show_panel(self, *args, **kwargs):
+        pass
+
+
+def current_engine():
+    return None
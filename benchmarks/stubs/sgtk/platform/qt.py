@@ -0,0 +1,102 @@
+# MIT License
+
+# Copyright (c) 2025 MaximumFX
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Stand-in for the Qt timers, which only fire when events are processed"""
+
+from __future__ import annotations
+
+_active = []
+
+
+class _Signal:
+    def __init__(self):
+        self._slots = []
+
+    def connect(self, slot):
+        self._slots.append(slot)
+
+    def emit(self, *args):
+        for slot in list(self._slots):
+            slot(*args)
+
+
+class _QTimer:
+    def __init__(self, parent=None):
+        self.timeout = _Signal()
+        self._single_shot = False
+        self._interval = 0
+
+    def setSingleShot(self, single_shot: bool):
+        self._single_shot = single_shot
+
+    def setInterval(self, interval: int):
+        self._interval = interval
+
+    def interval(self) -> int:
+        return self._interval
+
+    def start(self, interval: int | None = None):
+        if interval is not None:
+            self._interval = interval
+        if self not in _active:
+            _active.append(self)
+
+    def stop(self):
+        if self in _active:
+            _active.remove(self)
+
+    def isActive(self) -> bool:
+        return self in _active
+
+    @staticmethod
+    def singleShot(interval: int, callback):
+        timer = _QTimer()
+        timer.setSingleShot(True)
+        timer.timeout.connect(callback)
+        timer.start(interval)
+
+
+def _fire(timers: list):
+    for timer in timers:
+        if timer._single_shot:
+            timer.stop()
+        timer.timeout.emit()
+
+
+def fire_single_shot_timers():
+    """Fire the running single shot timers, the repeating ones keep waiting"""
+    _fire([timer for timer in _active if timer._single_shot])
+
+
+class _QCoreApplication:
+    @staticmethod
+    def processEvents(*args):
+        """Fire every running timer once, as if their interval passed"""
+        _fire(list(_active))
+
+
+class QtCore:
+    QTimer = _QTimer
+    QCoreApplication = _QCoreApplication
+
+
+QtGui = None
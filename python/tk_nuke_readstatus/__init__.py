@@ -20,4 +20,15 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-from .readstatus import ReadStatus
+from .classify import Classification, StatusClassifier
+from .mappings import MappingIndex, format_switches
+from .nkscript import read_file_nodes
+
+try:
+    import nuke  # noqa: F401
+except ImportError:
+    # Running headless, e.g. the .nk auditor, only the Nuke-free parts are usable
+    pass
+else:
+    from .readstatus import ReadStatus
+    from .scheduler import CoalescingScheduler
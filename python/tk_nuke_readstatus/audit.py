@@ -0,0 +1,273 @@
+# MIT License
+
+# Copyright (c) 2025 MaximumFX
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Audit the file nodes of .nk scripts without launching Nuke
+
+Usage:
+    python -m tk_nuke_readstatus.audit --config /path/to/pipeline_config \\
+        --settings readstatus.yml --output report.jsonl shots/**/*.nk
+
+Every file node is written as one JSON line. The settings file holds the
+tk-nuke-readstatus settings of the environment, e.g. the statuses. Workers write
+the records of every script batch by batch, so memory doesn't grow with the
+number or size of the scripts.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import shutil
+import sys
+import tempfile
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    as_completed,
+    wait,
+)
+from typing import Iterator
+
+from .classify import StatusClassifier
+from .nkscript import read_file_nodes
+
+logger = logging.getLogger("tk-nuke-readstatus.audit")
+
+# Classifier of the current worker process
+_classifier = None
+
+
+def _load_settings(path: str | None) -> dict:
+    if not path:
+        return {}
+
+    with open(path, encoding="utf-8") as settings_file:
+        if path.endswith(".json"):
+            return json.load(settings_file)
+
+        from tank_vendor import yaml
+
+        return yaml.safe_load(settings_file) or {}
+
+
+def _init_worker(
+    config_path: str, settings_path: str | None, offline: bool, auth: dict
+):
+    """Set up Toolkit and the classifier once per worker process"""
+    global _classifier
+    import sgtk
+
+    if not offline:
+        user = sgtk.authentication.ShotgunAuthenticator().create_script_user(
+            api_script=auth["script_name"],
+            api_key=auth["script_key"],
+            host=auth["host"],
+        )
+        sgtk.set_authenticated_user(user)
+
+    tk = sgtk.sgtk_from_path(config_path)
+    settings = _load_settings(settings_path)
+    _classifier = StatusClassifier(settings.get, tk, logger, publishes=not offline)
+
+
+def _classify_batch(script: str, nodes: list) -> list[dict]:
+    _classifier.add_paths(
+        {node.file_path: (node.name, node.node_class) for node in nodes}
+    )
+    _classifier.resolve_latest([node.file_path for node in nodes], always=True)
+
+    records = []
+    for node in nodes:
+        classification = _classifier.classify(node.file_path, node.frame_range)
+        record = {
+            "script": script,
+            "node": node.name,
+            "class": node.node_class,
+            "knob": node.knob,
+        }
+        record.update(classification.to_dict())
+        records.append(record)
+    return records
+
+
+def iter_script_records(script: str, batch_size: int = 500) -> Iterator[dict]:
+    """
+    Classify all file nodes of a script batch by batch, in the worker process
+
+    The published files and latest versions of the previous script are
+    forgotten first, so a worker holds at most one script's lookups.
+
+    Args:
+        script (str): Script path
+        batch_size (int): Number of nodes to look up in ShotGrid at once
+
+    Yields:
+        dict: One record per file node
+    """
+    _classifier.breakdown_index.clear()
+    _classifier.latest_resolver.clear()
+
+    batch = []
+    for node in read_file_nodes(script):
+        batch.append(node)
+        if len(batch) >= batch_size:
+            yield from _classify_batch(script, batch)
+            batch = []
+    if batch:
+        yield from _classify_batch(script, batch)
+
+
+def audit_script(
+    script: str,
+    report_path: str,
+    batch_size: int = 500,
+    problems_only: bool = False,
+) -> str:
+    """
+    Write the records of all file nodes of a script to a report part, in the
+    worker process
+
+    Args:
+        script (str): Script path
+        report_path (str): JSON lines file to write, one per script
+        batch_size (int): Number of nodes to look up in ShotGrid at once
+        problems_only (bool): Only write out-of-pipe, outdated and missing nodes
+
+    Returns:
+        str: Path of the report part
+    """
+    with open(report_path, "w", encoding="utf-8") as report:
+        try:
+            for record in iter_script_records(script, batch_size):
+                if not problems_only or _is_problem(record):
+                    report.write(json.dumps(record) + "\n")
+        except Exception as error:
+            # The records written so far are kept
+            report.write(json.dumps({"script": script, "error": str(error)}) + "\n")
+    return report_path
+
+
+def _copy_parts(futures, output):
+    """Append the finished report parts to the report and delete them"""
+    for future in futures:
+        report_path = future.result()
+        with open(report_path, encoding="utf-8") as report:
+            shutil.copyfileobj(report, output)
+        os.remove(report_path)
+        output.flush()
+
+
+def _find_scripts(paths: list[str]):
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, names in os.walk(path):
+                for name in sorted(names):
+                    if name.endswith(".nk"):
+                        yield os.path.join(root, name)
+        else:
+            yield path
+
+
+def _is_problem(record: dict) -> bool:
+    return bool(
+        record.get("error")
+        or record.get("out_of_pipe")
+        or record.get("outdated")
+        or record.get("disk")
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m tk_nuke_readstatus.audit",
+        description="Report out-of-pipe, outdated and missing file nodes of "
+        ".nk scripts as JSON lines.",
+    )
+    parser.add_argument("scripts", nargs="+", help=".nk scripts or directories")
+    parser.add_argument("--config", required=True, help="Pipeline configuration")
+    parser.add_argument("--settings", help="App settings as YAML or JSON")
+    parser.add_argument("--output", help="Report path, defaults to stdout")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument(
+        "--offline", action="store_true", help="Don't look up published files"
+    )
+    parser.add_argument(
+        "--problems-only",
+        action="store_true",
+        help="Only report out-of-pipe, outdated and missing nodes",
+    )
+    parser.add_argument("--host", default=os.environ.get("SHOTGUN_HOST"))
+    parser.add_argument(
+        "--script-name", default=os.environ.get("SHOTGUN_SCRIPT_NAME")
+    )
+    parser.add_argument(
+        "--script-key", default=os.environ.get("SHOTGUN_SCRIPT_KEY")
+    )
+    args = parser.parse_args(argv)
+
+    auth = {
+        "host": args.host,
+        "script_name": args.script_name,
+        "script_key": args.script_key,
+    }
+    if not args.offline and not all(auth.values()):
+        parser.error("--host, --script-name and --script-key are required online")
+
+    output = sys.stdout
+    if args.output:
+        output = open(args.output, "w", encoding="utf-8")
+    try:
+        with tempfile.TemporaryDirectory(
+            prefix="tk-nuke-readstatus-audit-"
+        ) as parts, ProcessPoolExecutor(
+            max_workers=args.workers,
+            initializer=_init_worker,
+            initargs=(args.config, args.settings, args.offline, auth),
+        ) as executor:
+            # Only a few scripts per worker are in flight, the finished ones
+            # are written out and dropped
+            window = 2 * (args.workers or os.cpu_count() or 1)
+            pending = set()
+            for index, script in enumerate(_find_scripts(args.scripts)):
+                pending.add(
+                    executor.submit(
+                        audit_script,
+                        script,
+                        os.path.join(parts, f"{index}.jsonl"),
+                        problems_only=args.problems_only,
+                    )
+                )
+                if len(pending) >= window:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    _copy_parts(done, output)
+            _copy_parts(as_completed(pending), output)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,337 @@
+# MIT License
+
+# Copyright (c) 2025 MaximumFX
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from __future__ import annotations
+
+import os
+import threading
+from typing import Callable
+
+import sgtk
+
+from .disk import INCOMPLETE, MISSING, DirectoryCache
+from .index import BreakdownIndex, SceneItem
+from .latest import PUBLISH_FIELDS, LatestResolver
+from .latest_cache import LatestCache
+from .lookup import ShotgunLookup
+from .matcher import StatusMatcher
+from .metrics import Metrics
+from .models import Icon, Status
+
+
+class Classification:
+    """Status of a file path"""
+
+    __slots__ = ("file_path", "status", "disk", "icon", "version", "latest_version")
+
+    def __init__(
+        self,
+        file_path: str,
+        status: Status | None = None,
+        disk: str | None = None,
+        icon: Icon | None = None,
+        version: int | None = None,
+        latest_version: int | None = None,
+    ):
+        """
+        Args:
+            file_path (str): File path
+            status (Status | None): First matching status
+            disk (str | None): MISSING, INCOMPLETE or None if not checked or
+                everything is on disk
+            icon (Icon | None): Icon to apply or None to clear the icon
+            version (int | None): Published version of the path
+            latest_version (int | None): Latest published version
+        """
+        self.file_path = file_path
+        self.status = status
+        self.disk = disk
+        self.icon = icon
+        self.version = version
+        self.latest_version = latest_version
+
+    @property
+    def out_of_pipe(self) -> bool:
+        return bool(self.file_path) and self.status is None
+
+    @property
+    def outdated(self) -> bool:
+        if self.version is None or self.latest_version is None:
+            return False
+        return self.version < self.latest_version
+
+    @property
+    def problem(self) -> bool:
+        """If the path is out of the pipeline, outdated or missing on disk"""
+        return self.out_of_pipe or self.outdated or self.disk is not None
+
+    def to_dict(self) -> dict:
+        return {
+            "file_path": self.file_path,
+            "status": self.status.icon.name if self.status else None,
+            "out_of_pipe": self.out_of_pipe,
+            "outdated": self.outdated,
+            "disk": self.disk,
+            "version": self.version,
+            "latest_version": self.latest_version,
+        }
+
+
+class StatusClassifier:
+    """Decide the status of file paths, without depending on Nuke"""
+
+    def __init__(
+        self,
+        get_setting: Callable,
+        tk,
+        logger,
+        publishes: bool = True,
+        metrics: Metrics | None = None,
+        latest_cache: LatestCache | None = None,
+    ):
+        """
+        Args:
+            get_setting (Callable): Returns a setting, e.g. app.get_setting
+            tk (sgtk.Sgtk): Toolkit API instance
+            logger: Logger
+            publishes (bool): If published files should be looked up in ShotGrid
+            metrics (Metrics | None): Timings and counts of the lookups
+            latest_cache (LatestCache | None): Latest versions kept between
+                sessions
+        """
+        self.tk = tk
+        self.logger = logger
+        self.publishes = publishes
+        self.metrics = metrics or Metrics(logger)
+
+        self.question_on_missing = get_setting("question_on_missing", False)
+        self.missing_icon = Icon.from_dict(get_setting("missing_icon", {}) or {})
+        self.check_disk = get_setting("check_disk", False)
+        self.missing_on_disk_icon = Icon.from_dict(
+            get_setting("missing_on_disk_icon", {}) or {}
+        )
+        self.incomplete_icon = Icon.from_dict(
+            get_setting("incomplete_icon", {}) or {}
+        )
+        self.statuses = [
+            Status.from_dict(status) for status in get_setting("statuses", []) or []
+        ]
+        self.status_matcher = StatusMatcher(
+            self.statuses, tk.templates, logger, metrics=self.metrics
+        )
+
+        self.directory_cache = DirectoryCache()
+        self.breakdown_index = BreakdownIndex()
+        # tk.shotgun is a separate connection on every thread, one per pool thread
+        self.shotgun_lookup = ShotgunLookup(
+            lambda: self.tk.shotgun,
+            logger,
+            max_connections=get_setting("shotgun_connections", 4),
+            retries=get_setting("shotgun_retries", 4),
+            metrics=self.metrics,
+        )
+        self.latest_resolver = LatestResolver(
+            self.shotgun_lookup, logger, cache=latest_cache
+        )
+
+        # Guards the shared lookups when paths are classified from several threads
+        self.lock = threading.RLock()
+
+    def update_index(self, items: list) -> set[str]:
+        """
+        Replace the indexed breakdown items with a new scan
+
+        Args:
+            items (list): Breakdown items
+
+        Returns:
+            set[str]: Paths which were added, changed or removed
+        """
+        with self.lock:
+            return self.breakdown_index.update(items)
+
+    def add_paths(self, node_paths: dict) -> set[str]:
+        """
+        Look up the published files of the paths which aren't indexed yet
+
+        Args:
+            node_paths (dict): (node name, node class) per file path
+
+        Returns:
+            set[str]: Paths which were added to the index
+        """
+        if not self.publishes:
+            return set()
+
+        with self.lock:
+            paths = [
+                path
+                for path in node_paths
+                if path and path not in self.breakdown_index
+            ]
+        if not paths:
+            return set()
+
+        with self.metrics.time("breakdown.find_publish"):
+            publishes = self.shotgun_lookup.retry(
+                sgtk.util.find_publish, self.tk, paths, fields=PUBLISH_FIELDS
+            )
+        self.metrics.count("breakdown.paths", len(paths))
+        with self.lock:
+            return self.breakdown_index.add(
+                [
+                    SceneItem(path, publishes[path], *node_paths[path])
+                    for path in paths
+                    if publishes.get(path)
+                ]
+            )
+
+    def item(self, file_path: str):
+        """
+        Get the published file of a path
+
+        Args:
+            file_path (str): File path
+
+        Returns:
+            PublishRecord | None: Published file of the path
+        """
+        with self.lock:
+            return self.breakdown_index.get(file_path)
+
+    def resolve_latest(
+        self, file_paths: list, always: bool = False, use_stale: bool = True
+    ):
+        """
+        Resolve the latest published files of the given paths in bulk
+
+        Args:
+            file_paths (list[str | None]): File paths
+            always (bool): Also resolve when no status compares to the latest
+            use_stale (bool): Use stale cached latest versions until they're
+                revalidated, otherwise they're queried right away
+        """
+        if not self.publishes or not self.breakdown_index:
+            return
+        if not always and not any(status.latest for status in self.statuses):
+            return
+
+        items = []
+        with self.lock:
+            for file_path in file_paths:
+                if file_path:
+                    item = self.breakdown_index.get(file_path)
+                    if item:
+                        items.append(item)
+
+        query_count = self.latest_resolver.query_count
+        with self.metrics.time("latest.resolve"):
+            self.latest_resolver.resolve(items, use_stale=use_stale)
+        self.metrics.count(
+            "latest.queries", self.latest_resolver.query_count - query_count
+        )
+
+    def latest_version(self, file_path: str) -> int | None:
+        """
+        Get the latest published version number for a path
+
+        Args:
+            file_path (str): File path
+
+        Returns:
+            int | None: Version number or None if the path isn't in the breakdown
+        """
+        if not self.publishes or not self.breakdown_index:
+            return None
+
+        item = self.item(file_path)
+        if not item:
+            return None
+        return self.latest_resolver.latest(item).get("version_number", -1)
+
+    def classify(
+        self,
+        file_path: str,
+        frame_range: tuple[int, int] | None = None,
+        check_disk: bool | None = None,
+    ) -> Classification:
+        """
+        Get the status of a file path
+
+        Args:
+            file_path (str): File path to check
+            frame_range (tuple[int, int] | None): Frames which should be on disk
+            check_disk (bool | None): Check the files on disk, defaults to the
+                check_disk setting
+
+        Returns:
+            Classification: Status, disk state and versions of the path
+        """
+        if not file_path:
+            return Classification(file_path)
+
+        if check_disk is None:
+            check_disk = self.check_disk
+        classification = Classification(file_path)
+        if check_disk and self.is_checkable_on_disk(file_path):
+            with self.metrics.time("classify.disk"):
+                classification.disk = self.directory_cache.check(
+                    file_path, frame_range
+                )
+
+        with self.metrics.time("classify.match"):
+            classification.status = self.status_matcher.match(
+                file_path, self.latest_version
+            )
+
+        item = self.item(file_path) if self.publishes else None
+        if item:
+            classification.version = item.version
+            if self.latest_resolver.is_resolved(item):
+                classification.latest_version = self.latest_resolver.latest(
+                    item
+                ).get("version_number")
+
+        if classification.disk == MISSING:
+            classification.icon = self.missing_on_disk_icon
+        elif classification.disk == INCOMPLETE:
+            classification.icon = self.incomplete_icon
+        elif classification.status:
+            classification.icon = classification.status.icon
+        elif self.question_on_missing:
+            classification.icon = self.missing_icon
+        return classification
+
+    @staticmethod
+    def is_checkable_on_disk(file_path: str) -> bool:
+        """
+        Check if a path can be looked up on disk as is
+
+        Args:
+            file_path (str): File path
+
+        Returns:
+            bool: False for relative paths and paths with expressions or views
+        """
+        if "[" in file_path or "%v" in file_path.lower():
+            return False
+        return os.path.isabs(file_path)
@@ -0,0 +1,188 @@
+# MIT License
+
+# Copyright (c) 2025 MaximumFX
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from __future__ import annotations
+
+import functools
+import os
+import re
+import threading
+from collections import OrderedDict
+
+MISSING = "missing"
+INCOMPLETE = "incomplete"
+
+FRAME_TOKEN = re.compile(r"%(\d*)d|#+")
+
+
+@functools.lru_cache(maxsize=4096)
+def frame_pattern(file_name: str) -> re.Pattern | None:
+    """
+    Get a pattern matching the file names of a sequence
+
+    Args:
+        file_name (str): File name with a %04d or #### frame token
+
+    Returns:
+        re.Pattern | None: Pattern with the frame number as first group, or None
+            if the name isn't a sequence
+    """
+    match = FRAME_TOKEN.search(file_name)
+    if not match:
+        return None
+
+    token = match.group(0)
+    padding = len(token) if token.startswith("#") else int(match.group(1) or 1)
+    return re.compile(
+        re.escape(file_name[: match.start()])
+        + rf"(-?\d{{{padding},}})"
+        + re.escape(file_name[match.end() :])
+    )
+
+
+class _Directory:
+    __slots__ = ("mtime", "names", "frames")
+
+    def __init__(self, mtime: int, names: frozenset):
+        self.mtime = mtime
+        self.names = names
+        self.frames = {}
+
+
+class DirectoryCache:
+    """Directory listings shared by all paths, invalidated by directory mtime"""
+
+    def __init__(self, size: int = 1024):
+        """
+        Args:
+            size (int): Maximum number of directories to remember
+        """
+        self.size = size
+        self.listings = 0
+        self._directories = OrderedDict()
+        self._lock = threading.Lock()
+
+    def clear(self):
+        with self._lock:
+            self._directories.clear()
+
+    def __directory(self, directory: str) -> _Directory | None:
+        try:
+            mtime = os.stat(directory).st_mtime_ns
+        except OSError:
+            with self._lock:
+                self._directories.pop(directory, None)
+            return None
+
+        with self._lock:
+            cached = self._directories.get(directory)
+            if cached is not None and cached.mtime == mtime:
+                self._directories.move_to_end(directory)
+                return cached
+
+        try:
+            with os.scandir(directory) as entries:
+                names = frozenset(entry.name for entry in entries)
+        except OSError:
+            return None
+
+        cached = _Directory(mtime, names)
+        with self._lock:
+            self.listings += 1
+            self._directories[directory] = cached
+            if len(self._directories) > self.size:
+                self._directories.popitem(last=False)
+        return cached
+
+    def listing(self, directory: str) -> frozenset | None:
+        """
+        Get the names in a directory
+
+        Args:
+            directory (str): Directory path
+
+        Returns:
+            frozenset | None: File names or None if the directory doesn't exist
+        """
+        cached = self.__directory(directory)
+        return cached.names if cached else None
+
+    def frames(self, file_path: str) -> frozenset | None:
+        """
+        Get the frames of a sequence on disk
+
+        Args:
+            file_path (str): Sequence path with a %04d or #### frame token
+
+        Returns:
+            frozenset | None: Frame numbers, or None if the path isn't a sequence
+                or its directory doesn't exist
+        """
+        directory, file_name = os.path.split(file_path)
+        cached = self.__directory(directory)
+        if cached is None:
+            return None
+        return self.__frames(cached, file_name)
+
+    @staticmethod
+    def __frames(cached: _Directory, file_name: str) -> frozenset | None:
+        frames = cached.frames.get(file_name)
+        if frames is None:
+            pattern = frame_pattern(file_name)
+            if pattern is None:
+                return None
+            frames = frozenset(
+                int(match.group(1))
+                for match in map(pattern.fullmatch, cached.names)
+                if match
+            )
+            cached.frames[file_name] = frames
+        return frames
+
+    def check(
+        self, file_path: str, frame_range: tuple[int, int] | None = None
+    ) -> str | None:
+        """
+        Check if a file or sequence is complete on disk
+
+        Args:
+            file_path (str): File or sequence path
+            frame_range (tuple[int, int] | None): First and last frame to expect
+
+        Returns:
+            str | None: MISSING, INCOMPLETE or None if everything is on disk
+        """
+        directory, file_name = os.path.split(file_path)
+        cached = self.__directory(directory)
+        if cached is None:
+            return MISSING
+
+        frames = self.__frames(cached, file_name)
+        if frames is None:
+            return None if file_name in cached.names else MISSING
+        if not frames:
+            return MISSING
+        if frame_range:
+            first, last = frame_range
+            if any(frame not in frames for frame in range(first, last + 1)):
+                return INCOMPLETE
+        return None
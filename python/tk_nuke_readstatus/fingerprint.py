@@ -0,0 +1,92 @@
+# MIT License
+
+# Copyright (c) 2025 MaximumFX
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from __future__ import annotations
+
+_UNCHECKED = object()
+
+
+class SceneFingerprint:
+    """
+    Remember the file path every node was last checked with
+
+    A node whose file path is the same as when it was checked doesn't need to
+    be checked again. Nodes are forgotten when they're (re)created or their
+    file knob is edited, so the fingerprint follows the scene between checks.
+    """
+
+    def __init__(self):
+        self._paths = {}
+        self.matched = 0
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+    def matches(self, node_name: str, file_path: str | None) -> bool:
+        """
+        Check if a node was checked with this file path
+
+        Args:
+            node_name (str): Full node name
+            file_path (str | None): Current file path of the node
+
+        Returns:
+            bool: If the node doesn't need to be checked again
+        """
+        if self._paths.get(node_name, _UNCHECKED) != file_path:
+            return False
+        self.matched += 1
+        return True
+
+    def record(self, node_name: str, file_path: str | None):
+        """
+        Record the file path a node was checked with
+
+        Args:
+            node_name (str): Full node name
+            file_path (str | None): File path
+        """
+        self._paths[node_name] = file_path
+
+    def forget(self, node_name: str):
+        """
+        Forget a node, it's checked again by the next refresh
+
+        Args:
+            node_name (str): Full node name
+        """
+        self._paths.pop(node_name, None)
+
+    def retain(self, node_names: set[str]):
+        """
+        Forget the nodes which aren't in the script anymore
+
+        Args:
+            node_names (set[str]): Full names of the nodes in the script
+        """
+        for node_name in [name for name in self._paths if name not in node_names]:
+            del self._paths[node_name]
+
+    def clear(self):
+        """Forget all nodes, the next refresh checks the whole script"""
+        self._paths.clear()
+        self.matched = 0
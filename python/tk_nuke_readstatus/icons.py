@@ -0,0 +1,84 @@
+# MIT License
+
+# Copyright (c) 2025 MaximumFX
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from __future__ import annotations
+
+from .models import Icon
+
+
+def icon_key(icon: Icon | None) -> tuple | None:
+    """
+    Get a key describing how an icon is drawn
+
+    Args:
+        icon (Icon | None): Icon or None for a cleared icon
+
+    Returns:
+        tuple | None: Icon name and placement
+    """
+    if icon is None:
+        return None
+    return icon.name, icon.scale, icon.offset_x, icon.offset_y
+
+
+class IconTracker:
+    """Remember the last icon applied to every node"""
+
+    def __init__(self):
+        self._applied = {}
+        self.applied = 0
+        self.skipped = 0
+
+    def update(self, node_name: str, icon: Icon | None) -> bool:
+        """
+        Record the icon for a node
+
+        Args:
+            node_name (str): Full node name
+            icon (Icon | None): Icon or None for a cleared icon
+
+        Returns:
+            bool: If the icon differs from the last applied one
+        """
+        key = icon_key(icon)
+        if node_name in self._applied and self._applied[node_name] == key:
+            self.skipped += 1
+            return False
+
+        self._applied[node_name] = key
+        self.applied += 1
+        return True
+
+    def forget(self, node_name: str):
+        """
+        Forget a node, the next icon for it will always be applied
+
+        Args:
+            node_name (str): Full node name
+        """
+        self._applied.pop(node_name, None)
+
+    def clear(self):
+        """Forget all nodes and reset the counters"""
+        self._applied.clear()
+        self.applied = 0
+        self.skipped = 0
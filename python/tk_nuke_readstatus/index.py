@@ -0,0 +1,303 @@
+# MIT License
+
+# Copyright (c) 2025 MaximumFX
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from __future__ import annotations
+
+import os
+import sys
+
+from .latest import GROUP_FIELDS, publish_key
+
+
+def normalize_path(path: str) -> str:
+    """
+    Normalize a path for comparison
+
+    Args:
+        path (str): File path
+
+    Returns:
+        str: Path with forward slashes
+    """
+    return path.replace(os.sep, "/")
+
+
+def _compact(value):
+    """Keep only what identifies a linked entity, e.g. the project"""
+    if isinstance(value, dict):
+        return {"type": value.get("type"), "id": value.get("id")}
+    return value
+
+
+class SceneItem:
+    """Breakdown item for a file found outside of a full scene scan"""
+
+    def __init__(
+        self, path: str, sg_data: dict | None, node_name: str, node_type: str
+    ):
+        self.path = path
+        self.sg_data = sg_data
+        self.node_name = node_name
+        self.node_type = node_type
+
+
+class PublishGroup:
+    """Versions of the same published file, shared by all their records"""
+
+    __slots__ = ("key", "fields", "paths")
+
+    def __init__(self, key: tuple, fields: dict):
+        """
+        Args:
+            key (tuple): Publish key
+            fields (dict): Fields identifying the group, to query its versions
+        """
+        self.key = key
+        self.fields = fields
+        self.paths = set()
+
+
+class PublishRecord:
+    """Published file of an indexed path, without the rest of the breakdown item"""
+
+    __slots__ = ("path", "publish_id", "version", "group")
+
+    def __init__(
+        self,
+        path: str,
+        publish_id: int | None,
+        version: int | None,
+        group: PublishGroup | None,
+    ):
+        """
+        Args:
+            path (str): Normalized path
+            publish_id (int | None): Published file id
+            version (int | None): Published version number
+            group (PublishGroup | None): Versions of the published file
+        """
+        self.path = path
+        self.publish_id = publish_id
+        self.version = version
+        self.group = group
+
+    @property
+    def key(self) -> tuple | None:
+        return self.group.key if self.group is not None else None
+
+    @property
+    def fields(self) -> dict | None:
+        return self.group.fields if self.group is not None else None
+
+
+class BreakdownIndex:
+    """
+    Normalized path to published file lookup
+
+    Breakdown items aren't kept, every path gets a compact record with an
+    interned path, and the fields identifying its versions are stored once
+    per publish group.
+    """
+
+    def __init__(self):
+        self._records = {}
+        # Publish groups per publish key, to find the paths a new publish affects
+        self._groups = {}
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __contains__(self, path: str) -> bool:
+        return normalize_path(path) in self._records
+
+    def get(self, path: str) -> PublishRecord | None:
+        """
+        Get the published file for a path
+
+        Args:
+            path (str): File path
+
+        Returns:
+            PublishRecord | None: Published file record
+        """
+        return self._records.get(normalize_path(path))
+
+    def version(self, path: str) -> int | None:
+        """
+        Get the published version number of a path
+
+        Args:
+            path (str): File path
+
+        Returns:
+            int | None: Version number
+        """
+        record = self._records.get(normalize_path(path))
+        return record.version if record is not None else None
+
+    def paths(self):
+        return self._records.keys()
+
+    def groups(self):
+        return self._groups.values()
+
+    def paths_for(self, keys) -> set[str]:
+        """
+        Get the paths of the records in publish groups
+
+        Args:
+            keys (Iterable[tuple]): Publish keys
+
+        Returns:
+            set[str]: Normalized paths
+        """
+        paths = set()
+        for key in keys:
+            group = self._groups.get(key)
+            if group is not None:
+                paths.update(group.paths)
+        return paths
+
+    def entities(self) -> list[dict]:
+        """
+        Get the entities the indexed files were published to
+
+        Returns:
+            list[dict]: Distinct entities
+        """
+        entities = {}
+        for group in self._groups.values():
+            entity = group.fields.get("entity")
+            if entity:
+                entities[(entity.get("type"), entity.get("id"))] = entity
+        return list(entities.values())
+
+    def memory(self) -> int:
+        """
+        Get the approximate size of the index
+
+        Returns:
+            int: Bytes held by the records, groups and their paths
+        """
+        size = sys.getsizeof(self._records) + sys.getsizeof(self._groups)
+        for path, record in self._records.items():
+            size += sys.getsizeof(path) + sys.getsizeof(record)
+        for group in self._groups.values():
+            size += (
+                sys.getsizeof(group)
+                + sys.getsizeof(group.key)
+                + sys.getsizeof(group.fields)
+                + sys.getsizeof(group.paths)
+            )
+        return size
+
+    def clear(self):
+        self._records.clear()
+        self._groups.clear()
+
+    def update(self, items: list) -> set[str]:
+        """
+        Replace the indexed paths with a new scan, only touching changed paths
+
+        Args:
+            items (list): Breakdown items
+
+        Returns:
+            set[str]: Paths which were added, changed or removed
+        """
+        seen = set()
+        changed = self.add(items, seen)
+        for path in list(self._records.keys()):
+            if path not in seen:
+                self.remove(path)
+                changed.add(path)
+        return changed
+
+    def add(self, items: list, seen: set | None = None) -> set[str]:
+        """
+        Add or update paths without removing anything else from the index
+
+        Args:
+            items (list): Breakdown items, only their path and published file
+                data are kept
+            seen (set | None): Collects every normalized path that was visited
+
+        Returns:
+            set[str]: Paths which were added or changed
+        """
+        changed = set()
+        for item in items:
+            if not item.path:
+                continue
+            path = normalize_path(item.path)
+            if seen is not None:
+                seen.add(path)
+
+            sg_data = item.sg_data or {}
+            publish_id = sg_data.get("id")
+            record = self._records.get(path)
+            if record is not None and record.publish_id == publish_id:
+                continue
+
+            path = sys.intern(path)
+            self.__ungroup(path)
+            self._records[path] = PublishRecord(
+                path,
+                publish_id,
+                sg_data.get("version_number"),
+                self.__group(path, sg_data),
+            )
+            changed.add(path)
+        return changed
+
+    def remove(self, path: str):
+        """
+        Remove a path from the index
+
+        Args:
+            path (str): File path
+        """
+        path = normalize_path(path)
+        self.__ungroup(path)
+        self._records.pop(path, None)
+
+    def __group(self, path: str, sg_data: dict) -> PublishGroup | None:
+        key = publish_key(sg_data)
+        if key is None:
+            return None
+
+        group = self._groups.get(key)
+        if group is None:
+            group = PublishGroup(
+                key, {field: _compact(sg_data.get(field)) for field in GROUP_FIELDS}
+            )
+            self._groups[key] = group
+        group.paths.add(path)
+        return group
+
+    def __ungroup(self, path: str):
+        record = self._records.get(path)
+        group = record.group if record is not None else None
+        if group is not None:
+            group.paths.discard(path)
+            if not group.paths:
+                del self._groups[group.key]
@@ -0,0 +1,353 @@
+# MIT License
+
+# Copyright (c) 2025 MaximumFX
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from __future__ import annotations
+
+import threading
+import time
+
+PUBLISH_FIELDS = [
+    "version_number",
+    "path",
+    "project",
+    "entity",
+    "task",
+    "name",
+    "published_file_type",
+]
+
+# Fields which identify a series of versions of the same published file
+GROUP_FIELDS = ["project", "entity", "task", "name", "published_file_type"]
+
+
+def _entity_key(value):
+    if isinstance(value, dict):
+        return value.get("type"), value.get("id")
+    return value
+
+
+def publish_key(sg_data: dict | None) -> tuple | None:
+    """
+    Get the key identifying all versions of a published file
+
+    Args:
+        sg_data (dict | None): Published file data
+
+    Returns:
+        tuple | None: Group key or None if there is no published file
+    """
+    if not sg_data:
+        return None
+    return tuple(_entity_key(sg_data.get(field)) for field in GROUP_FIELDS)
+
+
+class LatestResolver:
+    """Resolve the latest published file of many breakdown items at once"""
+
+    def __init__(self, lookup, logger, group_size: int = 50, cache=None):
+        """
+        Args:
+            lookup (ShotgunLookup): Runs the queries on the ShotGrid connections
+            logger: Logger
+            group_size (int): Maximum number of publish groups per query
+            cache (LatestCache | None): Answers kept between sessions
+        """
+        self.lookup = lookup
+        self.logger = logger
+        self.group_size = group_size
+        self.cache = cache
+        self.query_count = 0
+        self._latest = {}
+        # Group data per key answered by a stale cache entry
+        self._stale = {}
+        # Cached answers from before this time are stale
+        self._expired = 0.0
+        # Query per publish key which is being answered right now
+        self._in_flight = {}
+        self._lock = threading.RLock()
+
+    def clear(self):
+        """Forget all resolved publishes"""
+        self._latest.clear()
+        self._stale.clear()
+
+    def expire(self):
+        """Treat all cached answers as stale, they're used until revalidated"""
+        self._expired = time.time()
+
+    def is_resolved(self, item) -> bool:
+        return item.key in self._latest
+
+    def latest(self, item, refresh: bool = False) -> dict:
+        """
+        Get the latest published file for an item, querying it if unresolved
+
+        Args:
+            item (PublishRecord): Published file of a path
+            refresh (bool): Query again even if the item was already resolved
+
+        Returns:
+            dict: Latest published file or an empty dict
+        """
+        key = item.key
+        if key is None:
+            return {}
+        if refresh or key not in self._latest:
+            self.resolve([item], refresh=refresh)
+        return self._latest.get(key) or {}
+
+    def resolve(
+        self, items: list, refresh: bool = False, use_stale: bool = True
+    ) -> dict:
+        """
+        Resolve the latest published file of all unresolved items
+
+        Items sharing a publish group are only queried once, and groups are
+        combined into as few queries as the group size allows. Cached answers
+        are used as is, the stale ones are collected for take_stale.
+
+        Args:
+            items (list[PublishRecord]): Published files of the paths
+            refresh (bool): Query again even if items were already resolved
+            use_stale (bool): Use stale cache answers until they're revalidated,
+                otherwise they're queried right away
+
+        Returns:
+            dict: Latest published file per publish key
+        """
+        groups = {}
+        for item in items:
+            key = item.key
+            if key is None or key in groups:
+                continue
+            if key in self._latest and not refresh:
+                if use_stale or key not in self._stale:
+                    continue
+            groups[key] = item.fields
+
+        if self.cache is not None and not refresh:
+            self.__from_cache(groups, use_stale)
+
+        found = self.query(groups)
+        self._latest.update(found)
+        if not use_stale:
+            for key in found:
+                self._stale.pop(key, None)
+        if self.cache is not None:
+            self.cache.put(found)
+
+        if groups:
+            self.logger.debug(
+                f"Resolved latest publishes for {len(groups)} group(s) "
+                f"in {self.query_count} query(s) so far"
+            )
+        return self._latest
+
+    def __from_cache(self, groups: dict, use_stale: bool = True):
+        """Answer groups from the cache, leaving the uncached groups to query"""
+        for key, (publish, fetched) in self.cache.get(list(groups)).items():
+            stale = fetched <= self._expired or not self.cache.is_fresh(fetched)
+            if stale and not use_stale:
+                continue
+            self._latest[key] = publish
+            sg_data = groups.pop(key)
+            if stale:
+                self._stale[key] = sg_data
+
+    def mark_stale(self, groups):
+        """
+        Revalidate the resolved latest versions of publish groups, e.g. for
+        nodes which aren't resolved again
+
+        Args:
+            groups (Iterable[PublishGroup]): Publish groups
+        """
+        for group in groups:
+            if group.key in self._latest:
+                self._stale[group.key] = group.fields
+
+    def take_stale(self) -> dict:
+        """
+        Get the groups answered by stale cache entries since the last call
+
+        Returns:
+            dict: Published file data per publish key, to pass to revalidate
+        """
+        stale, self._stale = self._stale, {}
+        return stale
+
+    def revalidate(self, groups: dict) -> dict:
+        """
+        Query groups again and update the cache, without changing what's resolved
+
+        Safe to call on a worker thread, pass the result to store on the main
+        thread.
+
+        Args:
+            groups (dict): Published file data per publish key
+
+        Returns:
+            dict: Latest published file or None per publish key
+        """
+        found = self.query(groups)
+        if self.cache is not None:
+            self.cache.put(found)
+        return found
+
+    def store(self, found: dict) -> set:
+        """
+        Replace resolved publishes with revalidated ones
+
+        Args:
+            found (dict): Latest published file or None per publish key
+
+        Returns:
+            set: Publish keys whose latest version changed
+        """
+        changed = set()
+        for key, publish in found.items():
+            previous = self._latest.get(key)
+            if (previous or {}).get("version_number") != (publish or {}).get(
+                "version_number"
+            ):
+                changed.add(key)
+            self._latest[key] = publish
+        return changed
+
+    def published_since(self, entities: list[dict], since) -> list[dict]:
+        """
+        Query the files published to entities after a point in time, in one query
+
+        Safe to call on a worker thread.
+
+        Args:
+            entities (list[dict]): Entities, e.g. the shots in the breakdown
+            since (datetime.datetime): Only files created after this time
+
+        Returns:
+            list[dict]: Published files
+        """
+        if not entities:
+            return []
+
+        self.query_count += 1
+        return self.lookup.find(
+            "PublishedFile",
+            [["entity", "in", entities], ["created_at", "greater_than", since]],
+            PUBLISH_FIELDS,
+        )
+
+    def newer(self, publishes: list[dict]) -> dict:
+        """
+        Get the publishes which are newer than the resolved latest versions
+
+        Groups which weren't resolved yet are skipped, they're queried once a
+        node needs them.
+
+        Args:
+            publishes (list[dict]): Published files
+
+        Returns:
+            dict: Newest published file per publish key
+        """
+        newer = {}
+        for publish in publishes:
+            key = publish_key(publish)
+            if key not in self._latest:
+                continue
+            current = newer.get(key) or self._latest[key] or {}
+            if (publish.get("version_number") or 0) > (
+                current.get("version_number") or 0
+            ):
+                newer[key] = publish
+        return newer
+
+    def query(self, groups: dict) -> dict:
+        """
+        Query the latest published files of groups in as few queries as possible
+
+        The queries run at the same time. Groups which are already being
+        queried, e.g. by a background refresh, wait for that query instead.
+        Safe to call on a worker thread.
+
+        Args:
+            groups (dict): Published file data per publish key
+
+        Returns:
+            dict: Latest published file or None per publish key
+        """
+        waiting = {}
+        with self._lock:
+            keys = []
+            for key in groups:
+                future = self._in_flight.get(key)
+                if future is None:
+                    keys.append(key)
+                else:
+                    waiting.setdefault(future, []).append(key)
+
+            for start in range(0, len(keys), self.group_size):
+                chunk = keys[start : start + self.group_size]
+                filters = [
+                    {
+                        "filter_operator": "all",
+                        "filters": [
+                            [field, "is", groups[key].get(field)]
+                            for field in GROUP_FIELDS
+                        ],
+                    }
+                    for key in chunk
+                ]
+                self.query_count += 1
+                future = self.lookup.submit(
+                    "PublishedFile",
+                    filters,
+                    PUBLISH_FIELDS,
+                    filter_operator="any",
+                )
+                for key in chunk:
+                    self._in_flight[key] = future
+                future.add_done_callback(
+                    lambda done, chunk=chunk: self.__landed(done, chunk)
+                )
+                waiting.setdefault(future, []).extend(chunk)
+
+        latest = {}
+        for future, chunk in waiting.items():
+            found = dict.fromkeys(chunk)
+            for publish in future.result():
+                key = publish_key(publish)
+                if key not in found:
+                    continue
+                current = found[key]
+                if current is None or (publish.get("version_number") or 0) > (
+                    current.get("version_number") or 0
+                ):
+                    found[key] = publish
+            latest.update(found)
+        return latest
+
+    def __landed(self, future, chunk: list):
+        with self._lock:
+            for key in chunk:
+                if self._in_flight.get(key) is future:
+                    del self._in_flight[key]
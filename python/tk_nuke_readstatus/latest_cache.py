@@ -0,0 +1,221 @@
+# MIT License
+
+# Copyright (c) 2025 MaximumFX
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS latest (
+    key TEXT PRIMARY KEY,
+    publish TEXT,
+    fetched REAL NOT NULL
+)
+"""
+
+# SQLite limits the number of parameters per statement
+_CHUNK_SIZE = 500
+
+
+def _serialize_key(key: tuple) -> str:
+    return json.dumps(key, separators=(",", ":"))
+
+
+def _deserialize_key(text: str) -> tuple:
+    return tuple(
+        tuple(value) if isinstance(value, list) else value
+        for value in json.loads(text)
+    )
+
+
+class LatestCache:
+    """
+    Latest published files per publish key, kept on disk between sessions
+
+    Several Nuke sessions can share the database. It runs in WAL mode, so
+    readers never wait for a writer, and every thread uses its own connection.
+    """
+
+    def __init__(self, path: str, ttl: float, logger):
+        """
+        Args:
+            path (str): Database path, e.g. in the app's cache location
+            ttl (float): Seconds an answer stays fresh
+            logger: Logger
+        """
+        self.path = path
+        self.ttl = ttl
+        self.logger = logger
+        self.enabled = True
+        self._local = threading.local()
+
+    def __connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(_SCHEMA)
+            self._local.connection = connection
+        return connection
+
+    def __disable(self, error: Exception):
+        self.logger.warning(f"Latest version cache {self.path} disabled: {error}")
+        self.enabled = False
+
+    def is_fresh(self, fetched: float) -> bool:
+        """
+        Check if an answer is young enough to use without asking again
+
+        Args:
+            fetched (float): Time the answer was queried
+
+        Returns:
+            bool: If the answer is younger than the TTL
+        """
+        return time.time() - fetched < self.ttl
+
+    def get(self, keys: list[tuple]) -> dict[tuple, tuple[dict | None, float]]:
+        """
+        Get the cached latest published files
+
+        Args:
+            keys (list[tuple]): Publish keys
+
+        Returns:
+            dict: (latest published file or None, time it was queried) per
+                cached key
+        """
+        if not self.enabled or not keys:
+            return {}
+
+        cached = {}
+        try:
+            connection = self.__connection()
+            texts = [_serialize_key(key) for key in keys]
+            for start in range(0, len(texts), _CHUNK_SIZE):
+                chunk = texts[start : start + _CHUNK_SIZE]
+                rows = connection.execute(
+                    "SELECT key, publish, fetched FROM latest "
+                    f"WHERE key IN ({','.join('?' * len(chunk))})",
+                    chunk,
+                )
+                for key, publish, fetched in rows:
+                    cached[_deserialize_key(key)] = (
+                        json.loads(publish) if publish else None,
+                        fetched,
+                    )
+        except (sqlite3.Error, OSError, ValueError) as error:
+            self.__disable(error)
+            return {}
+        return cached
+
+    def put(self, latest: dict[tuple, dict | None]):
+        """
+        Store freshly queried latest published files
+
+        Args:
+            latest (dict): Latest published file or None per publish key
+        """
+        if not self.enabled or not latest:
+            return
+
+        now = time.time()
+        try:
+            rows = [
+                (
+                    _serialize_key(key),
+                    json.dumps(publish, default=str) if publish else None,
+                    now,
+                )
+                for key, publish in latest.items()
+            ]
+            connection = self.__connection()
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                connection.executemany(
+                    "INSERT OR REPLACE INTO latest (key, publish, fetched) "
+                    "VALUES (?, ?, ?)",
+                    rows,
+                )
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+        except (sqlite3.Error, OSError, TypeError) as error:
+            self.__disable(error)
+
+    def invalidate(self, keys: list[tuple] | None = None):
+        """
+        Forget cached answers, e.g. after publishing a new version
+
+        Args:
+            keys (list[tuple] | None): Publish keys, or None to forget everything
+        """
+        if not self.enabled:
+            return
+
+        try:
+            connection = self.__connection()
+            if keys is None:
+                connection.execute("DELETE FROM latest")
+                return
+            texts = [_serialize_key(key) for key in keys]
+            for start in range(0, len(texts), _CHUNK_SIZE):
+                chunk = texts[start : start + _CHUNK_SIZE]
+                connection.execute(
+                    f"DELETE FROM latest WHERE key IN ({','.join('?' * len(chunk))})",
+                    chunk,
+                )
+        except (sqlite3.Error, OSError) as error:
+            self.__disable(error)
+
+    def prune(self, max_age: float):
+        """
+        Remove answers which are too old to be useful, even as stale answers
+
+        Args:
+            max_age (float): Seconds after which an answer is removed
+        """
+        if not self.enabled:
+            return
+
+        try:
+            self.__connection().execute(
+                "DELETE FROM latest WHERE fetched < ?", (time.time() - max_age,)
+            )
+        except (sqlite3.Error, OSError) as error:
+            self.__disable(error)
+
+    def close(self):
+        """Close the connection of the current thread"""
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
@@ -0,0 +1,260 @@
+# MIT License
+
+# Copyright (c) 2025 MaximumFX
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from __future__ import annotations
+
+import json
+import random
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable
+
+from .metrics import Metrics
+
+# HTTP status codes ShotGrid answers with when it's throttling or overloaded
+THROTTLE_CODES = (429, 502, 503, 504)
+
+
+def is_throttled(error: Exception) -> bool:
+    """
+    Check if a ShotGrid error means the request should be retried later
+
+    Args:
+        error (Exception): Error raised by the ShotGrid API
+
+    Returns:
+        bool: If the server is throttling or too busy to answer
+    """
+    if getattr(error, "errcode", None) in THROTTLE_CODES:
+        return True
+    message = str(error).lower()
+    return "rate limit" in message or "too many requests" in message
+
+
+def _request_key(entity_type: str, filters: list, fields, kwargs: dict) -> str:
+    return json.dumps(
+        [entity_type, filters, fields, kwargs], sort_keys=True, default=str
+    )
+
+
+class ShotgunLookup:
+    """
+    Run ShotGrid finds on a small pool of connections
+
+    Identical requests which are in flight at the same time are sent once and
+    share the records, so callers mustn't modify them. Throttled requests are
+    retried with an exponential backoff.
+    """
+
+    def __init__(
+        self,
+        connect: Callable,
+        logger,
+        max_connections: int = 4,
+        retries: int = 4,
+        backoff: float = 0.5,
+        max_backoff: float = 10.0,
+        metrics: Metrics | None = None,
+    ):
+        """
+        Args:
+            connect (Callable): Returns the ShotGrid connection of the current
+                thread, called once per pool thread
+            logger: Logger
+            max_connections (int): Maximum number of requests at the same time
+            retries (int): Attempts after a throttled request before giving up
+            backoff (float): Seconds to wait after the first throttled request,
+                doubled on every attempt
+            max_backoff (float): Maximum seconds to wait between attempts
+            metrics (Metrics | None): Timings and counts of the requests
+        """
+        self.connect = connect
+        self.logger = logger
+        self.max_connections = max(1, max_connections)
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.metrics = metrics or Metrics(logger)
+        self.query_count = 0
+        self.merged_count = 0
+        self.retry_count = 0
+
+        self._executor = None
+        self._pending = {}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def __connection(self):
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = self.connect()
+            self._local.connection = connection
+        return connection
+
+    def submit(
+        self, entity_type: str, filters: list, fields: list | None = None, **kwargs
+    ) -> Future:
+        """
+        Start a find, or join the identical one already in flight
+
+        Args:
+            entity_type (str): Entity type, e.g. PublishedFile
+            filters (list): Filters
+            fields (list | None): Fields to return
+            **kwargs: Other arguments of Shotgun.find, e.g. filter_operator
+
+        Returns:
+            Future: Records found
+        """
+        key = _request_key(entity_type, filters, fields, kwargs)
+        with self._lock:
+            future = self._pending.get(key)
+            if future is not None:
+                self.merged_count += 1
+            else:
+                future = self._pending[key] = Future()
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_connections,
+                        thread_name_prefix="tk-nuke-readstatus.shotgun",
+                    )
+                try:
+                    self._executor.submit(
+                        self.__run, key, future, entity_type, filters, fields, kwargs
+                    )
+                except RuntimeError as error:
+                    # The pool is shutting down, nobody may wait on the request
+                    del self._pending[key]
+                    future.set_exception(error)
+                    raise
+                return future
+
+        self.metrics.count("shotgun.merged")
+        return future
+
+    def find(
+        self, entity_type: str, filters: list, fields: list | None = None, **kwargs
+    ) -> list[dict]:
+        """
+        Find records and wait for them, see submit for the arguments
+
+        Returns:
+            list[dict]: Records found
+        """
+        return self.submit(entity_type, filters, fields, **kwargs).result()
+
+    def find_all(self, requests: list[tuple]) -> list[list[dict]]:
+        """
+        Run several finds at the same time and wait for all of them
+
+        Args:
+            requests (list[tuple]): Entity type, filters, fields and keyword
+                arguments per find
+
+        Returns:
+            list[list[dict]]: Records found per request, in the same order
+        """
+        futures = [
+            self.submit(entity_type, filters, fields, **kwargs)
+            for entity_type, filters, fields, kwargs in requests
+        ]
+        return [future.result() for future in futures]
+
+    def shutdown(self):
+        """Stop the pool threads once the requests in flight are done"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def __run(
+        self,
+        key: str,
+        future: Future,
+        entity_type: str,
+        filters: list,
+        fields: list | None,
+        kwargs: dict,
+    ):
+        try:
+            result = self.__find(entity_type, filters, fields, kwargs)
+        except BaseException as error:
+            with self._lock:
+                self._pending.pop(key, None)
+            future.set_exception(error)
+        else:
+            with self._lock:
+                self._pending.pop(key, None)
+            future.set_result(result)
+
+    def __find(
+        self, entity_type: str, filters: list, fields: list | None, kwargs: dict
+    ) -> list[dict]:
+        with self._lock:
+            self.query_count += 1
+        with self.metrics.time("shotgun.find"):
+            return self.retry(
+                lambda: self.__connection().find(entity_type, filters, fields, **kwargs)
+            )
+
+    def retry(self, call: Callable, *args, **kwargs):
+        """
+        Call a ShotGrid function on the current thread, retrying while throttled
+
+        Args:
+            call (Callable): Function querying ShotGrid, e.g. find_publish
+            *args: Arguments of the function
+            **kwargs: Keyword arguments of the function
+
+        Returns:
+            Result of the function
+        """
+        attempt = 0
+        while True:
+            try:
+                return call(*args, **kwargs)
+            except Exception as error:
+                if attempt >= self.retries or not is_throttled(error):
+                    raise
+                delay = self.__delay(error, attempt)
+                attempt += 1
+                with self._lock:
+                    self.retry_count += 1
+                self.metrics.count("shotgun.retries")
+                self.logger.debug(
+                    f"ShotGrid is throttling, retrying in {delay:.2f}s: {error}"
+                )
+                time.sleep(delay)
+
+    def __delay(self, error: Exception, attempt: int) -> float:
+        """Get the seconds to wait, the server's Retry-After header wins"""
+        headers = getattr(error, "headers", None) or {}
+        try:
+            retry_after = float(headers.get("Retry-After"))
+        except (AttributeError, TypeError, ValueError):
+            retry_after = None
+        if retry_after is not None:
+            return min(retry_after, self.max_backoff)
+
+        # Full jitter, so pool threads throttled together don't retry together
+        return random.uniform(0, min(self.backoff * 2**attempt, self.max_backoff))
@@ -0,0 +1,167 @@
+# MIT License
+
+# Copyright (c) 2025 MaximumFX
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from __future__ import annotations
+
+import os
+
+from .index import normalize_path
+from .matcher import static_prefix
+
+
+class TemplateMapping:
+    """One direction of a work/publish mapping"""
+
+    __slots__ = ("source_key", "source", "target", "remap", "prefix")
+
+    def __init__(self, source_key: str, source, target, remap: list, prefix):
+        """
+        Args:
+            source_key (str): Name of the template to switch from
+            source (TemplatePath): Template to switch from
+            target (TemplatePath): Template to switch to
+            remap (list[tuple[str, str]]): Source field and target field pairs
+            prefix (str | None): Static start of the source template's paths
+        """
+        self.source_key = source_key
+        self.source = source
+        self.target = target
+        self.remap = remap
+        self.prefix = prefix
+
+
+class MappingIndex:
+    """Compiled work_publish_mappings setting with first-match-wins lookups"""
+
+    def __init__(self, mappings: list[dict], templates, logger, metrics=None):
+        """
+        Args:
+            mappings (list[dict]): Work and publish template names, and the
+                fields to map from work to publish
+            templates: Template lookup, e.g. tk.templates
+            logger: Logger
+            metrics (Metrics | None): Counts the template validations
+        """
+        self.logger = logger
+        self.metrics = metrics
+        self._to_publish = []
+        self._to_work = []
+
+        for mapping in mappings or []:
+            work_key = mapping.get("work")
+            publish_key = mapping.get("publish")
+            work = templates.get(work_key)
+            publish = templates.get(publish_key)
+            if work is None or publish is None:
+                self.logger.warning(
+                    f'Mapping from "{work_key}" to "{publish_key}" uses a template '
+                    "which does not exist"
+                )
+                continue
+
+            # Work field and publish field pairs
+            fields = list((mapping.get("fields") or {}).items())
+            self._to_publish.append(
+                TemplateMapping(work_key, work, publish, fields, static_prefix(work))
+            )
+            self._to_work.append(
+                TemplateMapping(
+                    publish_key,
+                    publish,
+                    work,
+                    [(target, source) for source, target in fields],
+                    static_prefix(publish),
+                )
+            )
+
+    def __len__(self) -> int:
+        return len(self._to_publish)
+
+    def switch(self, file_path: str, to_publish: bool) -> str | None:
+        """
+        Get the counterpart of a path from the first mapping its template matches
+
+        Args:
+            file_path (str): File path
+            to_publish (bool): Switch from work to publish instead of back
+
+        Returns:
+            str | None: Switched path or None if no mapping matches
+        """
+        key = normalize_path(file_path)
+        prefix_key = key.lower() if os.name == "nt" else key
+        for mapping in self._to_publish if to_publish else self._to_work:
+            if mapping.prefix is not None and not prefix_key.startswith(
+                mapping.prefix
+            ):
+                continue
+            if self.metrics is not None:
+                self.metrics.count(f"validate.{mapping.source_key}")
+            fields = mapping.source.validate_and_get_fields(file_path)
+            if not fields:
+                continue
+
+            for source_field, target_field in mapping.remap:
+                fields[target_field] = fields.get(source_field)
+            return mapping.target.apply_fields(fields).replace(os.sep, "/")
+        return None
+
+    def switch_paths(self, file_paths: list, to_publish: bool) -> dict:
+        """
+        Get the counterparts of paths
+
+        Args:
+            file_paths (list[str]): File paths
+            to_publish (bool): Switch from work to publish instead of back
+
+        Returns:
+            dict: Switched path per file path, without the paths no mapping
+                matches
+        """
+        new_paths = {}
+        for file_path in file_paths:
+            new_path = self.switch(file_path, to_publish)
+            if new_path is None:
+                self.logger.debug(f'Can\'t switch "{file_path}", no mapping defined')
+            else:
+                new_paths[file_path] = new_path
+        return new_paths
+
+
+def format_switches(switches: list, limit: int = 20) -> str:
+    """
+    Describe planned path switches for the user
+
+    Args:
+        switches (list[tuple[str, str, str]]): Node name, current path and new
+            path
+        limit (int): Maximum number of nodes to list
+
+    Returns:
+        str: Report
+    """
+    lines = [f"{len(switches)} node(s) will be switched:"]
+    for node_name, file_path, new_path in switches[:limit]:
+        lines.append(f"{node_name}: {file_path} -> {new_path}")
+    if len(switches) > limit:
+        lines.append(f"... and {len(switches) - limit} more")
+    return "\n".join(lines)
@@ -0,0 +1,268 @@
+# MIT License
+
+# Copyright (c) 2025 MaximumFX
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from __future__ import annotations
+
+import os
+import re
+import threading
+from collections import OrderedDict
+from typing import Callable
+
+from .index import normalize_path
+from .models import Status
+
+
+class SubstringAutomaton:
+    """Aho-Corasick automaton finding all patterns in a string in one pass"""
+
+    def __init__(self, patterns: list[str]):
+        """
+        Args:
+            patterns (list[str]): Patterns to search for
+        """
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [frozenset()]
+        self._always = frozenset(
+            index for index, pattern in enumerate(patterns) if not pattern
+        )
+
+        for index, pattern in enumerate(patterns):
+            if not pattern:
+                continue
+            state = 0
+            for char in pattern:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(frozenset())
+                    self._goto[state][char] = next_state
+                state = next_state
+            self._out[state] = self._out[state] | {index}
+
+        queue = list(self._goto[0].values())
+        while queue:
+            state = queue.pop(0)
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(char, 0)
+                self._out[next_state] = (
+                    self._out[next_state] | self._out[self._fail[next_state]]
+                )
+
+    def search(self, text: str) -> set[int]:
+        """
+        Find the patterns occurring in a string
+
+        Args:
+            text (str): String to search
+
+        Returns:
+            set[int]: Indices of the patterns found
+        """
+        found = set(self._always)
+        goto = self._goto
+        fail = self._fail
+        out = self._out
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if out[state]:
+                found.update(out[state])
+        return found
+
+
+class StatusCandidate:
+    """Static result of matching one status against a path"""
+
+    __slots__ = ("status", "str_match", "templates")
+
+    def __init__(self, status: Status, str_match: bool, templates: list):
+        """
+        Args:
+            status (Status): Status
+            str_match (bool): If one of the status' strings is in the path
+            templates (list): (template, fields) of every validating template
+        """
+        self.status = status
+        self.str_match = str_match
+        self.templates = templates
+
+
+def static_prefix(template) -> str | None:
+    """Get the part of a template's path before the first key or optional"""
+    root_path = getattr(template, "root_path", None)
+    definition = getattr(template, "definition", None)
+    if not root_path or definition is None:
+        return None
+
+    static = re.split(r"[{\[]", definition, maxsplit=1)[0]
+    prefix = normalize_path(os.path.join(root_path, static))
+    return prefix.lower() if os.name == "nt" else prefix
+
+
+class StatusMatcher:
+    """Compiled statuses setting with first-match-wins lookups per path"""
+
+    def __init__(
+        self,
+        statuses: list[Status],
+        templates,
+        logger,
+        size: int = 10000,
+        metrics=None,
+    ):
+        """
+        Args:
+            statuses (list[Status]): Statuses in order of priority
+            templates: Template lookup, e.g. tk.templates
+            logger: Logger
+            size (int): Maximum number of paths to remember
+            metrics (Metrics | None): Counts the template validations
+        """
+        self.statuses = statuses
+        self.logger = logger
+        self.size = size
+        self.metrics = metrics
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+        patterns = []
+        self._pattern_statuses = []
+        pattern_indices = {}
+        for status_index, status in enumerate(statuses):
+            for str_include in status.str_include or []:
+                pattern = normalize_path(str_include)
+                if pattern not in pattern_indices:
+                    pattern_indices[pattern] = len(patterns)
+                    patterns.append(pattern)
+                    self._pattern_statuses.append(set())
+                self._pattern_statuses[pattern_indices[pattern]].add(status_index)
+        self._automaton = SubstringAutomaton(patterns)
+
+        # (template key, template, static prefix) per status
+        self._templates = []
+        for status in statuses:
+            status_templates = []
+            for template_key in status.template_match or []:
+                template = templates.get(template_key)
+                if template is None:
+                    self.logger.warning(f'Template "{template_key}" does not exist')
+                    continue
+                status_templates.append(
+                    (template_key, template, static_prefix(template))
+                )
+            self._templates.append(status_templates)
+
+    def clear(self):
+        """Forget all matched paths"""
+        with self._lock:
+            self._cache.clear()
+
+    def candidates(self, file_path: str) -> list[StatusCandidate]:
+        """
+        Get the statuses which can match a path, up to the first certain match
+
+        Args:
+            file_path (str): File path
+
+        Returns:
+            list[StatusCandidate]: Candidates in order of priority
+        """
+        key = normalize_path(file_path)
+        with self._lock:
+            candidates = self._cache.get(key)
+            if candidates is not None:
+                self._cache.move_to_end(key)
+                return candidates
+
+        candidates = self.__compile_candidates(file_path, key)
+        with self._lock:
+            self._cache[key] = candidates
+            if len(self._cache) > self.size:
+                self._cache.popitem(last=False)
+        return candidates
+
+    def __compile_candidates(self, file_path: str, key: str) -> list:
+        str_matches = set()
+        for pattern_index in self._automaton.search(key):
+            str_matches.update(self._pattern_statuses[pattern_index])
+
+        prefix_key = key.lower() if os.name == "nt" else key
+        candidates = []
+        for status_index, status in enumerate(self.statuses):
+            templates = []
+            for template_key, template, prefix in self._templates[status_index]:
+                if prefix is not None and not prefix_key.startswith(prefix):
+                    continue
+                if self.metrics is not None:
+                    self.metrics.count(f"validate.{template_key}")
+                if not template.validate(file_path):
+                    continue
+                fields = template.get_fields(file_path) if status.latest else None
+                templates.append((template, fields))
+
+            str_match = status_index in str_matches
+            if not str_match and not templates:
+                continue
+
+            candidates.append(StatusCandidate(status, str_match, templates))
+            if not status.latest or not templates:
+                # Nothing dynamic left, this status always matches
+                break
+        return candidates
+
+    def match(
+        self, file_path: str, latest_version: Callable[[str], int | None]
+    ) -> Status | None:
+        """
+        Get the first status matching a path
+
+        Args:
+            file_path (str): File path
+            latest_version (Callable): Returns the latest published version
+                number of a path, or None if the path isn't published
+
+        Returns:
+            Status | None: Matching status
+        """
+        for candidate in self.candidates(file_path):
+            found_match = candidate.str_match
+            for template, fields in candidate.templates:
+                if candidate.status.latest:
+                    latest = latest_version(file_path)
+                    if latest is not None:
+                        found_match = fields.get("version", -1) == latest
+                else:
+                    found_match = True
+
+            if found_match:
+                return candidate.status
+        return None
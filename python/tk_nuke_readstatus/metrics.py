@@ -0,0 +1,263 @@
+# MIT License
+
+# Copyright (c) 2025 MaximumFX
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from __future__ import annotations
+
+import contextlib
+import datetime
+import getpass
+import json
+import os
+import socket
+import threading
+import time
+from collections import Counter
+
+
+class _Phase:
+    __slots__ = ("calls", "total", "longest")
+
+    def __init__(self):
+        self.calls = 0
+        self.total = 0.0
+        self.longest = 0.0
+
+    def add(self, seconds: float):
+        self.calls += 1
+        self.total += seconds
+        if seconds > self.longest:
+            self.longest = seconds
+
+    def to_dict(self) -> dict:
+        return {
+            "calls": self.calls,
+            "total": round(self.total, 6),
+            "longest": round(self.longest, 6),
+        }
+
+
+class _Timer:
+    __slots__ = ("metrics", "phase", "start")
+
+    def __init__(self, metrics: Metrics, phase: str):
+        self.metrics = metrics
+        self.phase = phase
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.metrics.record(self.phase, time.perf_counter() - self.start)
+
+
+class Metrics:
+    """Timings and counts of the app's phases, e.g. to find out why a script is slow"""
+
+    def __init__(
+        self,
+        logger,
+        slow_threshold: float = 1.0,
+        file_path: str | None = None,
+    ):
+        """
+        Args:
+            logger: Logger
+            slow_threshold (float): Seconds after which a call is logged as slow
+            file_path (str | None): JSON-lines file to append every event to
+        """
+        self.logger = logger
+        self.slow_threshold = slow_threshold
+        self.file_path = os.path.expandvars(os.path.expanduser(file_path or ""))
+        self.started = datetime.datetime.now()
+
+        self._phases = {}
+        self._counters = Counter()
+        self._events = Counter()
+        self._event = None
+        self._lock = threading.Lock()
+
+    def reset(self):
+        """Forget all timings and counts"""
+        with self._lock:
+            self._phases.clear()
+            self._counters.clear()
+            self._events.clear()
+            self.started = datetime.datetime.now()
+
+    def time(self, phase: str) -> _Timer:
+        """
+        Time a phase
+
+        Args:
+            phase (str): Phase name, e.g. "breakdown.scan_scene"
+
+        Returns:
+            _Timer: Context manager recording the time spent in it
+        """
+        return _Timer(self, phase)
+
+    def record(self, phase: str, seconds: float):
+        """
+        Add the duration of a call to a phase
+
+        Args:
+            phase (str): Phase name
+            seconds (float): Duration
+        """
+        with self._lock:
+            targets = [self._phases]
+            if self._event is not None:
+                targets.append(self._event["phases"])
+            for phases in targets:
+                timing = phases.get(phase)
+                if timing is None:
+                    timing = phases[phase] = _Phase()
+                timing.add(seconds)
+
+        if seconds >= self.slow_threshold:
+            self.count(f"slow.{phase}")
+            self.logger.warning(f"Slow {phase}: {seconds:.3f}s")
+
+    def count(self, counter: str, amount: int = 1):
+        """
+        Increase a counter
+
+        Args:
+            counter (str): Counter name, e.g. "validate.nuke_shot_render_pub"
+            amount (int): Amount to add
+        """
+        with self._lock:
+            self._counters[counter] += amount
+            if self._event is not None:
+                self._event["counters"][counter] += amount
+
+    @contextlib.contextmanager
+    def event(self, name: str, **data):
+        """
+        Time a user facing event and collect the phases and counts during it
+
+        The event is written to the metrics file when it ends. Events don't
+        nest, an event inside another one only adds to the outer event.
+
+        Args:
+            name (str): Event name, e.g. "check_script"
+            **data: Extra fields for the metrics file
+
+        Yields:
+            dict: Extra fields, which can be added to during the event
+        """
+        with self._lock:
+            outer = self._event is not None
+            if not outer:
+                self._event = {"phases": {}, "counters": Counter()}
+
+        start = time.perf_counter()
+        try:
+            yield data
+        finally:
+            seconds = time.perf_counter() - start
+            self.record(name, seconds)
+            with self._lock:
+                self._events[name] += 1
+                event = None if outer else self._event
+                if not outer:
+                    self._event = None
+
+            if event is not None:
+                self.write(
+                    dict(
+                        data,
+                        event=name,
+                        seconds=round(seconds, 6),
+                        phases={
+                            phase: timing.to_dict()
+                            for phase, timing in event["phases"].items()
+                        },
+                        counters=dict(event["counters"]),
+                    )
+                )
+
+    def write(self, record: dict):
+        """
+        Append a record to the metrics file, if there is one
+
+        Args:
+            record (dict): JSON serializable record
+        """
+        if not self.file_path:
+            return
+
+        record = dict(
+            record,
+            time=datetime.datetime.now().isoformat(timespec="seconds"),
+            host=socket.gethostname(),
+            user=getpass.getuser(),
+        )
+        try:
+            directory = os.path.dirname(self.file_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.file_path, "a", encoding="utf-8") as metrics_file:
+                metrics_file.write(json.dumps(record, default=str) + "\n")
+        except OSError as error:
+            self.logger.warning(f"Can't write metrics to {self.file_path}: {error}")
+            self.file_path = ""
+
+    def to_dict(self) -> dict:
+        """
+        Get all timings and counts
+
+        Returns:
+            dict: Phases, counters and events since the start or last reset
+        """
+        with self._lock:
+            return {
+                "since": self.started.isoformat(timespec="seconds"),
+                "phases": {
+                    phase: timing.to_dict() for phase, timing in self._phases.items()
+                },
+                "counters": dict(self._counters),
+                "events": dict(self._events),
+            }
+
+    def summary(self) -> str:
+        """
+        Get a readable summary of all timings and counts
+
+        Returns:
+            str: Summary, slowest phases first
+        """
+        data = self.to_dict()
+        lines = [f"Since {data['since']}", "", "Phase: calls, total, longest"]
+        for phase, timing in sorted(
+            data["phases"].items(), key=lambda item: -item[1]["total"]
+        ):
+            lines.append(
+                f"{phase}: {timing['calls']}, {timing['total']:.3f}s, "
+                f"{timing['longest']:.3f}s"
+            )
+        if data["counters"]:
+            lines += ["", "Counter: count"]
+            for counter, count in sorted(data["counters"].items()):
+                lines.append(f"{counter}: {count}")
+        return "\n".join(lines)
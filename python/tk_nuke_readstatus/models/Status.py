@@ -19,3 +19,52 @@
 #  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 #  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 #  SOFTWARE.
+
+from __future__ import annotations
+
+
+class Icon:
+    name: str
+    scale: float
+    offset_x: float
+    offset_y: float
+
+    def __init__(
+        self,
+        name: str,
+        scale: float,
+        offset_x: float,
+        offset_y: float,
+    ):
+        self.name = name
+        self.scale = scale
+        self.offset_x = offset_x
+        self.offset_y = offset_y
+
+    @staticmethod
+    def from_dict(data: dict):
+        return Icon(
+            data.get("name"),
+            data.get("scale", 0.5),
+            data.get("offsetX", 84),
+            data.get("offsetY", 0),
+        )
+
+
+class Status:
+    icon: Icon
+    match_both: bool
+    latest: bool = False
+    str_include: list[str] = []
+    template_match: list = []
+
+    @staticmethod
+    def from_dict(data: dict):
+        status = Status()
+        status.icon = Icon.from_dict(data.get("icon", {}))
+        status.match_both = data.get("match_both")
+        status.latest = data.get("latest", False)
+        status.str_include = data.get("str_include", [])
+        status.template_match = data.get("template_match", [])
+
+        return status
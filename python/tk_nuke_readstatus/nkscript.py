@@ -0,0 +1,210 @@
+# MIT License
+
+# Copyright (c) 2025 MaximumFX
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Streaming reader for the file knobs in .nk scripts, without Nuke"""
+
+from __future__ import annotations
+
+import re
+from typing import Iterable, Iterator
+
+from .nodes import file_knob_for_class
+
+_NODE_START = re.compile(r"^\s*([A-Za-z_][\w.]*) \{\s*$")
+_KEEP_KNOBS = ("name", "first", "last")
+
+
+class NkFileNode:
+    """File node found in a .nk script"""
+
+    __slots__ = ("name", "node_class", "knob", "file_path", "first", "last")
+
+    def __init__(
+        self,
+        name: str,
+        node_class: str,
+        knob: str,
+        file_path: str,
+        first: int | None = None,
+        last: int | None = None,
+    ):
+        self.name = name
+        self.node_class = node_class
+        self.knob = knob
+        self.file_path = file_path
+        self.first = first
+        self.last = last
+
+    @property
+    def frame_range(self) -> tuple[int, int] | None:
+        if self.first is None or self.last is None:
+            return None
+        return self.first, self.last
+
+
+def _brace_depth(text: str) -> int:
+    """Get the change in brace depth of a line, skipping quoted and escaped braces"""
+    depth = 0
+    quoted = False
+    escaped = False
+    for char in text:
+        if escaped:
+            escaped = False
+        elif char == "\\":
+            escaped = True
+        elif char == '"':
+            quoted = not quoted
+        elif not quoted:
+            if char == "{":
+                depth += 1
+            elif char == "}":
+                depth -= 1
+    return depth
+
+
+def unquote(value: str) -> str:
+    """
+    Get the plain value of a knob as written in a .nk script
+
+    Args:
+        value (str): Quoted, braced or bare value
+
+    Returns:
+        str: Value
+    """
+    value = value.strip()
+    if len(value) >= 2 and value[0] == value[-1] == '"':
+        return re.sub(r"\\(.)", r"\1", value[1:-1])
+    if len(value) >= 2 and value[0] == "{" and value[-1] == "}":
+        return value[1:-1].strip()
+    return value
+
+
+def _to_int(value: str | None) -> int | None:
+    if value is None:
+        return None
+    try:
+        return int(float(unquote(value)))
+    except ValueError:
+        return None
+
+
+def _file_node(node_class: str, knobs: dict, group: list) -> NkFileNode | None:
+    knob_name = file_knob_for_class(node_class)
+    if knob_name == "":
+        return None
+
+    if knob_name is None:
+        # Generic node, use the first knob named like a file holding a path
+        knob_name = next(
+            (
+                name
+                for name, value in knobs.items()
+                if "file" in name and ("/" in value or "\\" in value)
+            ),
+            None,
+        )
+        if knob_name is None:
+            return None
+
+    name = unquote(knobs.get("name", node_class))
+    return NkFileNode(
+        ".".join(group + [name]),
+        node_class,
+        knob_name,
+        unquote(knobs.get(knob_name, "")),
+        _to_int(knobs.get("first")),
+        _to_int(knobs.get("last")),
+    )
+
+
+def iter_file_nodes(lines: Iterable[str]) -> Iterator[NkFileNode]:
+    """
+    Find the file nodes in the lines of a .nk script
+
+    Only the knobs needed to check a node are kept, so memory use doesn't grow
+    with the size of the script.
+
+    Args:
+        lines (Iterable[str]): Lines of the script, e.g. an open file
+
+    Yields:
+        NkFileNode: File nodes in the order they appear
+    """
+    group = []
+    node_class = None
+    knobs = {}
+    skip_depth = 0
+
+    for line in lines:
+        if skip_depth:
+            # Inside a multi-line value nobody asked for
+            skip_depth += _brace_depth(line)
+            continue
+
+        if node_class is None:
+            stripped = line.strip()
+            if stripped == "end_group":
+                if group:
+                    group.pop()
+                continue
+            match = _NODE_START.match(line)
+            if match:
+                node_class = match.group(1)
+                knobs = {}
+            else:
+                skip_depth = max(_brace_depth(line), 0)
+            continue
+
+        stripped = line.strip()
+        if stripped == "}":
+            if node_class.endswith("Group"):
+                group.append(unquote(knobs.get("name", node_class)))
+            elif node_class != "Root":
+                file_node = _file_node(node_class, knobs, group)
+                if file_node is not None:
+                    yield file_node
+            node_class = None
+            knobs = {}
+            continue
+
+        knob, _, value = stripped.partition(" ")
+        depth = _brace_depth(value)
+        if depth > 0:
+            skip_depth = depth
+            continue
+        if knob in _KEEP_KNOBS or "file" in knob:
+            knobs.setdefault(knob, value)
+
+
+def read_file_nodes(path: str) -> Iterator[NkFileNode]:
+    """
+    Find the file nodes in a .nk script on disk
+
+    Args:
+        path (str): Script path
+
+    Yields:
+        NkFileNode: File nodes in the order they appear
+    """
+    with open(path, encoding="utf-8", errors="replace") as script:
+        yield from iter_file_nodes(script)
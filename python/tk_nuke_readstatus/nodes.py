@@ -0,0 +1,117 @@
+# MIT License
+
+# Copyright (c) 2025 MaximumFX
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from __future__ import annotations
+
+
+def file_knob_for_class(node_class: str) -> str | None:
+    """
+    Get the file knob of the node classes known by name
+
+    Args:
+        node_class (str): Node class
+
+    Returns:
+        str | None: Knob name, an empty string if the class has no file knob or
+            None if the class isn't known by name
+    """
+    if "Write" in node_class or "Group" in node_class:
+        return ""
+
+    if "Camera4" in node_class:
+        return "file"
+    if "Camera" in node_class:
+        return "file_link"
+    if "Vectorfield" in node_class:
+        return "vfield_file"
+    if "Read" in node_class:
+        return "file"
+    return None
+
+
+class FileKnobRegistry:
+    """
+    Node class to file knob lookup
+
+    Classes known by name or configured keep their knob name. Other classes
+    can hold a file in a user knob, which belongs to a single node, so their
+    nodes are checked one by one. The last knob found for a class is tried
+    first.
+    """
+
+    def __init__(self, known: dict | None = None):
+        """
+        Args:
+            known (dict | None): Knob name per node class, an empty string marks
+                a class without a file knob
+        """
+        self._knobs = dict(known or {})
+        # Last file knob found per class without a fixed knob
+        self._candidates = {}
+
+    def knob_name(self, node) -> str | None:
+        """
+        Get the name of a node's file knob
+
+        Args:
+            node (nuke.Node): Nuke node
+
+        Returns:
+            str | None: Knob name or None if this isn't a file node
+        """
+        knob = self.knob(node)
+        return knob.name() if knob is not None else None
+
+    def knob(self, node):
+        """
+        Get a node's file knob
+
+        Args:
+            node (nuke.Node): Nuke node
+
+        Returns:
+            nuke.Knob | None: File knob or None if this isn't a file node
+        """
+        node_class = node.Class()
+        knob_name = self._knobs.get(node_class)
+        if knob_name is None:
+            knob_name = file_knob_for_class(node_class)
+            if knob_name is not None:
+                self._knobs[node_class] = knob_name
+        if knob_name is not None:
+            return node.knob(knob_name) if knob_name else None
+
+        candidate = self._candidates.get(node_class)
+        if candidate is not None:
+            knob = node.knob(candidate)
+            if _is_file_knob(candidate, knob):
+                return knob
+
+        for knob_name, knob in node.knobs().items():
+            if _is_file_knob(knob_name, knob):
+                self._candidates[node_class] = knob_name
+                return knob
+        return None
+
+
+def _is_file_knob(knob_name: str, knob) -> bool:
+    return knob is not None and "file" in knob_name and isinstance(knob.value(), str)
@@ -0,0 +1,391 @@
+# MIT License
+
+# Copyright (c) 2025 MaximumFX
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Dockable panel listing the statuses of all file nodes"""
+
+from __future__ import annotations
+
+import nuke
+from sgtk.platform.qt import QtCore, QtGui
+
+from .disk import MISSING
+
+COLUMNS = ("Node", "Status", "Version", "Latest", "Disk", "Path")
+NODE, STATUS, VERSION, LATEST, DISK, PATH = range(len(COLUMNS))
+
+# Role holding the value to sort a cell by
+SORT_ROLE = QtCore.Qt.UserRole + 1
+
+FILTERS = ("All", "Outdated", "Out of pipe", "Missing on disk")
+
+
+def _status_name(classification) -> str:
+    if classification.status is not None:
+        return classification.status.icon.name
+    if classification.out_of_pipe:
+        return "out of pipe"
+    return ""
+
+
+class NodeStatusModel(QtCore.QAbstractTableModel):
+    """
+    Table model over a NodeStatusIndex
+
+    Changes are collected and applied once control returns to the event loop,
+    so checking thousands of nodes adds their rows in one go and a re-checked
+    node only updates its own row.
+    """
+
+    def __init__(self, node_statuses, get_icon_path, parent=None):
+        """
+        Args:
+            node_statuses (NodeStatusIndex): Statuses to show
+            get_icon_path (Callable): Returns the path of an icon
+            parent (QtCore.QObject | None): Parent
+        """
+        super().__init__(parent)
+        self.node_statuses = node_statuses
+        self.get_icon_path = get_icon_path
+        self._icons = {}
+
+        self._names = [status.node_name for status in node_statuses]
+        self._rows = {name: row for row, name in enumerate(self._names)}
+        self._pending = set()
+
+        self._flush_timer = QtCore.QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.timeout.connect(self.flush)
+        node_statuses.add_listener(self.__on_status)
+
+    def close(self):
+        """Stop following the index"""
+        self._flush_timer.stop()
+        self.node_statuses.remove_listener(self.__on_status)
+
+    def rowCount(self, parent=QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._names)
+
+    def columnCount(self, parent=QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(COLUMNS)
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        if orientation == QtCore.Qt.Horizontal and role == QtCore.Qt.DisplayRole:
+            return COLUMNS[section]
+        return None
+
+    def node_status(self, row: int):
+        """
+        Get the status shown in a row
+
+        Args:
+            row (int): Row of this model
+
+        Returns:
+            NodeStatus | None: Status or None if the node was just removed
+        """
+        return self.node_statuses.get(self._names[row])
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        node_status = self.node_status(index.row())
+        if node_status is None:
+            return None
+
+        classification = node_status.classification
+        column = index.column()
+        if role in (QtCore.Qt.DisplayRole, SORT_ROLE):
+            if column == NODE:
+                return node_status.node_name
+            if column == STATUS:
+                return _status_name(classification)
+            if column == VERSION:
+                version = classification.version
+                if role == SORT_ROLE:
+                    return version if version is not None else -1
+                return "" if version is None else str(version)
+            if column == LATEST:
+                latest = classification.latest_version
+                if role == SORT_ROLE:
+                    return latest if latest is not None else -1
+                return "" if latest is None else str(latest)
+            if column == DISK:
+                return classification.disk or ""
+            if column == PATH:
+                return classification.file_path
+        elif role == QtCore.Qt.DecorationRole and column == STATUS:
+            return self.__icon(classification.icon)
+        elif role == QtCore.Qt.ToolTipRole and column == PATH:
+            return classification.file_path
+        elif role == QtCore.Qt.ForegroundRole and classification.outdated:
+            return QtGui.QColor(230, 150, 60)
+        return None
+
+    def __icon(self, icon):
+        if icon is None:
+            return None
+        qicon = self._icons.get(icon.name)
+        if qicon is None:
+            qicon = QtGui.QIcon(self.get_icon_path(icon))
+            self._icons[icon.name] = qicon
+        return qicon
+
+    def __on_status(self, node_name: str | None):
+        if node_name is None:
+            # The index was cleared, e.g. when the script was closed
+            self._flush_timer.stop()
+            self._pending.clear()
+            self.beginResetModel()
+            self._names = []
+            self._rows = {}
+            self.endResetModel()
+            return
+
+        try:
+            active = self._flush_timer.isActive()
+        except RuntimeError:
+            # The panel was deleted without being closed
+            self.node_statuses.remove_listener(self.__on_status)
+            return
+        self._pending.add(node_name)
+        if not active:
+            self._flush_timer.start(0)
+
+    def flush(self):
+        """Apply the changes to the index since the last flush"""
+        self._flush_timer.stop()
+        pending, self._pending = self._pending, set()
+
+        added = []
+        changed = []
+        removed = []
+        for node_name in pending:
+            row = self._rows.get(node_name)
+            if self.node_statuses.get(node_name) is None:
+                if row is not None:
+                    removed.append(row)
+            elif row is None:
+                added.append(node_name)
+            else:
+                changed.append(node_name)
+
+        if removed:
+            self.__remove_rows(removed)
+
+        for node_name in changed:
+            row = self._rows.get(node_name)
+            if row is not None:
+                self.dataChanged.emit(
+                    self.index(row, 0), self.index(row, len(COLUMNS) - 1)
+                )
+
+        if added:
+            first = len(self._names)
+            self.beginInsertRows(QtCore.QModelIndex(), first, first + len(added) - 1)
+            for node_name in added:
+                self._rows[node_name] = len(self._names)
+                self._names.append(node_name)
+            self.endInsertRows()
+
+    def __remove_rows(self, rows: list[int]):
+        """
+        Remove rows in contiguous ranges from the bottom up, so the selection
+        and other persistent indexes stay on the nodes they were on
+
+        Args:
+            rows (list[int]): Rows of this model
+        """
+        for row in rows:
+            del self._rows[self._names[row]]
+
+        rows = sorted(rows, reverse=True)
+        start = 0
+        while start < len(rows):
+            end = start
+            while end + 1 < len(rows) and rows[end + 1] == rows[end] - 1:
+                end += 1
+            first, last = rows[end], rows[start]
+            self.beginRemoveRows(QtCore.QModelIndex(), first, last)
+            del self._names[first : last + 1]
+            self.endRemoveRows()
+            start = end + 1
+
+        # The rows below the first removed one moved up
+        for row in range(rows[-1], len(self._names)):
+            self._rows[self._names[row]] = row
+
+
+class NodeStatusFilter(QtGui.QSortFilterProxyModel):
+    """Filter the rows by kind of problem and by text in the node name or path"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._kind = FILTERS[0]
+        self._text = ""
+        self.setSortRole(SORT_ROLE)
+        self.setDynamicSortFilter(True)
+
+    def set_kind(self, kind: str):
+        """
+        Args:
+            kind (str): One of FILTERS
+        """
+        self._kind = kind
+        self.invalidateFilter()
+
+    def set_text(self, text: str):
+        """
+        Args:
+            text (str): Text which has to be in the node name or path
+        """
+        self._text = text.lower()
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row: int, source_parent) -> bool:
+        node_status = self.sourceModel().node_status(source_row)
+        if node_status is None:
+            return False
+
+        classification = node_status.classification
+        if self._kind == "Outdated" and not classification.outdated:
+            return False
+        if self._kind == "Out of pipe" and not classification.out_of_pipe:
+            return False
+        if self._kind == "Missing on disk" and classification.disk != MISSING:
+            return False
+
+        if self._text:
+            return (
+                self._text in node_status.node_name.lower()
+                or self._text in classification.file_path.lower()
+            )
+        return True
+
+
+class StatusPanel(QtGui.QWidget):
+    """Panel listing the status of every file node, e.g. to find outdated ones"""
+
+    def __init__(self, handler, parent=None):
+        """
+        Args:
+            handler (ReadStatus): Read status handler of the app
+            parent (QtGui.QWidget | None): Parent
+        """
+        super().__init__(parent)
+        self.handler = handler
+
+        self.model = NodeStatusModel(
+            handler.node_statuses, handler.get_icon_path, self
+        )
+        self.proxy = NodeStatusFilter(self)
+        self.proxy.setSourceModel(self.model)
+
+        self.filter_kind = QtGui.QComboBox()
+        self.filter_kind.addItems(list(FILTERS))
+        self.filter_kind.currentIndexChanged.connect(
+            lambda: self.proxy.set_kind(self.filter_kind.currentText())
+        )
+        self.filter_text = QtGui.QLineEdit()
+        self.filter_text.setPlaceholderText("Filter by node or path")
+        self.filter_text.textChanged.connect(self.proxy.set_text)
+
+        # Only the visible rows are drawn, uniform row heights keep that cheap
+        self.view = QtGui.QTreeView()
+        self.view.setModel(self.proxy)
+        self.view.setRootIsDecorated(False)
+        self.view.setUniformRowHeights(True)
+        self.view.setAlternatingRowColors(True)
+        self.view.setSortingEnabled(True)
+        self.view.sortByColumn(STATUS, QtCore.Qt.AscendingOrder)
+        self.view.setSelectionBehavior(QtGui.QAbstractItemView.SelectRows)
+        self.view.setSelectionMode(QtGui.QAbstractItemView.ExtendedSelection)
+        self.view.doubleClicked.connect(self.__show_node)
+
+        self.count_label = QtGui.QLabel()
+        for signal in (
+            self.proxy.rowsInserted,
+            self.proxy.rowsRemoved,
+            self.proxy.modelReset,
+            self.proxy.layoutChanged,
+        ):
+            signal.connect(self.__update_count)
+
+        update_button = QtGui.QPushButton("Update selected to latest")
+        update_button.clicked.connect(self.update_selected)
+        check_button = QtGui.QPushButton("Check all nodes")
+        check_button.clicked.connect(lambda: self.handler.refresh(revalidate=True))
+
+        filters = QtGui.QHBoxLayout()
+        filters.addWidget(self.filter_kind)
+        filters.addWidget(self.filter_text)
+        buttons = QtGui.QHBoxLayout()
+        buttons.addWidget(self.count_label)
+        buttons.addStretch()
+        buttons.addWidget(check_button)
+        buttons.addWidget(update_button)
+
+        layout = QtGui.QVBoxLayout(self)
+        layout.addLayout(filters)
+        layout.addWidget(self.view)
+        layout.addLayout(buttons)
+        self.__update_count()
+
+    def closeEvent(self, event):
+        self.model.close()
+        super().closeEvent(event)
+
+    def selected_nodes(self) -> list:
+        """
+        Get the nodes of the selected rows
+
+        Returns:
+            list[nuke.Node]: Nodes which still exist
+        """
+        nodes = []
+        for index in self.view.selectionModel().selectedRows(NODE):
+            node = nuke.toNode(index.data())
+            if node is not None:
+                nodes.append(node)
+        return nodes
+
+    def update_selected(self):
+        """Set the selected nodes to their latest version"""
+        nodes = self.selected_nodes()
+        if not nodes:
+            nuke.message("Please select a node to update to latest.")
+            return
+        self.handler.update_to_latest(nodes)
+
+    def __show_node(self, index):
+        node = nuke.toNode(index.sibling(index.row(), NODE).data())
+        if node is None:
+            return
+
+        for selected in nuke.selectedNodes():
+            selected.setSelected(False)
+        node.setSelected(True)
+        nuke.zoomToFitSelected()
+
+    def __update_count(self, *args):
+        self.count_label.setText(
+            f"{self.proxy.rowCount()} of {self.model.rowCount()} file node(s)"
+        )
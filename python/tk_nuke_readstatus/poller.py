@@ -0,0 +1,101 @@
+# MIT License
+
+# Copyright (c) 2025 MaximumFX
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from __future__ import annotations
+
+import threading
+from typing import Callable
+
+import nuke
+from sgtk.platform.qt import QtCore
+
+
+class FreshnessPoller:
+    """Run a query on a worker thread at an interval and apply it on the main thread"""
+
+    def __init__(
+        self,
+        poll: Callable[[], object],
+        apply: Callable[[object], None],
+        interval: int,
+        logger,
+    ):
+        """
+        Args:
+            poll (Callable): Queries the changes, called on a worker thread
+            apply (Callable): Applies the result of poll, called on the main thread
+            interval (int): Milliseconds between polls
+            logger: Logger
+        """
+        self._poll = poll
+        self._apply = apply
+        self.logger = logger
+
+        self._busy = False
+        self._generation = 0
+        self._timer = QtCore.QTimer()
+        self._timer.setInterval(interval)
+        self._timer.timeout.connect(self.poll_now)
+
+    @property
+    def active(self) -> bool:
+        return self._timer.isActive()
+
+    def start(self):
+        """Start polling at the interval"""
+        self._timer.start()
+
+    def stop(self):
+        """Stop polling and drop the result of a running poll"""
+        self._timer.stop()
+        self.cancel()
+
+    def cancel(self):
+        """Drop the result of a running poll, e.g. when the script is closed"""
+        self._generation += 1
+
+    def poll_now(self):
+        """Poll right away, unless the previous poll is still running"""
+        if self._busy:
+            return
+
+        self._busy = True
+        threading.Thread(
+            target=self.__run,
+            args=(self._generation,),
+            name="tk-nuke-readstatus-poll",
+            daemon=True,
+        ).start()
+
+    def __run(self, generation: int):
+        try:
+            result = self._poll()
+        except Exception:
+            self.logger.exception("Failed to poll for new publishes")
+            result = None
+        nuke.executeInMainThread(self.__finish, args=(generation, result))
+
+    def __finish(self, generation: int, result):
+        self._busy = False
+        if generation != self._generation or result is None:
+            return
+        self._apply(result)
@@ -22,94 +22,839 @@
 
 from __future__ import annotations
 
+import collections
+import datetime
+import functools
 import os
+import threading
+from typing import Callable
 
 import nuke
+from sgtk.platform.qt import QtCore
 
+from .classify import Classification, StatusClassifier
+from .fingerprint import SceneFingerprint
+from .icons import IconTracker
+from .index import normalize_path
+from .latest_cache import LatestCache
+from .mappings import MappingIndex, format_switches
+from .metrics import Metrics
+from .models import Icon
+from .nodes import FileKnobRegistry
+from .poller import FreshnessPoller
+from .refresh import BackgroundRefresh, SlicedRefresh
+from .statuses import NodeStatusIndex
+from .versions import VersionIndex
 
-class Icon:
-    name: str
-    scale: float
-    offset_x: float
-    offset_y: float
 
-    def __init__(
-        self,
-        name: str,
-        scale: float,
-        offset_x: float,
-        offset_y: float,
-    ):
-        self.name = name
-        self.scale = scale
-        self.offset_x = offset_x
-        self.offset_y = offset_y
-
-    @staticmethod
-    def from_dict(data: dict):
-        return Icon(
-            data.get("name"),
-            data.get("scale", 0.5),
-            data.get("offsetX", 84),
-            data.get("offsetY", 0),
-        )
-
-
-class Status:
-    icon: Icon
-    match_both: bool
-    latest: bool = False
-    str_include: list[str] = []
-    template_match: list = []
-
-    @staticmethod
-    def from_dict(data: dict):
-        status = Status()
-        status.icon = Icon.from_dict(data.get("icon", {}))
-        status.match_both = data.get("match_both")
-        status.latest = data.get("latest", False)
-        status.str_include = data.get("str_include", [])
-        status.template_match = data.get("template_match", [])
-
-        return status
+# Why version commands leave a path unchanged
+_NOT_HIGHER = "no higher version on disk or no versionable template"
+_NOT_LOWER = "no lower version on disk or no versionable template"
+_NOT_LATER = "already the latest version or no versionable template"
 
 
 class ReadStatus:
-    def __init__(self, app):
-        """Set global variables"""
+    def __init__(self, app, ui: bool = True):
+        """
+        Set global variables
+
+        Args:
+            app (TkNukeReadStatus): App
+            ui (bool): Apply icons, False when Nuke runs without a GUI
+        """
         self.app = app
+        self.ui = ui
         self.logger = app.logger
         self.current_engine = app.engine
         self.tk = self.current_engine.sgtk
         self.sg = self.current_engine.shotgun
         self.current_context = self.current_engine.context
 
-        self.question_on_missing = self.app.get_setting("question_on_missing")
-        self.missing_icon = Icon.from_dict(self.app.get_setting("missing_icon", {}))
-        self.statuses = [
-            Status.from_dict(status) for status in self.app.get_setting("statuses")
-        ]
         self.base_path = self.app.get_setting("icon_base_path")
+        self.file_knobs = FileKnobRegistry(self.app.get_setting("file_knobs", {}))
+        self.icon_tracker = IconTracker()
+        self.fingerprint = SceneFingerprint()
+        self.node_statuses = NodeStatusIndex()
+        self.metrics = Metrics(
+            self.logger,
+            slow_threshold=self.app.get_setting("slow_call_threshold", 1000) / 1000,
+            file_path=self.app.get_setting("metrics_file", ""),
+        )
+
+        # The breakdown manager and the status config are set up on first use
+        self._breakdown_app = self.current_engine.apps.get("tk-multi-breakdown2")
+        self._breakdown_manager = None
+        self._classifier = None
+        self._version_index = None
+        self._mappings = None
+
+        # Revalidations started before the last reset are dropped
+        self._revalidation = 0
+        self.versions_from_disk = self.app.get_setting("versions_from_disk", True)
+
+        self.background_refresh = BackgroundRefresh(
+            self.resolve_snapshot,
+            self.apply_batch,
+            self.logger,
+            workers=self.app.get_setting("background_workers", 4),
+        )
+        self.sliced_refresh = SlicedRefresh(
+            self.__check_slice,
+            self.logger,
+            batch_size=self.app.get_setting("refresh_batch_size", 200),
+            budget=self.app.get_setting("refresh_slice_budget", 50),
+        )
 
-        breakdown_app = self.current_engine.apps["tk-multi-breakdown2"]
-        self.breakdown_manager = (
-            breakdown_app.create_breakdown_manager() if breakdown_app else None
+        self.poller = FreshnessPoller(
+            self.__poll_publishes,
+            self.__apply_publishes,
+            self.app.get_setting("poll_interval", 120) * 1000,
+            self.logger,
         )
-        self.breakdown_items = []
+        self._poll_since = None
+
+        # Checks the rest of the script after the nodes in view got their icons,
+        # scanning the scene when the whole script is checked
+        self._scan_rest = True
+        self._slice_lookups = True
+        self._deferred_refresh = QtCore.QTimer()
+        self._deferred_refresh.setSingleShot(True)
+        self._deferred_refresh.timeout.connect(self.__refresh_rest)
+
+    @property
+    def breakdown_manager(self):
+        """Breakdown manager of tk-multi-breakdown2, or None if it isn't installed"""
+        if self._breakdown_manager is None and self._breakdown_app:
+            with self.metrics.time("startup.breakdown_manager"):
+                self._breakdown_manager = (
+                    self._breakdown_app.create_breakdown_manager()
+                )
+        return self._breakdown_manager
+
+    @property
+    def classifier(self) -> StatusClassifier:
+        """Status config and lookups, parsed on first use"""
+        if self._classifier is None:
+            with self.metrics.time("startup.classifier"):
+                self._classifier = StatusClassifier(
+                    self.app.get_setting,
+                    self.tk,
+                    self.logger,
+                    publishes=bool(self._breakdown_app),
+                    metrics=self.metrics,
+                    latest_cache=self.__latest_cache(),
+                )
+        return self._classifier
+
+    @property
+    def version_index(self) -> VersionIndex:
+        if self._version_index is None:
+            self._version_index = VersionIndex(self.classifier.directory_cache)
+        return self._version_index
+
+    @property
+    def mappings(self) -> MappingIndex:
+        """Work/publish mappings, compiled on first use"""
+        if self._mappings is None:
+            self._mappings = MappingIndex(
+                self.app.get_setting("work_publish_mappings", []),
+                self.tk.templates,
+                self.logger,
+                metrics=self.metrics,
+            )
+        return self._mappings
+
+    def __latest_cache(self) -> LatestCache | None:
+        """Open the latest version cache shared by the sessions on this machine"""
+        ttl = self.app.get_setting("latest_cache_ttl", 3600)
+        if not ttl or ttl < 0 or not self.app.cache_location:
+            return None
 
-        # Apply the icons
-        self.update_breakdown()
-        self.check_script()
+        latest_cache = LatestCache(
+            os.path.join(self.app.cache_location, "latest_publishes.sqlite"),
+            ttl,
+            self.logger,
+        )
+        # Answers older than a week aren't worth showing while revalidating
+        latest_cache.prune(max(ttl, 7 * 24 * 3600))
+        return latest_cache
 
-    def update_breakdown(self):
-        if self.breakdown_manager:
-            self.breakdown_items = self.breakdown_manager.scan_scene()
+    def refresh(self, revalidate: bool = False, force: bool = False):
+        """
+        Refresh all read node's icons, in the background if enabled
+
+        Scripts without file nodes aren't scanned and don't set anything up.
+        Only the nodes whose file path changed since they were last checked are
+        checked again, revalidating also checks the nodes whose path wasn't
+        published yet. The file nodes feeding the active Viewer and the
+        selection are checked first, the rest once Nuke had a chance to draw
+        their icons.
 
-    def check_script(self):
-        """Update all read node's icons in the script"""
+        Args:
+            revalidate (bool): Revalidate all cached latest versions, instead of
+                only the ones older than the TTL
+            force (bool): Check every node, even if its file path didn't change
+        """
+        with self.metrics.event("refresh", script=self.__script_name()) as event:
+            nodes = self.__file_nodes()
+            event["file_nodes"] = len(nodes)
+            # Forget the statuses of deleted nodes
+            names = {node.fullName() for node in nodes}
+            self.node_statuses.retain(names)
+            self.fingerprint.retain(names)
+            if not nodes:
+                self.logger.debug("No file nodes in the script, nothing to check")
+                return
+
+            # Polls from now on, whichever way the nodes end up being checked
+            if (
+                self.ui
+                and self.app.get_setting("poll_publishes", False)
+                and not self.poller.active
+            ):
+                self.poller.start()
+
+            if force:
+                self.fingerprint.clear()
+            elif revalidate:
+                self.__forget_unpublished(nodes)
+            changed = self.__changed_nodes(nodes)
+            event["changed_nodes"] = len(changed)
+            # With nodes left as they were, only the changed ones are looked up
+            # and the latest versions resolved so far are kept
+            partial = len(changed) < len(nodes)
+
+            if revalidate:
+                self.classifier.latest_resolver.expire()
+                if partial:
+                    # The unchanged nodes aren't resolved again, so their
+                    # latest versions are revalidated in the background
+                    with self.classifier.lock:
+                        self.classifier.latest_resolver.mark_stale(
+                            self.classifier.breakdown_index.groups()
+                        )
+            self._deferred_refresh.stop()
+
+            if not changed:
+                self.logger.debug("No file paths changed since the last check")
+                self.revalidate_latest()
+                return
+
+            changed_names = {node.fullName() for node in changed}
+            priority = [
+                node
+                for node in self.__priority_nodes()
+                if node.fullName() in changed_names
+            ]
+            event["priority_nodes"] = len(priority)
+            if priority:
+                if not partial:
+                    self.classifier.latest_resolver.clear()
+                with self.metrics.time("refresh.priority"):
+                    self.update_breakdown(priority)
+                    self.check_nodes(priority)
+
+            if self.app.get_setting("background_refresh", False):
+                names = {node.fullName() for node in priority}
+                self.check_script_async(
+                    [node for node in changed if node.fullName() not in names],
+                    keep_latest=partial,
+                )
+            elif priority:
+                if len(priority) < len(changed):
+                    self._scan_rest = not partial
+                    self._deferred_refresh.start(0)
+            elif self.__is_sliced():
+                self.check_script_sliced(changed, keep_latest=partial)
+            else:
+                self.update_breakdown(changed if partial else None)
+                self.check_script(changed, keep_latest=partial)
+
+    def __refresh_rest(self):
+        """Check the rest of the script after the priority nodes were checked"""
+        with self.metrics.event("refresh", script=self.__script_name(), rest=True):
+            nodes = self.__changed_nodes(self.__file_nodes())
+            if not nodes:
+                return
+            if self.__is_sliced():
+                self.check_script_sliced(nodes, keep_latest=True)
+                return
+            self.update_breakdown(None if self._scan_rest else nodes)
+            self.check_script(nodes, keep_latest=True)
 
+    def __is_sliced(self) -> bool:
+        """If full checks run in slices with a progress bar"""
+        return self.ui and self.app.get_setting("sliced_refresh", False)
+
+    def __changed_nodes(self, nodes: list) -> list:
+        """
+        Get the nodes whose file path changed since they were last checked
+
+        Args:
+            nodes (list[nuke.Node]): File nodes
+
+        Returns:
+            list[nuke.Node]: Nodes to check again
+        """
+        with self.metrics.time("refresh.fingerprint"):
+            return [
+                node
+                for node in nodes
+                if not self.fingerprint.matches(
+                    node.fullName(), self.__get_file_path(node)
+                )
+            ]
+
+    def __forget_unpublished(self, nodes: list):
+        """
+        Forget the nodes whose path has no published file with versions, their
+        file may have been published since they were checked
+
+        Args:
+            nodes (list[nuke.Node]): File nodes
+        """
+        if not self.classifier.publishes:
+            return
+
+        with self.classifier.lock:
+            breakdown_index = self.classifier.breakdown_index
+            for node in nodes:
+                file_path = self.__get_file_path(node)
+                if not file_path:
+                    continue
+                record = breakdown_index.get(file_path)
+                if record is not None and record.group is not None:
+                    continue
+                if record is not None:
+                    # Looked up again when the node is checked
+                    breakdown_index.remove(file_path)
+                self.fingerprint.forget(node.fullName())
+
+    def __priority_nodes(self) -> list:
+        """
+        Get the file nodes upstream of the active Viewer input and the selection
+
+        Returns:
+            list[nuke.Node]: File nodes, the ones in view first
+        """
+        if not self.app.get_setting("prioritize_viewer", True):
+            return []
+
+        with self.metrics.time("refresh.priority_nodes"):
+            start = []
+            viewer = nuke.activeViewer()
+            if viewer is not None:
+                active_input = viewer.activeInput()
+                if active_input is not None:
+                    start.append(viewer.node().input(active_input))
+            start.extend(nuke.selectedNodes())
+
+            priority = []
+            visited = set()
+            pending = collections.deque(node for node in start if node is not None)
+            while pending:
+                node = pending.popleft()
+                name = node.fullName()
+                if name in visited:
+                    continue
+                visited.add(name)
+                if self.file_knobs.knob_name(node) is not None:
+                    priority.append(node)
+                pending.extend(node.dependencies(nuke.INPUTS | nuke.HIDDEN_INPUTS))
+            return priority
+
+    def __file_nodes(self) -> list:
+        """Get all nodes in the script which have a file knob"""
+        with self.metrics.time("check_script.all_nodes"):
+            return [
+                node
+                for node in nuke.allNodes(recurseGroups=True)
+                if self.file_knobs.knob_name(node) is not None
+            ]
+
+    def cancel_refresh(self):
+        """Stop applying the results of a running background or sliced refresh"""
+        self.background_refresh.cancel()
+        self.sliced_refresh.cancel()
+
+    def reset(self):
+        """Forget the state of the current script before another one is opened"""
+        self.cancel_refresh()
+        self._deferred_refresh.stop()
+        self.poller.cancel()
+        # The next script looks back from its first poll again
+        self._poll_since = None
+        self._revalidation += 1
+        self.icon_tracker.clear()
+        self.fingerprint.clear()
+        self.node_statuses.clear()
+
+    def invalidate_latest(self):
+        """Forget all known latest versions, e.g. after publishing"""
+        latest_resolver = self.classifier.latest_resolver
+        latest_resolver.clear()
+        if latest_resolver.cache is not None:
+            latest_resolver.cache.invalidate()
+        # Nothing is known about the latest versions of the checked nodes now
+        self.fingerprint.clear()
+
+    def revalidate_latest(self):
+        """Query the latest versions which came from stale cache entries again"""
+        stale = self.classifier.latest_resolver.take_stale()
+        if not stale:
+            return
+
+        self.logger.debug(f"Revalidating {len(stale)} cached latest version(s)")
+        threading.Thread(
+            target=self.__revalidate,
+            args=(self._revalidation, stale),
+            name="tk-nuke-readstatus-revalidate",
+            daemon=True,
+        ).start()
+
+    def __revalidate(self, revalidation: int, stale: dict):
+        try:
+            with self.metrics.time("latest.revalidate"):
+                found = self.classifier.latest_resolver.revalidate(stale)
+        except Exception:
+            self.logger.exception("Failed to revalidate the latest versions")
+            return
+        nuke.executeInMainThread(self.__apply_revalidated, args=(revalidation, found))
+
+    def __apply_revalidated(self, revalidation: int, found: dict):
+        if revalidation != self._revalidation:
+            return
+
+        self.__check_changed(self.classifier.latest_resolver.store(found))
+
+    def __poll_publishes(self) -> list[dict]:
+        """Query the files published to the scene's entities since the last poll"""
+        started = datetime.datetime.now(datetime.timezone.utc)
+        since = self._poll_since
+        if since is None:
+            # Fresh cache entries may be up to the TTL old
+            lookback = 60
+            if self.classifier.latest_resolver.cache is not None:
+                lookback += self.classifier.latest_resolver.cache.ttl
+            since = started - datetime.timedelta(seconds=lookback)
+
+        with self.classifier.lock:
+            entities = self.classifier.breakdown_index.entities()
+        with self.metrics.time("latest.poll"):
+            publishes = self.classifier.latest_resolver.published_since(
+                entities, since
+            )
+
+        # Overlap the polls a little, in case the clocks don't agree
+        self._poll_since = started - datetime.timedelta(seconds=60)
+        return publishes
+
+    def __apply_publishes(self, publishes: list[dict]):
+        """Update the nodes whose latest version was just published"""
+        latest_resolver = self.classifier.latest_resolver
+        newer = latest_resolver.newer(publishes)
+        if not newer:
+            return
+
+        if latest_resolver.cache is not None:
+            latest_resolver.cache.put(newer)
+        self.__check_changed(latest_resolver.store(newer))
+
+    def __check_changed(self, keys: set):
+        """
+        Update the nodes of publish groups whose latest version changed
+
+        Args:
+            keys (set[tuple]): Publish keys
+        """
+        if not keys:
+            return
+
+        with self.classifier.lock:
+            paths = self.classifier.breakdown_index.paths_for(keys)
+        nodes = []
         for node in nuke.allNodes(recurseGroups=True):
-            self.check_node(node)
+            file_path = self.__get_file_path(node)
+            if file_path and normalize_path(file_path) in paths:
+                nodes.append(node)
+        self.logger.debug(
+            f"{len(keys)} latest version(s) changed, updating {len(nodes)} node(s)"
+        )
+        self.check_nodes(nodes)
+
+    def forget_nodes(self, nodes: list):
+        """
+        Forget the icons applied to nodes and the paths they were checked with,
+        e.g. when a node was (re)created or its file knob edited
+
+        Args:
+            nodes (list[nuke.Node]): Nuke nodes
+        """
+        for node in nodes:
+            node_name = node.fullName()
+            self.icon_tracker.forget(node_name)
+            self.fingerprint.forget(node_name)
+
+    def destroy(self):
+        self.background_refresh.shutdown()
+        self.sliced_refresh.cancel()
+        self._deferred_refresh.stop()
+        self.poller.stop()
+        self._revalidation += 1
+        if self._classifier is not None:
+            self._classifier.shotgun_lookup.shutdown()
+
+    def show_panel(self, panel_id: str):
+        """
+        Show the panel listing the status of every file node
+
+        Args:
+            panel_id (str): Id returned by engine.register_panel
+        """
+        from .panel import StatusPanel
+
+        return self.current_engine.show_panel(
+            panel_id, "Read Status", self.app, StatusPanel, self
+        )
+
+    def index_memory(self) -> int:
+        """
+        Get the approximate size of the breakdown index
+
+        Returns:
+            int: Bytes, 0 if nothing was checked yet
+        """
+        if self._classifier is None:
+            return 0
+        with self._classifier.lock:
+            return self._classifier.breakdown_index.memory()
+
+    def diagnostics(self) -> str:
+        """
+        Get a summary of where the time went since the app started
+
+        Returns:
+            str: Timings, counts and the size of the caches
+        """
+        self.metrics.write(dict(self.metrics.to_dict(), event="diagnostics"))
+        return "\n".join(
+            [
+                self.metrics.summary(),
+                "",
+                f"Indexed published files: {len(self.classifier.breakdown_index)}, "
+                f"{self.index_memory() / 1024:.0f} KB",
+                "Latest published file queries: "
+                f"{self.classifier.latest_resolver.query_count}",
+                "ShotGrid queries: "
+                f"{self.classifier.shotgun_lookup.query_count}, "
+                f"merged: {self.classifier.shotgun_lookup.merged_count}, "
+                f"retried: {self.classifier.shotgun_lookup.retry_count}",
+                f"Icons applied: {self.icon_tracker.applied}, "
+                f"unchanged: {self.icon_tracker.skipped}",
+                f"Nodes skipped with an unchanged path: {self.fingerprint.matched}",
+                f"Directory listings: {self.classifier.directory_cache.listings}",
+            ]
+        )
+
+    @staticmethod
+    def __script_name() -> str:
+        try:
+            return nuke.scriptName()
+        except RuntimeError:
+            # The script hasn't been saved yet
+            return ""
+
+    def update_breakdown(self, nodes: list | None = None):
+        """
+        Update the breakdown index
+
+        Args:
+            nodes (list[nuke.Node] | None): Only add these nodes' files to the
+                index instead of scanning the whole scene
+        """
+        if not self.breakdown_manager:
+            return
+
+        with self.metrics.event("update_breakdown") as event:
+            if nodes is None:
+                with self.metrics.time("breakdown.scan_scene"):
+                    items = self.classifier.shotgun_lookup.retry(
+                        self.breakdown_manager.scan_scene
+                    )
+                with self.metrics.time("breakdown.index"):
+                    changed = self.classifier.update_index(items)
+            else:
+                changed = self.__add_to_breakdown(nodes)
+            event["changed"] = len(changed)
+        self.logger.debug(f"Breakdown updated, {len(changed)} path(s) changed")
+
+    def __add_to_breakdown(self, nodes: list) -> set[str]:
+        """
+        Look up the published files of the nodes which aren't indexed yet
+
+        Args:
+            nodes (list[nuke.Node]): Nuke nodes
+
+        Returns:
+            set[str]: Paths which were added to the index
+        """
+        node_paths = {}
+        for node in nodes:
+            file_path = self.__get_file_path(node)
+            if file_path:
+                node_paths.setdefault(file_path, (node.fullName(), node.Class()))
+        return self.classifier.add_paths(node_paths)
+
+    def check_script(
+        self,
+        nodes: list | None = None,
+        keep_latest: bool = False,
+        force: bool = False,
+    ):
+        """
+        Update all read node's icons in the script
+
+        Args:
+            nodes (list[nuke.Node] | None): File nodes to check, defaults to the
+                file nodes whose path changed since they were last checked
+            keep_latest (bool): Keep the latest versions resolved so far, e.g.
+                by checking the nodes in view first
+            force (bool): Check all file nodes when no nodes are given, even if
+                their file path didn't change
+        """
+        applied = self.icon_tracker.applied
+        skipped = self.icon_tracker.skipped
+        with self.metrics.event("check_script") as event:
+            if nodes is None:
+                nodes = self.__file_nodes()
+                if not force:
+                    changed = self.__changed_nodes(nodes)
+                    # The unchanged nodes rely on the latest versions resolved
+                    keep_latest = keep_latest or len(changed) < len(nodes)
+                    nodes = changed
+            if not keep_latest:
+                self.classifier.latest_resolver.clear()
+            event["nodes"] = len(nodes)
+            self.check_nodes(nodes)
+            event["icons_applied"] = self.icon_tracker.applied - applied
+            event["icons_unchanged"] = self.icon_tracker.skipped - skipped
+        self.logger.debug(
+            f"Checked script, {event['icons_applied']} icon(s) applied and "
+            f"{event['icons_unchanged']} unchanged"
+        )
+
+    def check_script_async(
+        self, nodes: list | None = None, keep_latest: bool = False
+    ):
+        """
+        Update all read node's icons, resolving their statuses in the background
+
+        Args:
+            nodes (list[nuke.Node] | None): File nodes of the script, if they
+                were already collected
+            keep_latest (bool): Keep the latest versions resolved so far
+        """
+        if nodes is None:
+            nodes = self.__file_nodes()
+        snapshot = []
+        with self.metrics.time("check_script.snapshot"):
+            for node in nodes:
+                file_path = self.__get_file_path(node)
+                if file_path is not None:
+                    snapshot.append(
+                        (node.fullName(), file_path, self.__frame_range(node))
+                    )
+
+        if not keep_latest:
+            self.classifier.latest_resolver.clear()
+        self.background_refresh.start(snapshot)
+
+    def check_script_sliced(self, nodes: list, keep_latest: bool = False):
+        """
+        Update the icons of file nodes in slices, giving Nuke a turn in between
+
+        The published files and latest versions of all nodes are looked up on
+        a worker thread first, then every slice checks batches of nodes until
+        its time budget is spent. Cancelling from the progress bar keeps the
+        icons of the checked nodes, the others are checked by the next refresh.
+
+        Args:
+            nodes (list[nuke.Node]): File nodes to check
+            keep_latest (bool): Keep the latest versions resolved so far
+        """
+        if not keep_latest:
+            self.classifier.latest_resolver.clear()
+
+        node_paths = {}
+        with self.metrics.time("check_script.snapshot"):
+            for node in nodes:
+                file_path = self.__get_file_path(node)
+                if file_path:
+                    node_paths.setdefault(file_path, (node.fullName(), node.Class()))
+
+        def prepare():
+            self.classifier.add_paths(node_paths)
+            self.classifier.resolve_latest(list(node_paths))
+            self._slice_lookups = False
+
+        # The slices look up their nodes themselves until the preparation is done
+        self._slice_lookups = True
+        self.sliced_refresh.start(nodes, prepare)
+
+    def __check_slice(self, nodes: list):
+        """Look up and check a batch of a sliced refresh"""
+        live = []
+        for node in nodes:
+            try:
+                node.fullName()
+            except ValueError:
+                # Deleted since the check started
+                continue
+            live.append(node)
+
+        with self.metrics.time("check_script.slice"):
+            if self._slice_lookups:
+                self.__add_to_breakdown(live)
+            self.check_nodes(live)
+
+    def validate(
+        self,
+        nodes: list | None = None,
+        check_disk: bool | None = None,
+        problems_only: bool = False,
+    ) -> list[dict]:
+        """
+        Get the status of file nodes without touching their icons, e.g. to
+        block outdated renders from a submission hook
+
+        The published files of all paths are looked up in one query. The
+        latest versions known in this session or still fresh in the cache on
+        disk are reused, stale ones are queried again. Call invalidate_latest
+        first to query all of them again.
+
+        Args:
+            nodes (list[nuke.Node] | None): Nodes to check, defaults to all file
+                nodes in the script
+            check_disk (bool | None): Check for missing files and frames,
+                defaults to the check_disk setting
+            problems_only (bool): Only return out-of-pipe, outdated and missing
+                nodes
+
+        Returns:
+            list[dict]: Node name, class, file knob and the status of the path
+                per node, see Classification.to_dict
+        """
+        with self.metrics.event("validate") as event:
+            if nodes is None:
+                nodes = self.__file_nodes()
+            if check_disk is None:
+                check_disk = self.classifier.check_disk
+
+            node_paths = []
+            for node in nodes:
+                knob = self.file_knobs.knob(node)
+                if knob is not None:
+                    node_paths.append((node, knob.name(), knob.value()))
+            self.classifier.add_paths(
+                {
+                    file_path: (node.fullName(), node.Class())
+                    for node, _, file_path in node_paths
+                    if file_path
+                }
+            )
+            # Fresh cached latest versions are used, stale ones queried again
+            self.classifier.resolve_latest(
+                [file_path for _, _, file_path in node_paths],
+                always=True,
+                use_stale=False,
+            )
+
+            records = []
+            problems = 0
+            for node, knob_name, file_path in node_paths:
+                frame_range = self.__frame_range(node) if check_disk else None
+                classification = self.classifier.classify(
+                    file_path, frame_range, check_disk=check_disk
+                )
+                problems += classification.problem
+                if problems_only and not classification.problem:
+                    continue
+                record = {
+                    "node": node.fullName(),
+                    "class": node.Class(),
+                    "knob": knob_name,
+                }
+                record.update(classification.to_dict())
+                records.append(record)
+
+            event["nodes"] = len(node_paths)
+            event["problems"] = problems
+        return records
+
+    def resolve_snapshot(self, snapshot: list[tuple]) -> list:
+        """
+        Resolve the icons of a script snapshot without touching the nodes
+
+        Args:
+            snapshot (list[tuple]): Node name, file path and frame range
+
+        Returns:
+            list[tuple[str, str, Classification]]: Node name, file path and
+                status
+        """
+        self.classifier.add_paths(
+            {file_path: (node_name, None) for node_name, file_path, _ in snapshot}
+        )
+        self.classifier.resolve_latest([file_path for _, file_path, _ in snapshot])
+        return [
+            (node_name, file_path, self.classifier.classify(file_path, frame_range))
+            for node_name, file_path, frame_range in snapshot
+        ]
+
+    def apply_batch(self, results: list):
+        """
+        Apply resolved statuses, skipping nodes which were changed in the meantime
+
+        Args:
+            results (list[tuple[str, str, Classification]]): Node name, file
+                path and status
+        """
+        for node_name, file_path, classification in results:
+            node = nuke.toNode(node_name)
+            if node is None or self.__get_file_path(node) != file_path:
+                continue
+            self.node_statuses.update(node_name, node.Class(), classification)
+            self.__apply_icon(node, classification.icon)
+            self.__record_checked(node_name, file_path, classification)
+        self.revalidate_latest()
+
+    def check_nodes(self, nodes: list):
+        """
+        Update the icons of a batch of nodes
+
+        Args:
+            nodes (list[nuke.Node]): Nuke nodes
+        """
+        # Resolve the latest publishes of all nodes in bulk before applying icons
+        self.resolve_latest(nodes)
+
+        with self.metrics.time("check_nodes.icons"):
+            for node in nodes:
+                self.check_node(node)
+
+        # Icons from stale cache entries are shown until the new answers arrive
+        self.revalidate_latest()
+
+    def resolve_latest(self, nodes: list):
+        """
+        Resolve the latest published files needed to check the given nodes
+
+        Args:
+            nodes (list[nuke.Node]): Nuke nodes
+        """
+        self.classifier.resolve_latest(
+            [self.__get_file_path(node) for node in nodes]
+        )
 
     def check_node(self, node):
         """Update a node's icon in the script"""
@@ -118,10 +863,7 @@ class ReadStatus:
         if file_path is None:
             return
 
-        if file_path != "":
-            self.__check_node(node, file_path)
-        else:
-            node.clearCustomIcon()
+        self.__check_node(node, file_path)
 
     def get_icon_path(self, icon: Icon):
         """
@@ -136,243 +878,315 @@ class ReadStatus:
         return os.path.join(self.base_path, f"{icon.name}.png")
 
     def version_up_node(self, max=False):
-        """Decrease the currently selected node's version"""
-        try:
-            # Select current selected node
-            node = nuke.selectedNode()
+        """Increase the selected nodes' version, or set it to the latest"""
+        if max:
+            edit = self.__max_version_paths
+        else:
+            edit = functools.partial(self.__version_paths, step=1)
+        self.__edit_selected_nodes(
+            "version up",
+            "be versioned up",
+            edit,
+            unchanged=_NOT_LATER if max else _NOT_HIGHER,
+        )
 
-            # Get the file path if the node has one
-            file_path = self.__get_file_path(node)
-            if file_path is None:
-                nuke.message("This node can't be versioned up.")
-                return
-            if file_path == "":
-                nuke.message("This node doesn't have a filepath entered.")
-                return
+    def update_to_latest(self, nodes: list):
+        """
+        Set nodes to their latest published version, or the latest on disk
 
-            # If has template match
-            templates = self.app.get_setting("versionable")
-            success = False
-            if templates:
-                for template_key in templates:
-                    template = self.tk.templates.get(template_key)
-                    fields = template.validate_and_get_fields(file_path)
-                    if fields and fields.get("version"):
-                        self.logger.debug(f'Versioning up "{node.name()}"')
-                        fields["version"] = fields["version"] + 1
-                        if max:
-                            item = next(
-                                (
-                                    item
-                                    for item in self.breakdown_items
-                                    if item.path.replace(os.sep, "/") == file_path
-                                ),
-                                None,
-                            )
-                            if item:
-                                fields["version"] = (
-                                    self.breakdown_manager.get_latest_published_file(
-                                        item
-                                    ).get("version_number")
-                                )
-
-                        new_file_path = template.apply_fields(fields).replace(
-                            os.sep, "/"
-                        )
-                        self.__set_file_path(node, new_file_path)
-                        success = True
+        Args:
+            nodes (list[nuke.Node]): Nuke nodes, e.g. the ones picked in the panel
+        """
+        self.__edit_selected_nodes(
+            "update to latest",
+            "be updated",
+            self.__max_version_paths,
+            nodes,
+            unchanged=_NOT_LATER,
+        )
 
-            if not success:
-                self.logger.debug(
-                    f'Can\'t version down "{node.name()}", no versionable template defined'
-                )
+    def version_down_node(self):
+        """Decrease the selected nodes' version"""
+        self.__edit_selected_nodes(
+            "version down",
+            "be versioned down",
+            functools.partial(self.__version_paths, step=-1),
+            unchanged=_NOT_LOWER,
+        )
 
-        # If something went wrong, e.g. no node selected, let user know
-        except Exception as error:
-            error = str(error)
-            if error == "no node selected":
-                nuke.message("Please select a node to version up.")
-            else:
-                nuke.message(str(error))
+    def node_to_publish(self):
+        """Set the selected nodes' paths from a work to a publish path"""
+        self.__edit_selected_nodes(
+            "switch to publish",
+            "be set to publish",
+            functools.partial(self.mappings.switch_paths, to_publish=True),
+        )
 
-    def version_down_node(self):
-        """Increase the currently selected node's version"""
-        try:
-            # Select current selected node
-            node = nuke.selectedNode()
+    def node_to_work(self):
+        """Set the selected nodes' paths from a publish to a work path"""
+        self.__edit_selected_nodes(
+            "switch to work",
+            "be set to work",
+            functools.partial(self.mappings.switch_paths, to_publish=False),
+        )
 
-            # Get the file path if the node has one
-            file_path = self.__get_file_path(node)
-            if file_path is None:
-                nuke.message("This node can't be versioned up.")
-                return
-            if file_path == "":
-                nuke.message("This node doesn't have a filepath entered.")
-                return
+    def confirm_script_to_publish(self):
+        """Show which nodes would switch from work to publish and switch them"""
+        switches = self.script_to_publish(dry_run=True)
+        if not switches:
+            nuke.message("There are no work paths to set to publish.")
+            return
+
+        report = format_switches(switches)
+        self.logger.info(report)
+        if nuke.ask(f"{report}\n\nSet them to publish?"):
+            self.script_to_publish()
 
-            # If has template match
-            templates = self.app.get_setting("versionable")
-            if templates:
-                for template_key in templates:
-                    template = self.tk.templates.get(template_key)
-                    fields = template.validate_and_get_fields(file_path)
-                    if fields and fields.get("version"):
-                        self.logger.debug(f'Versioning down "{node.name()}"')
-                        if fields["version"] == 1:
+    def script_to_publish(self, dry_run: bool = False) -> list[tuple]:
+        """
+        Set the paths of all file nodes in the script from work to publish, in
+        one undo step
+
+        Args:
+            dry_run (bool): Only report what would be switched
+
+        Returns:
+            list[tuple[str, str, str]]: Node name, work path and publish path
+                of every switched node
+        """
+        with self.metrics.event("switch_script", dry_run=dry_run) as event:
+            node_paths = []
+            for node in self.__file_nodes():
+                file_path = self.__get_file_path(node)
+                if file_path:
+                    node_paths.append((node, file_path))
+
+            new_paths = self.mappings.switch_paths(
+                list(dict.fromkeys(path for _, path in node_paths)), to_publish=True
+            )
+            switches = [
+                (node, file_path, new_paths[file_path])
+                for node, file_path in node_paths
+                if new_paths.get(file_path, file_path) != file_path
+            ]
+            event["nodes"] = len(switches)
+            if not dry_run:
+                self.__set_file_paths(
+                    "Switch script to publish",
+                    [(node, new_path) for node, _, new_path in switches],
+                )
+        return [
+            (node.fullName(), file_path, new_path)
+            for node, file_path, new_path in switches
+        ]
+
+    def __edit_selected_nodes(
+        self,
+        action: str,
+        description: str,
+        edit: Callable[[list], dict],
+        nodes: list | None = None,
+        unchanged: str | None = None,
+    ):
+        """
+        Change the file paths of all selected nodes in one undo step
+
+        Args:
+            action (str): Action for the user messages, e.g. "version up"
+            description (str): Action for the user messages, e.g. "be versioned up"
+            edit (Callable): Gets the distinct file paths and returns the new
+                path per file path
+            nodes (list[nuke.Node] | None): Nodes to change instead of the
+                selected ones
+            unchanged (str | None): Why a path may stay the same, to tell the
+                user about the nodes which weren't changed
+        """
+        try:
+            with self.metrics.event("edit_nodes", action=action):
+                if nodes is None:
+                    nodes = nuke.selectedNodes()
+                if not nodes:
+                    nuke.message(f"Please select a node to {action}.")
+                    return
+
+                # Get the file paths of the nodes that have one
+                node_paths = []
+                for node in nodes:
+                    file_path = self.__get_file_path(node)
+                    if file_path is None:
+                        if len(nodes) == 1:
+                            nuke.message(f"This node can't {description}.")
                             return
-                        fields["version"] = fields["version"] - 1
-                        new_file_path = template.apply_fields(fields).replace(
-                            os.sep, "/"
-                        )
-                        self.__set_file_path(node, new_file_path)
+                    elif file_path == "":
+                        if len(nodes) == 1:
+                            nuke.message("This node doesn't have a filepath entered.")
+                            return
+                    else:
+                        node_paths.append((node, file_path))
+
+                new_paths = edit(list(dict.fromkeys(path for _, path in node_paths)))
+                changes = [
+                    (node, new_paths[file_path])
+                    for node, file_path in node_paths
+                    if new_paths.get(file_path, file_path) != file_path
+                ]
+                self.__set_file_paths(action.capitalize(), changes)
+
+                left = len(node_paths) - len(changes)
+                if unchanged and left:
+                    if len(nodes) == 1:
+                        nuke.message(f"This node can't {description}: {unchanged}.")
                     else:
-                        self.logger.debug(
-                            f'Can\'t version down "{node.name()}", no versionable template defined'
+                        done = description.split(" ", 1)[-1]
+                        nuke.message(
+                            f"{len(changes)} node(s) {done}, {left} unchanged: "
+                            f"{unchanged}."
                         )
 
-        # If something went wrong, e.g. no node selected, let user know
+        # If something went wrong, let user know
         except Exception as error:
-            error = str(error)
-            if error == "no node selected":
-                nuke.message("Please select a node to version down.")
-            else:
-                nuke.message(str(error))
+            nuke.message(str(error))
 
-    def node_to_publish(self):
-        """Set the currently selected node's path from a work to a publish path"""
+    def __set_file_paths(self, action: str, changes: list):
+        """
+        Set the file paths of nodes in one undo step and check them
+
+        Args:
+            action (str): Name of the undo step
+            changes (list[tuple[nuke.Node, str]]): Node and new file path
+        """
+        if not changes:
+            return
+
+        undo = nuke.Undo()
+        undo.begin(action)
         try:
-            # Select current selected node
-            node = nuke.selectedNode()
+            for node, file_path in changes:
+                self.__set_file_path(node, file_path)
+        finally:
+            undo.end()
+
+        changed = [node for node, _ in changes]
+        self.logger.debug(f"{action}: changed {len(changed)} node(s)")
+        self.update_breakdown(changed)
+        self.check_nodes(changed)
+
+    def __version_paths(
+        self, file_paths: list, step: int, latest_versions: dict | None = None
+    ) -> dict:
+        """
+        Get the paths of other versions
 
-            # Get the file path if the node has one
-            file_path = self.__get_file_path(node)
-            if file_path is None:
-                nuke.message("This node can't be set to publish.")
-                return
-            if file_path == "":
-                nuke.message("This node doesn't have a filepath entered.")
-                return
+        Args:
+            file_paths (list[str]): File paths
+            step (int): Number of versions to step, or 0 for the latest version
+            latest_versions (dict | None): Version to use instead of stepping,
+                per file path
 
-            # If has template match
-            mappings = self.app.get_setting("work_publish_mappings")
-            if mappings:
-                for mapping in mappings:
-                    work_template_key = mapping.get("work")
-                    publish_template_key = mapping.get("publish")
-                    fields_map: dict = mapping.get("fields", {})
-
-                    work_template = self.tk.templates.get(work_template_key)
-                    publish_template = self.tk.templates.get(publish_template_key)
-
-                    fields = work_template.validate_and_get_fields(file_path)
-                    if fields:
-                        self.logger.debug(f'Switching "{node.name()}" to publish')
-                        for key, value in fields_map.items():
-                            fields[value] = fields.get(key)
-                        new_file_path = publish_template.apply_fields(fields).replace(
-                            os.sep, "/"
-                        )
-                        self.__set_file_path(node, new_file_path)
-                    else:
-                        self.logger.debug(
-                            f'Can\'t switch "{node.name()}" to publish, no mapping defined'
-                        )
+        Returns:
+            dict: New path per file path
+        """
+        templates = self.app.get_setting("versionable")
+        new_paths = {}
+        for file_path in file_paths:
+            for template_key in templates or []:
+                template = self.tk.templates.get(template_key)
+                self.metrics.count(f"validate.{template_key}")
+                fields = template.validate_and_get_fields(file_path)
+                if not fields or not fields.get("version"):
+                    continue
+
+                version = (latest_versions or {}).get(file_path)
+                if not version:
+                    version = self.__next_version(template, fields, step)
+                if not version or version < 1:
+                    continue
+                fields["version"] = version
+                new_paths[file_path] = template.apply_fields(fields).replace(
+                    os.sep, "/"
+                )
 
-        # If something went wrong, e.g. no node selected, let user know
-        except Exception as error:
-            error = str(error)
-            if error == "no node selected":
-                nuke.message("Please select a node to switch to publish.")
-            else:
-                nuke.message(str(error))
+            if file_path not in new_paths:
+                self.logger.debug(f'Can\'t version "{file_path}"')
+        return new_paths
 
-    def node_to_work(self):
-        """Set the currently selected node's path from a publish to a work path"""
-        try:
-            # Select current selected node
-            node = nuke.selectedNode()
+    def __next_version(self, template, fields: dict, step: int) -> int | None:
+        """
+        Get the version to step to, preferring versions which exist on disk
 
-            # Get the file path if the node has one
-            file_path = self.__get_file_path(node)
-            if file_path is None:
-                nuke.message("This node can't be set to publish.")
-                return
-            if file_path == "":
-                nuke.message("This node doesn't have a filepath entered.")
-                return
+        Args:
+            template (TemplatePath): Versionable template
+            fields (dict): Fields of the current path
+            step (int): Number of versions to step, or 0 for the latest version
 
-            # If has template match
-            mappings = self.app.get_setting("work_publish_mappings")
-            if mappings:
-                for mapping in mappings:
-                    work_template_key = mapping.get("work")
-                    publish_template_key = mapping.get("publish")
-                    fields_map: dict = mapping.get("fields", {})
-
-                    work_template = self.tk.templates.get(work_template_key)
-                    publish_template = self.tk.templates.get(publish_template_key)
-
-                    fields = publish_template.validate_and_get_fields(file_path)
-                    if fields:
-                        self.logger.debug(f'Switching "{node.name()}" to work')
-                        for key, value in fields_map.items():
-                            fields[key] = fields.get(value)
-                        new_file_path = work_template.apply_fields(fields).replace(
-                            os.sep, "/"
-                        )
-                        self.__set_file_path(node, new_file_path)
-                    else:
-                        self.logger.debug(
-                            f'Can\'t switch "{node.name()}" to publish, no mapping defined'
-                        )
+        Returns:
+            int | None: Version or None if there's nothing to step to
+        """
+        if self.versions_from_disk and self.version_index.versions(template, fields):
+            if step == 0:
+                return self.version_index.latest(template, fields)
+            return self.version_index.step(template, fields, step)
 
-        # If something went wrong, e.g. no node selected, let user know
-        except Exception as error:
-            error = str(error)
-            if error == "no node selected":
-                nuke.message("Please select a node to switch to work.")
-            else:
-                nuke.message(str(error))
+        # Nothing on disk to go by
+        return fields["version"] + (step or 1)
 
-    @staticmethod
-    def is_read_node(node: nuke.Node) -> bool:
+    def __max_version_paths(self, file_paths: list) -> dict:
+        """
+        Get the paths of the latest published versions, or the latest versions
+        on disk for paths without a published file
+
+        Args:
+            file_paths (list[str]): File paths
+
+        Returns:
+            dict: New path per file path
+        """
+        latest_versions = {}
+        if self.breakdown_manager:
+            self.classifier.add_paths(dict.fromkeys(file_paths, (None, None)))
+            items = {
+                file_path: self.classifier.item(file_path) for file_path in file_paths
+            }
+
+            # One grouped query for all paths
+            latest_resolver = self.classifier.latest_resolver
+            latest_resolver.resolve(
+                [item for item in items.values() if item], refresh=True
+            )
+            for file_path, item in items.items():
+                if item:
+                    latest_versions[file_path] = latest_resolver.latest(item).get(
+                        "version_number"
+                    )
+
+        return self.__version_paths(file_paths, 0, latest_versions)
+
+    def is_read_node(self, node: nuke.Node) -> bool:
         """
         Check if the node is a read node
         Args:
             node (nuke.Node): Nuke node
 
         Returns:
-            str: File path
+            bool: If the node has a file knob
         """
-        if "Write" in node.Class() or "Group" in node.Class():
-            return False
-
-        if (
-            "Read" in node.Class()
-            or "Camera" in node.Class()
-            or "Vectorfield" in node.Class()
-        ):
-            file_key = "file"
-            if "Camera4" in node.Class():
-                file_key = "file"
-            elif "Camera" in node.Class():
-                file_key = "file_link"
-            elif "Vectorfield" in node.Class():
-                file_key = "vfield_file"
-
-            if node.knob(file_key) is None:
-                return False
+        return self.file_knobs.knob_name(node) is not None
 
-            return True
+    def is_file_knob(self, node: nuke.Node, knob: nuke.Knob) -> bool:
+        """
+        Check if a knob is the file knob of its node
 
-        for knob in node.knobs():
-            if "file" in knob and isinstance(node[knob].value(), str):
-                return True
+        Args:
+            node (nuke.Node): Nuke node
+            knob (nuke.Knob): Knob of the node
 
-        return False
+        Returns:
+            bool: If the status of the node depends on the knob
+        """
+        knob_name = self.file_knobs.knob_name(node)
+        return knob_name is not None and knob.name() == knob_name
 
-    @staticmethod
-    def __get_file_path(node: nuke.Node) -> str | None:
+    def __get_file_path(self, node: nuke.Node) -> str | None:
         """
         Get the file path of a node
         Args:
@@ -381,32 +1195,11 @@ class ReadStatus:
         Returns:
             str: File path
         """
-        if "Write" in node.Class() or "Group" in node.Class():
+        knob = self.file_knobs.knob(node)
+        if knob is None:
             return None
 
-        if (
-            "Read" in node.Class()
-            or "Camera" in node.Class()
-            or "Vectorfield" in node.Class()
-        ):
-            file_key = "file"
-            if "Camera4" in node.Class():
-                file_key = "file"
-            elif "Camera" in node.Class():
-                file_key = "file_link"
-            elif "Vectorfield" in node.Class():
-                file_key = "vfield_file"
-
-            if node.knob(file_key) is None:
-                return None
-
-            return node[file_key].value()
-
-        for knob in node.knobs():
-            if "file" in knob and isinstance(node[knob].value(), str):
-                return node[knob].value()
-
-        return None
+        return knob.value()
 
     def __set_file_path(self, node: nuke.Node, file_path: str):
         """
@@ -416,33 +1209,11 @@ class ReadStatus:
             node (nuke.Node): Nuke node
             file_path (str): File path
         """
-        if "Write" in node.Class():
-            return
-
-        if (
-            "Read" in node.Class()
-            or "Camera" in node.Class()
-            or "Vectorfield" in node.Class()
-        ):
-            file_key = "file"
-            if "Camera4" in node.Class():
-                file_key = "file"
-            elif "Camera" in node.Class():
-                file_key = "file_link"
-            elif "Vectorfield" in node.Class():
-                file_key = "vfield_file"
-
-            if node.knob(file_key) is None:
-                return None
-
-            node[file_key].setValue(file_path)
-            self.__check_node(node, file_path)
+        knob = self.file_knobs.knob(node)
+        if knob is None:
             return
 
-        for knob in node.knobs():
-            if "file" in knob and isinstance(node[knob].value(), str):
-                node[knob].setValue(file_path)
-                self.__check_node(node, file_path)
+        knob.setValue(file_path)
 
     def __check_node(self, node: nuke.Node, file_path: str):
         """
@@ -452,61 +1223,61 @@ class ReadStatus:
             node (nuke.Node): Read node
             file_path (str): File path to check
         """
-        found_match = False
-        for status in self.statuses:
-            # If has string match
-            if status.str_include:
-                for str_include in status.str_include:
-                    if str_include.replace(os.sep, "/") in file_path.replace(
-                        os.sep, "/"
-                    ):
-                        found_match = True
-
-            # If has template match
-            if status.template_match:
-                for template_key in status.template_match:
-                    template = self.tk.templates.get(template_key)
-                    if template.validate(file_path):
-                        if status.latest:
-                            if self.breakdown_manager and self.breakdown_items:
-                                item = next(
-                                    (
-                                        item
-                                        for item in self.breakdown_items
-                                        if item.path.replace(os.sep, "/") == file_path
-                                    ),
-                                    None,
-                                )
-                                if item:
-                                    fields = template.get_fields(file_path)
-                                    latest_publish = self.breakdown_manager.get_latest_published_file(
-                                        item
-                                    )
-                                    found_match = fields.get(
-                                        "version", -1
-                                    ) == latest_publish.get("version_number", -1)
-                        else:
-                            found_match = True
-
-            if found_match:
-                self.logger.debug(f"Applying {status.icon.name} icon to {node.name()}")
-                node.setCustomIcon(
-                    self.get_icon_path(status.icon),
-                    status.icon.scale,
-                    status.icon.offset_x,
-                    status.icon.offset_y,
-                )
-                return
+        with self.metrics.time("node.classify"):
+            classification = self.classifier.classify(
+                file_path, self.__frame_range(node)
+            )
+        self.node_statuses.update(node.fullName(), node.Class(), classification)
+        self.__apply_icon(node, classification.icon)
+        self.__record_checked(node.fullName(), file_path, classification)
+
+    def __record_checked(
+        self, node_name: str, file_path: str, classification: Classification
+    ):
+        """Remember the path a node was checked with, unless files were missing"""
+        if classification.disk is None:
+            self.fingerprint.record(node_name, file_path)
+        else:
+            # Missing files and frames may show up without the path changing
+            self.fingerprint.forget(node_name)
+
+    def __apply_icon(self, node: nuke.Node, icon: Icon | None):
+        """
+        Apply an icon to a node
 
-        if not found_match:
-            if self.question_on_missing:
-                self.logger.debug(f"Applying missing icon to {node.name()}")
+        Args:
+            node (nuke.Node): Nuke node
+            icon (Icon | None): Icon to apply or None to clear the icon
+        """
+        if not self.ui or not self.icon_tracker.update(node.fullName(), icon):
+            return
+
+        with self.metrics.time("node.icon"):
+            if icon:
+                self.logger.debug(f"Applying {icon.name} icon to {node.name()}")
                 node.setCustomIcon(
-                    self.get_icon_path(self.missing_icon),
-                    self.missing_icon.scale,
-                    self.missing_icon.offset_x,
-                    self.missing_icon.offset_y,
+                    self.get_icon_path(icon),
+                    icon.scale,
+                    icon.offset_x,
+                    icon.offset_y,
                 )
             else:
                 self.logger.debug(f"Clearing icon for {node.name()}")
                 node.clearCustomIcon()
+
+    @staticmethod
+    def __frame_range(node: nuke.Node) -> tuple[int, int] | None:
+        """
+        Get the frame range a node reads
+
+        Args:
+            node (nuke.Node): Nuke node
+
+        Returns:
+            tuple[int, int] | None: First and last frame if the node has them
+        """
+        first = node.knob("first")
+        last = node.knob("last")
+        if first is None or last is None:
+            return None
+        return int(first.value()), int(last.value())
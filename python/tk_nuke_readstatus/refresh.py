@@ -0,0 +1,283 @@
+# MIT License
+
+# Copyright (c) 2025 MaximumFX
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Callable
+
+import nuke
+from sgtk.platform.qt import QtCore
+
+
+class BackgroundRefresh:
+    """Resolve node statuses in worker threads and apply them on the main thread"""
+
+    def __init__(
+        self,
+        resolve: Callable[[list], list],
+        apply: Callable[[list], None],
+        logger,
+        workers: int = 4,
+        batch_size: int = 100,
+    ):
+        """
+        Args:
+            resolve (Callable): Turns the (node name, file path) pairs of a
+                snapshot into results, called on a worker thread
+            apply (Callable): Applies a list of results, called on the main thread
+            logger: Logger
+            workers (int): Number of worker threads, a cancelled refresh may
+                still be finishing its lookups while the next one runs
+            batch_size (int): Number of results applied per main thread call
+        """
+        self._resolve = resolve
+        self._apply = apply
+        self.logger = logger
+        self.workers = workers
+        self.batch_size = batch_size
+
+        self._executor = None
+        self._futures = set()
+        self._generation = 0
+        self._cancelled = threading.Event()
+
+    def start(self, pairs: list[tuple[str, str]]):
+        """
+        Cancel any running refresh and start resolving the given nodes
+
+        The whole snapshot is resolved at once, so its published files and
+        latest versions are looked up in as few queries as possible, only
+        applying the results is split into batches.
+
+        Args:
+            pairs (list[tuple[str, str]]): Node name and file path snapshot
+        """
+        self.cancel()
+        self._generation += 1
+        self._cancelled = threading.Event()
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="tk-nuke-readstatus"
+            )
+
+        self.logger.debug(f"Refreshing {len(pairs)} node(s) in the background")
+        self._futures = {future for future in self._futures if not future.done()}
+        if pairs:
+            self._futures.add(
+                self._executor.submit(
+                    self.__run, self._generation, self._cancelled, pairs
+                )
+            )
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """
+        Wait until the refreshes started so far are resolved, their results may
+        still be waiting for the main thread
+
+        Args:
+            timeout (float | None): Seconds to wait at most
+
+        Returns:
+            bool: If all refreshes were resolved
+        """
+        _, self._futures = wait(self._futures, timeout)
+        return not self._futures
+
+    def cancel(self):
+        """Drop the results of the running refresh"""
+        self._cancelled.set()
+
+    def shutdown(self):
+        """Cancel the running refresh and stop the worker threads"""
+        self.cancel()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+            self._futures = set()
+
+    def __run(self, generation: int, cancelled: threading.Event, pairs: list):
+        if cancelled.is_set():
+            return
+
+        try:
+            results = self._resolve(pairs)
+        except Exception:
+            self.logger.exception("Failed to resolve node statuses")
+            return
+
+        # Every batch is its own main thread call, so Nuke gets a turn in between
+        for start in range(0, len(results), self.batch_size):
+            if cancelled.is_set():
+                return
+            nuke.executeInMainThread(
+                self.__apply,
+                args=(generation, results[start : start + self.batch_size]),
+            )
+
+    def __apply(self, generation: int, results: list):
+        if generation != self._generation or self._cancelled.is_set():
+            return
+        self._apply(results)
+
+
+class SlicedRefresh:
+    """
+    Check nodes on the main thread in slices, letting Nuke redraw and handle
+    input in between, with a progress bar which can cancel the check
+
+    The lookups the checks need can be prepared on a worker thread first, so
+    the slices don't wait for ShotGrid.
+    """
+
+    # Milliseconds between looks at the preparation
+    PREPARE_POLL = 20
+
+    def __init__(
+        self,
+        check: Callable[[list], None],
+        logger,
+        batch_size: int = 200,
+        budget: int = 50,
+        title: str = "Checking read nodes",
+    ):
+        """
+        Args:
+            check (Callable): Checks a batch of nodes, called on the main thread
+            logger: Logger
+            batch_size (int): Number of nodes per batch
+            budget (int): Milliseconds a slice may take before Nuke gets a turn,
+                every slice checks at least one batch
+            title (str): Title of the progress bar
+        """
+        self._check = check
+        self.logger = logger
+        self.batch_size = max(1, batch_size)
+        self.budget = budget
+        self.title = title
+
+        self._nodes = []
+        self._position = 0
+        self._progress = None
+        self._prepared = None
+
+        self._timer = QtCore.QTimer()
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self.__slice)
+
+    @property
+    def active(self) -> bool:
+        return self._progress is not None
+
+    def start(self, nodes: list, prepare: Callable[[], None] | None = None):
+        """
+        Stop any running check and start checking the given nodes
+
+        Args:
+            nodes (list[nuke.Node]): Nuke nodes
+            prepare (Callable | None): Called on a worker thread before the
+                first slice, e.g. to look up the published files
+        """
+        self.__finish()
+        self._nodes = list(nodes)
+        self._position = 0
+        if not self._nodes:
+            return
+
+        self.logger.debug(f"Checking {len(self._nodes)} node(s) in slices")
+        self._progress = nuke.ProgressTask(self.title)
+        if prepare is not None:
+            self._prepared = threading.Event()
+            self._progress.setMessage("Looking up published files")
+            threading.Thread(
+                target=self.__prepare,
+                args=(prepare, self._prepared),
+                name="tk-nuke-readstatus-prepare",
+                daemon=True,
+            ).start()
+        self._timer.start(0)
+
+    def __prepare(self, prepare: Callable[[], None], prepared: threading.Event):
+        try:
+            prepare()
+        except Exception:
+            # The slices look up what's missing themselves
+            self.logger.exception("Failed to prepare the sliced refresh")
+        finally:
+            prepared.set()
+
+    def cancel(self):
+        """
+        Stop checking, the icons of the checked nodes are kept and the next
+        refresh checks the others, as they weren't recorded as checked
+        """
+        if not self.active:
+            return
+
+        self.logger.debug(
+            f"Check cancelled after {self._position} of {len(self._nodes)} node(s)"
+        )
+        self.__finish()
+
+    def __finish(self):
+        self._timer.stop()
+        self._nodes = []
+        self._prepared = None
+        # Releasing the task closes the progress bar
+        self._progress = None
+
+    def __slice(self):
+        if self._prepared is not None and not self._prepared.is_set():
+            if self._progress.isCancelled():
+                self.cancel()
+            else:
+                self._timer.start(self.PREPARE_POLL)
+            return
+
+        deadline = time.perf_counter() + self.budget / 1000
+        total = len(self._nodes)
+        while self._position < total:
+            if self._progress.isCancelled():
+                self.cancel()
+                return
+
+            batch = self._nodes[self._position : self._position + self.batch_size]
+            try:
+                self._check(batch)
+            except Exception:
+                self.logger.exception("Failed to check nodes")
+                self.cancel()
+                return
+            self._position += len(batch)
+            if time.perf_counter() >= deadline:
+                break
+
+        if self._position >= total:
+            self.__finish()
+            return
+
+        self._progress.setProgress(int(100 * self._position / total))
+        self._progress.setMessage(f"{self._position} of {total} nodes")
+        self._timer.start(0)
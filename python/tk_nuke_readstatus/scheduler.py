@@ -0,0 +1,88 @@
+# MIT License
+
+# Copyright (c) 2025 MaximumFX
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from __future__ import annotations
+
+from typing import Callable
+
+from sgtk.platform.qt import QtCore
+
+
+class CoalescingScheduler:
+    """Collect nodes over a short window and hand them over in one batch"""
+
+    def __init__(
+        self, callback: Callable[[list], None], window: int, debounce: bool = False
+    ):
+        """
+        Args:
+            callback (Callable): Called with the list of collected nodes
+            window (int): Time to wait for more nodes in milliseconds
+            debounce (bool): Restart the window on every queued node, so a
+                burst of changes is handed over once it has settled
+        """
+        self._callback = callback
+        self._pending = {}
+        self.debounce = debounce
+
+        self._timer = QtCore.QTimer()
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(window)
+        self._timer.timeout.connect(self.flush)
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def add(self, node):
+        """
+        Queue a node, the window starts at the first queued node unless
+        debouncing
+
+        Nodes are queued by name, Nuke hands out a new Python object for the
+        same node on every callback.
+
+        Args:
+            node (nuke.Node): Nuke node
+        """
+        try:
+            node_name = node.fullName()
+        except ValueError:
+            # The node was deleted in the meantime
+            return
+        self._pending[node_name] = node
+        if self.debounce or not self._timer.isActive():
+            self._timer.start()
+
+    def flush(self):
+        """Hand all queued nodes to the callback"""
+        self._timer.stop()
+        if not self._pending:
+            return
+
+        nodes = list(self._pending.values())
+        self._pending.clear()
+        self._callback(nodes)
+
+    def cancel(self):
+        """Drop all queued nodes"""
+        self._timer.stop()
+        self._pending.clear()
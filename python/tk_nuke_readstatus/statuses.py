@@ -0,0 +1,116 @@
+# MIT License
+
+# Copyright (c) 2025 MaximumFX
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from __future__ import annotations
+
+from typing import Callable, Iterator
+
+from .classify import Classification
+
+
+class NodeStatus:
+    """Last classification of a file node"""
+
+    __slots__ = ("node_name", "node_class", "classification")
+
+    def __init__(
+        self, node_name: str, node_class: str, classification: Classification
+    ):
+        """
+        Args:
+            node_name (str): Full node name
+            node_class (str): Node class
+            classification (Classification): Status of the node's file path
+        """
+        self.node_name = node_name
+        self.node_class = node_class
+        self.classification = classification
+
+
+class NodeStatusIndex:
+    """
+    Statuses of all checked file nodes, kept up to date as nodes are checked
+
+    Listeners are called with the name of every added, changed or removed
+    node, or None when the index was cleared.
+    """
+
+    def __init__(self):
+        self._statuses = {}
+        self._listeners = []
+
+    def __len__(self) -> int:
+        return len(self._statuses)
+
+    def __iter__(self) -> Iterator[NodeStatus]:
+        return iter(list(self._statuses.values()))
+
+    def get(self, node_name: str) -> NodeStatus | None:
+        return self._statuses.get(node_name)
+
+    def add_listener(self, listener: Callable[[str | None], None]):
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[str | None], None]):
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def update(self, node_name: str, node_class: str, classification: Classification):
+        """
+        Record the status of a node
+
+        Args:
+            node_name (str): Full node name
+            node_class (str): Node class
+            classification (Classification): Status of the node's file path
+        """
+        self._statuses[node_name] = NodeStatus(node_name, node_class, classification)
+        self.__notify(node_name)
+
+    def forget(self, node_name: str):
+        """
+        Remove a node, e.g. when it was deleted
+
+        Args:
+            node_name (str): Full node name
+        """
+        if self._statuses.pop(node_name, None) is not None:
+            self.__notify(node_name)
+
+    def retain(self, node_names: set):
+        """
+        Remove all nodes except the given ones, e.g. after checking the script
+
+        Args:
+            node_names (set[str]): Full names of the nodes to keep
+        """
+        for node_name in [name for name in self._statuses if name not in node_names]:
+            self.forget(node_name)
+
+    def clear(self):
+        """Remove all nodes"""
+        self._statuses.clear()
+        self.__notify(None)
+
+    def __notify(self, node_name: str | None):
+        for listener in list(self._listeners):
+            listener(node_name)
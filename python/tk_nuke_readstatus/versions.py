@@ -0,0 +1,175 @@
+# MIT License
+
+# Copyright (c) 2025 MaximumFX
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from __future__ import annotations
+
+import re
+import threading
+from collections import OrderedDict
+
+from .disk import FRAME_TOKEN, MISSING, DirectoryCache
+from .index import normalize_path
+
+# Version number which can't be confused with anything else in a path
+_SENTINEL = 987654321
+
+
+def _component_pattern(component: str) -> re.Pattern:
+    """Turn a path component with the sentinel version into a pattern"""
+    pattern = ""
+    for index, part in enumerate(component.split(str(_SENTINEL))):
+        if index == 1:
+            pattern += r"(?P<version>\d+)"
+        elif index > 1:
+            pattern += r"(?P=version)"
+
+        position = 0
+        for token in FRAME_TOKEN.finditer(part):
+            pattern += re.escape(part[position : token.start()]) + r"-?\d+"
+            position = token.end()
+        pattern += re.escape(part[position:])
+    return re.compile(pattern)
+
+
+class VersionIndex:
+    """Versions of a template path which exist on disk"""
+
+    def __init__(self, directory_cache: DirectoryCache, size: int = 1024):
+        """
+        Args:
+            directory_cache (DirectoryCache): Shared directory listings
+            size (int): Maximum number of version families to remember
+        """
+        self.directory_cache = directory_cache
+        self.size = size
+        self._families = OrderedDict()
+        self._lock = threading.Lock()
+
+    def versions(self, template, fields: dict) -> list[int] | None:
+        """
+        Get the versions of a version family found on disk
+
+        Args:
+            template (TemplatePath): Template with a version key
+            fields (dict): Template fields, the version is ignored
+
+        Returns:
+            list[int] | None: Sorted versions, or None if the directory holding
+                the versions doesn't exist
+        """
+        family = self.__family(template, fields)
+        if family is None:
+            return None
+
+        parent, component = family
+        names = self.directory_cache.listing(parent)
+        if names is None:
+            return None
+
+        key = (parent, component)
+        with self._lock:
+            cached = self._families.get(key)
+            if cached is not None and cached[0] is names:
+                self._families.move_to_end(key)
+                return cached[1]
+
+        pattern = _component_pattern(component)
+        versions = sorted(
+            {
+                int(match.group("version"))
+                for match in map(pattern.fullmatch, names)
+                if match
+            }
+        )
+        with self._lock:
+            self._families[key] = (names, versions)
+            if len(self._families) > self.size:
+                self._families.popitem(last=False)
+        return versions
+
+    def step(self, template, fields: dict, step: int) -> int | None:
+        """
+        Get the nearest version on disk in a direction
+
+        Args:
+            template (TemplatePath): Template with a version key
+            fields (dict): Template fields including the current version
+            step (int): Positive to look for higher versions, negative for lower
+
+        Returns:
+            int | None: Version or None if no such version exists on disk
+        """
+        versions = self.versions(template, fields) or []
+        current = fields["version"]
+        if step > 0:
+            candidates = [version for version in versions if version > current]
+        else:
+            candidates = [
+                version for version in reversed(versions) if version < current
+            ]
+
+        for version in candidates[abs(step) - 1 :]:
+            if self.exists(template, dict(fields, version=version)):
+                return version
+        return None
+
+    def latest(self, template, fields: dict) -> int | None:
+        """
+        Get the highest version on disk
+
+        Args:
+            template (TemplatePath): Template with a version key
+            fields (dict): Template fields
+
+        Returns:
+            int | None: Version or None if no version exists on disk
+        """
+        for version in reversed(self.versions(template, fields) or []):
+            if self.exists(template, dict(fields, version=version)):
+                return version
+        return None
+
+    def exists(self, template, fields: dict) -> bool:
+        """
+        Check if the path of a version is on disk
+
+        Args:
+            template (TemplatePath): Template
+            fields (dict): Template fields
+
+        Returns:
+            bool: If the file or any frame of the sequence exists
+        """
+        file_path = normalize_path(template.apply_fields(fields))
+        return self.directory_cache.check(file_path) != MISSING
+
+    @staticmethod
+    def __family(template, fields: dict) -> tuple[str, str] | None:
+        """Get the directory and path component in which the version changes"""
+        file_path = normalize_path(
+            template.apply_fields(dict(fields, version=_SENTINEL))
+        )
+        components = file_path.split("/")
+        for index, component in enumerate(components):
+            if str(_SENTINEL) in component:
+                return "/".join(components[:index]) or "/", component
+        return None
@@ -0,0 +1,145 @@
+# MIT License
+
+# Copyright (c) 2025 MaximumFX
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests for resolving the latest published files of many paths at once"""
+
+from __future__ import annotations
+
+import logging
+
+import pytest
+from fake_shotgun import FakeShotgun
+
+from tk_nuke_readstatus.index import BreakdownIndex, SceneItem
+from tk_nuke_readstatus.latest import LatestResolver
+from tk_nuke_readstatus.lookup import ShotgunLookup
+
+logger = logging.getLogger("tk-nuke-readstatus.tests")
+
+
+def publish(publish_id: int, shot: int, name: str, version: int) -> dict:
+    return {
+        "type": "PublishedFile",
+        "id": publish_id,
+        "name": name,
+        "path": {"local_path": f"/proj/sh{shot:03d}/{name}.v{version:03d}.exr"},
+        "version_number": version,
+        "project": {"type": "Project", "id": 1},
+        "entity": {"type": "Shot", "id": shot},
+        "task": {"type": "Task", "id": shot},
+        "published_file_type": {"type": "PublishedFileType", "id": 1},
+    }
+
+
+def records(shotgun: FakeShotgun, groups: int, versions: int = 1) -> list:
+    """
+    Publish versions of groups and index a path per version
+
+    Returns:
+        list[PublishRecord]: Records of the indexed paths
+    """
+    index = BreakdownIndex()
+    items = []
+    for group in range(groups):
+        for version in range(1, versions + 1):
+            sg_data = publish(len(items) + 1, group + 1, "comp", version)
+            shotgun.add("PublishedFile", sg_data)
+            items.append(SceneItem(sg_data["path"]["local_path"], sg_data, "", ""))
+    index.add(items)
+    return [index.get(item.path) for item in items]
+
+
+def resolver(shotgun: FakeShotgun, group_size: int = 50) -> LatestResolver:
+    lookup = ShotgunLookup(lambda: shotgun, logger)
+    return LatestResolver(lookup, logger, group_size=group_size)
+
+
+@pytest.mark.parametrize(
+    "groups, versions, group_size, queries",
+    [(1, 10, 50, 1), (20, 5, 50, 1), (120, 3, 50, 3), (7, 2, 3, 3)],
+)
+def test_query_count(groups, versions, group_size, queries):
+    shotgun = FakeShotgun()
+    items = records(shotgun, groups, versions)
+    latest = resolver(shotgun, group_size)
+
+    found = latest.resolve(items)
+
+    assert len(items) == groups * versions
+    assert len(found) == groups
+    assert latest.query_count == queries
+    assert shotgun.find_count == queries
+
+
+def test_resolved_groups_are_not_queried_again():
+    shotgun = FakeShotgun()
+    items = records(shotgun, 10)
+    latest = resolver(shotgun)
+
+    latest.resolve(items)
+    latest.resolve(items)
+
+    assert latest.query_count == 1
+    assert shotgun.find_count == 1
+
+
+@pytest.mark.parametrize("group_size", [1, 4, 5, 50])
+def test_query_chunks_at_group_size(group_size):
+    shotgun = FakeShotgun()
+    items = records(shotgun, 5 * group_size + 1)
+    latest = resolver(shotgun, group_size)
+
+    latest.resolve(items)
+
+    # The queries run at the same time, in any order
+    sizes = sorted(len(filters) for _, filters in shotgun.queries)
+    assert sizes == [1] + [group_size] * 5
+
+
+def test_highest_version_wins():
+    shotgun = FakeShotgun()
+    items = records(shotgun, 3, versions=4)
+    # Published out of order, the query doesn't sort the versions
+    shotgun.add("PublishedFile", publish(100, 2, "comp", 9))
+    shotgun.add("PublishedFile", publish(101, 2, "comp", 6))
+    latest = resolver(shotgun)
+
+    latest.resolve(items)
+
+    versions = {item.path: latest.latest(item)["version_number"] for item in items}
+    assert sorted(set(versions.values())) == [4, 9]
+    assert latest.latest(items[4])["id"] == 100
+
+
+def test_group_without_result_is_none():
+    shotgun = FakeShotgun()
+    items = records(shotgun, 3)
+    del shotgun.records["PublishedFile"][1]
+    latest = resolver(shotgun)
+
+    found = latest.resolve(items)
+
+    assert found[items[1].key] is None
+    assert latest.latest(items[1]) == {}
+    assert latest.is_resolved(items[1])
+    assert found[items[0].key]["id"] == 1
+    assert latest.query_count == 1
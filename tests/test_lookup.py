@@ -0,0 +1,155 @@
+# MIT License
+
+# Copyright (c) 2025 MaximumFX
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests for sharing and retrying ShotGrid finds on the connection pool"""
+
+from __future__ import annotations
+
+import logging
+import time
+from xmlrpc.client import ProtocolError
+
+import pytest
+from fake_shotgun import FakeShotgun
+
+from tk_nuke_readstatus.lookup import ShotgunLookup
+
+logger = logging.getLogger("tk-nuke-readstatus.tests")
+
+FILTERS = [["entity", "is", {"type": "Shot", "id": 1}]]
+
+
+class RefusingPool:
+    """Pool which is shutting down, like ThreadPoolExecutor after shutdown"""
+
+    def __init__(self):
+        self.args = None
+
+    def submit(self, call, *args):
+        self.args = args
+        raise RuntimeError("cannot schedule new futures after shutdown")
+
+    def shutdown(self, wait=True):
+        pass
+
+
+def lookup(shotgun: FakeShotgun, **kwargs) -> ShotgunLookup:
+    return ShotgunLookup(lambda: shotgun, logger, **kwargs)
+
+
+def test_identical_requests_in_flight_are_merged():
+    shotgun = FakeShotgun(latency=0.2)
+    record = {"type": "PublishedFile", "id": 1, "entity": {"type": "Shot", "id": 1}}
+    shotgun.add("PublishedFile", record)
+    pool = lookup(shotgun)
+
+    futures = [pool.submit("PublishedFile", FILTERS) for _ in range(5)]
+    other = pool.submit("PublishedFile", [])
+
+    assert len({id(future) for future in futures}) == 1
+    assert futures[0].result() == other.result() == [record]
+    assert pool.merged_count == 4
+    assert pool.query_count == 2
+    assert shotgun.find_count == 2
+
+
+def test_finished_requests_are_sent_again():
+    shotgun = FakeShotgun(latency=0.01)
+    pool = lookup(shotgun)
+
+    pool.find("PublishedFile", FILTERS)
+    pool.find("PublishedFile", FILTERS)
+
+    assert pool.merged_count == 0
+    assert shotgun.find_count == 2
+
+
+def test_retry_after_is_honoured():
+    shotgun = FakeShotgun(latency=0.01)
+    shotgun.throttle(2, retry_after=0.2)
+    # Without the header the retries wouldn't wait at all
+    pool = lookup(shotgun, backoff=0.0)
+
+    start = time.perf_counter()
+    assert pool.find("PublishedFile", FILTERS) == []
+
+    assert time.perf_counter() - start >= 0.4
+    assert pool.retry_count == 2
+    assert shotgun.throttled_count == 2
+    assert shotgun.find_count == 3
+    assert pool.query_count == 1
+
+
+def test_retry_after_is_capped_at_max_backoff():
+    shotgun = FakeShotgun()
+    shotgun.throttle(1, retry_after=60)
+    pool = lookup(shotgun, max_backoff=0.05)
+
+    start = time.perf_counter()
+    pool.find("PublishedFile", FILTERS)
+
+    assert time.perf_counter() - start < 5
+    assert pool.retry_count == 1
+
+
+def test_gives_up_after_retries():
+    shotgun = FakeShotgun(latency=0.01)
+    shotgun.throttle(10)
+    pool = lookup(shotgun, retries=2, backoff=0.0)
+
+    with pytest.raises(ProtocolError) as error:
+        pool.find("PublishedFile", FILTERS)
+
+    assert error.value.errcode == 429
+    assert pool.retry_count == 2
+    assert shotgun.find_count == 3
+    assert not pool._pending
+
+
+def test_other_errors_are_not_retried():
+    shotgun = FakeShotgun()
+    pool = lookup(shotgun)
+
+    with pytest.raises(AttributeError):
+        pool.find("PublishedFile", FILTERS, order="not a list")
+
+    assert pool.retry_count == 0
+    assert shotgun.find_count == 1
+
+
+def test_refused_request_is_not_left_pending():
+    shotgun = FakeShotgun()
+    pool = lookup(shotgun)
+    refusing = pool._executor = RefusingPool()
+
+    with pytest.raises(RuntimeError) as error:
+        pool.submit("PublishedFile", FILTERS)
+
+    future = refusing.args[1]
+    assert future.exception() is error.value
+    assert not pool._pending
+
+    # Once the pool is gone the same request starts a new one
+    pool.shutdown()
+    assert pool.find("PublishedFile", FILTERS) == []
+    assert pool.merged_count == 0
+    assert shotgun.find_count == 1